@@ -0,0 +1,135 @@
+"""Query plans of the attendance filter, join and SLA paths with and without
+the partial indexes declared on the Attendance model.
+
+The data is generated inside a throwaway schema, so the real tables are
+never touched. Point SQLALCHEMY_DATABASE_URI at a Postgres you can load
+~10M rows into and run from the project root:
+
+    PYTHONPATH=. python benchmarks/bench_attendance_indexes.py --rows 10000000
+"""
+import argparse
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from src.infra.config.config import get_settings
+from src.domain.entities.attendance import Attendance
+from src.domain.entities.client import Client
+from src.domain.entities.green_angel import GreenAngel
+from src.domain.entities.hub import Hub
+from src.infra.database.database import Base
+
+SCHEMA = 'bench_attendance_indexes'
+
+# Mirrors the statements AttendanceRepository emits for each path
+QUERIES = {
+    'list by hub': """
+        SELECT * FROM attendances WHERE hub_id = 7 AND is_active ORDER BY id LIMIT 20
+    """,
+    'list by client': """
+        SELECT * FROM attendances WHERE client_id = 4242 AND is_active ORDER BY id LIMIT 20
+    """,
+    'keyset by limit_date': """
+        SELECT * FROM attendances WHERE is_active AND (limit_date, id) > ('2024-06-01', 0)
+        ORDER BY limit_date, id LIMIT 20
+    """,
+    'sla by green angel': """
+        SELECT green_angel_id, count(id), count(id) FILTER (WHERE attendance_date <= limit_date),
+               count(id) FILTER (WHERE attendance_date > limit_date), count(id) FILTER (WHERE attendance_date IS NULL)
+        FROM attendances WHERE is_active AND green_angel_id = 42 GROUP BY green_angel_id
+    """,
+    'sla by hub': """
+        SELECT hub_id, count(id), count(id) FILTER (WHERE attendance_date <= limit_date)
+        FROM attendances WHERE is_active AND hub_id = 7 GROUP BY hub_id
+    """,
+    'productivity one month': """
+        SELECT green_angel_id, count(id) FROM attendances
+        WHERE is_active AND attendance_date IS NOT NULL
+          AND attendance_date >= '2024-03-01' AND attendance_date < '2024-04-01'
+        GROUP BY green_angel_id
+    """,
+}
+
+
+def seed(conn, rows: int, angels: int, hubs: int):
+    clients = max(rows // 10, 1)
+    conn.execute(text("INSERT INTO green_angels (id, name, is_active) SELECT g, 'angel ' || g, true FROM generate_series(1, :n) g"), {'n': angels})
+    conn.execute(text("INSERT INTO hubs (id, name, is_active) SELECT g, 'hub ' || g, true FROM generate_series(1, :n) g"), {'n': hubs})
+    conn.execute(text("INSERT INTO clients (id, is_active) SELECT g, true FROM generate_series(1, :n) g"), {'n': clients})
+    conn.execute(text("""
+        INSERT INTO attendances (id, client_id, green_angel_id, hub_id, limit_date, attendance_date, is_active)
+        SELECT g, 1 + (g % :clients), 1 + floor(random() * :angels)::int, 1 + floor(random() * :hubs)::int,
+               limit_date,
+               CASE WHEN random() < 0.1 THEN NULL ELSE limit_date + (random() * 4 - 3) * interval '1 day' END,
+               random() > 0.05
+        FROM (
+            SELECT g, timestamp '2023-01-01' + random() * interval '730 days' AS limit_date
+            FROM generate_series(1, :rows) g
+        ) s
+    """), {'rows': rows, 'clients': clients, 'angels': angels, 'hubs': hubs})
+    conn.execute(text('VACUUM ANALYZE attendances'))
+
+
+def scan_nodes(plan: dict) -> list:
+    nodes = [plan['Node Type']] if 'Scan' in plan['Node Type'] else []
+    for child in plan.get('Plans', []):
+        nodes += scan_nodes(child)
+    return nodes
+
+
+def explain(conn) -> dict:
+    results = {}
+    for name, sql in QUERIES.items():
+        plan = conn.execute(text(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}')).scalar()[0]
+        results[name] = (', '.join(scan_nodes(plan['Plan'])), plan['Execution Time'])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--angels', type=int, default=500)
+    parser.add_argument('--hubs', type=int, default=30)
+    parser.add_argument('--keep', action='store_true', help='keep the benchmark schema afterwards')
+    args = parser.parse_args()
+
+    engine = create_engine(get_settings().SQLALCHEMY_DATABASE_URI, isolation_level='AUTOCOMMIT')
+    tables = [Client.__table__, GreenAngel.__table__, Hub.__table__, Attendance.__table__]
+    indexes = sorted(Attendance.__table__.indexes, key=lambda index: index.name)
+
+    with engine.connect() as conn:
+        conn = conn.execution_options(schema_translate_map={None: SCHEMA})
+        conn.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        conn.execute(text(f'CREATE SCHEMA {SCHEMA}'))
+        conn.execute(text(f'SET search_path TO {SCHEMA}'))
+        try:
+            Base.metadata.create_all(conn, tables=tables)
+            for index in indexes:
+                conn.execute(DropIndex(index))
+
+            start = time.perf_counter()
+            seed(conn, args.rows, args.angels, args.hubs)
+            print(f'Seeded {args.rows} attendances in {time.perf_counter() - start:.1f}s')
+
+            before = explain(conn)
+
+            start = time.perf_counter()
+            for index in indexes:
+                conn.execute(CreateIndex(index))
+            conn.execute(text('VACUUM ANALYZE attendances'))
+            print(f'Built {len(indexes)} indexes in {time.perf_counter() - start:.1f}s\n')
+
+            after = explain(conn)
+        finally:
+            if not args.keep:
+                conn.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+
+    print(f"{'query':<24} {'before':>12} {'after':>12}  plan change")
+    for name in QUERIES:
+        (before_plan, before_ms), (after_plan, after_ms) = before[name], after[name]
+        print(f'{name:<24} {before_ms:>10.1f}ms {after_ms:>10.1f}ms  {before_plan} -> {after_plan}')
+
+
+if __name__ == '__main__':
+    main()
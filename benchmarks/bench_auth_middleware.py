@@ -0,0 +1,52 @@
+"""Per-request overhead of auth_required with the verified-token cache on and
+off, against the same view without the decorator.
+
+Runs the decorated view inside a Flask request context, no server or
+database needed. SECRET_KEY and ALGORITHM come from the environment or .env:
+
+    PYTHONPATH=. python benchmarks/bench_auth_middleware.py --requests 100000
+"""
+import argparse
+import time
+
+from flask import Flask
+
+from src.interface.web.middleware import auth
+from src.interface.web.middleware.jwt_handler import JWTHandler
+from src.interface.web.middleware.token_cache import TokenCache
+
+
+def view():
+    return 'ok'
+
+
+def per_request(func, app: Flask, headers: dict, requests: int) -> float:
+    with app.test_request_context(headers=headers):
+        func()
+        start = time.perf_counter()
+        for _ in range(requests):
+            func()
+        return (time.perf_counter() - start) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=100_000)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    token = JWTHandler.create_access_token({'sub': 'admin@admin.com', 'id': 1})
+    headers = {'Authorization': f'Bearer {token}'}
+    protected = auth.auth_required(view)
+
+    baseline = per_request(view, app, headers, args.requests)
+    print(f"{'mode':<12}{'us/request':>12}{'overhead us':>14}{'hits':>10}{'misses':>10}")
+    for name, maxsize in [('no cache', 0), ('cache', 1024)]:
+        auth.token_cache = TokenCache(maxsize)
+        elapsed = per_request(protected, app, headers, args.requests)
+        stats = auth.token_cache.stats()
+        print(f"{name:<12}{elapsed:>12.2f}{elapsed - baseline:>14.2f}{stats['hits']:>10}{stats['misses']:>10}")
+
+
+if __name__ == '__main__':
+    main()
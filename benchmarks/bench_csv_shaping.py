@@ -0,0 +1,88 @@
+"""Per-chunk CPU time of the CSV importer's row shaping: the four iterrows
+passes it used to make against normalize_batch + to_copy_buffer.
+
+Writes a synthetic CSV in the seeder's format and shapes it chunk by
+chunk, with the dimension ids already resolved. No database needed:
+
+    PYTHONPATH=. python benchmarks/bench_csv_shaping.py --rows 100000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_date_normalisation import legacy_convert_date
+from src.infra.database.seeder.seed_from_csv import DimensionCache, normalize_batch, to_copy_buffer
+
+
+def write_csv(path: str, rows: int, angels: int, hubs: int):
+    rng = np.random.default_rng(42)
+    limit_date = pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 730 * 24 * 60, rows), unit='min')
+    attendance_date = pd.Series(limit_date + pd.to_timedelta(rng.integers(-3 * 24 * 60, 24 * 60, rows), unit='min'))
+    attendance_date[rng.random(rows) < 0.1] = pd.NaT
+
+    pd.DataFrame({
+        'id_atendimento': np.arange(1, rows + 1),
+        'id_cliente': rng.integers(1, rows // 10 + 2, rows),
+        'angel': [f'angel {i}' for i in rng.integers(1, angels + 1, rows)],
+        'polo': [f'hub {i}' for i in rng.integers(1, hubs + 1, rows)],
+        'data_limite': limit_date.strftime('%Y-%m-%d %H:%M:%S'),
+        'data_de_atendimento': attendance_date.dt.strftime('%Y-%m-%d %H:%M:%S'),
+    }).to_csv(path, sep=';', index=False)
+
+
+def legacy_shape(batch_df, cache):
+    batch_df['data_limite'] = batch_df['data_limite'].apply(legacy_convert_date)
+    batch_df['data_de_atendimento'] = batch_df['data_de_atendimento'].apply(legacy_convert_date)
+
+    green_angels_data = [(row['angel'], True, dt.utcnow(), dt.utcnow()) for index, row in batch_df.iterrows()]
+    hubs_data = [(row['polo'], True, dt.utcnow(), dt.utcnow()) for index, row in batch_df.iterrows()]
+    clients_data = [(row['id_cliente'], True, dt.utcnow(), dt.utcnow()) for index, row in batch_df.iterrows()]
+    attendances_data = [(row['id_atendimento'], row['id_cliente'], cache.green_angels.get(row['angel']),
+                         cache.hubs.get(row['polo']), row['data_limite'],
+                         row['data_de_atendimento'], True, dt.utcnow(), dt.utcnow()) for index, row in batch_df.iterrows()]
+    return green_angels_data, hubs_data, clients_data, attendances_data
+
+
+def columnar_shape(batch_df, cache):
+    batch_df, _ = normalize_batch(batch_df)
+    return to_copy_buffer(batch_df, cache)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--chunk', type=int, default=10_000)
+    parser.add_argument('--angels', type=int, default=500)
+    parser.add_argument('--hubs', type=int, default=30)
+    args = parser.parse_args()
+
+    cache = DimensionCache()
+    cache.green_angels.update((f'angel {i}', i) for i in range(1, args.angels + 1))
+    cache.hubs.update((f'hub {i}', i) for i in range(1, args.hubs + 1))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'data.csv')
+        write_csv(path, args.rows, args.angels, args.hubs)
+
+        results = {}
+        for name, shape in [('iterrows', legacy_shape), ('columnar', columnar_shape)]:
+            timings = []
+            for batch_df in pd.read_csv(path, delimiter=';', chunksize=args.chunk):
+                start = time.process_time()
+                shape(batch_df, cache)
+                timings.append(time.process_time() - start)
+            results[name] = timings
+
+    print(f"{'path':<10}{'chunks':>8}{'ms/chunk':>12}{'total s':>10}")
+    for name, timings in results.items():
+        print(f'{name:<10}{len(timings):>8}{1000 * np.mean(timings):>12.1f}{sum(timings):>10.2f}')
+    print(f"speed-up: {sum(results['iterrows']) / sum(results['columnar']):.1f}x")
+
+
+if __name__ == '__main__':
+    main()
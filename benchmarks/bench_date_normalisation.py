@@ -0,0 +1,81 @@
+"""Date normalisation throughput of the CSV importer: the per-cell
+convert_date it used to apply against the vectorized normalize_dates.
+
+Runs on a synthetic dirty column, no database needed:
+
+    PYTHONPATH=. python benchmarks/bench_date_normalisation.py --rows 1000000
+"""
+import argparse
+import time
+from datetime import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+from src.infra.database.seeder.seed_from_csv import normalize_dates
+
+# Share of each shape of value found in the nightly drops
+SHAPES = {
+    '%Y-%m-%d %H:%M:%S': 0.70,
+    '%d/%m/%Y %H:%M': 0.20,
+    '%Y-%m-%dT%H:%M': 0.04,
+    'blank': 0.05,
+    'dash': 0.01,
+}
+
+
+def legacy_convert_date(date_str):
+    if pd.isna(date_str) or date_str.strip() == '' or date_str.strip() == '-':
+        return None
+    try:
+        dt.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+        return date_str
+    except ValueError:
+        try:
+            return pd.to_datetime(date_str.strip(), format='%d/%m%Y %H:%M').strftime('%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            return pd.to_datetime(date_str.strip(), format='mixed', dayfirst=True).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def dirty_column(rows: int) -> pd.Series:
+    rng = np.random.default_rng(42)
+    stamps = pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 730 * 24 * 60, rows), unit='min')
+    shapes = rng.choice(list(SHAPES), size=rows, p=list(SHAPES.values()))
+
+    column = pd.Series('', index=range(rows), dtype=object)
+    for shape in SHAPES:
+        mask = shapes == shape
+        if shape == 'dash':
+            column[mask] = '-'
+        elif shape != 'blank':
+            column[mask] = stamps[mask].strftime(shape)
+    return column
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    column = dirty_column(args.rows)
+
+    start = time.perf_counter()
+    legacy = column.apply(legacy_convert_date)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parsed, rejected = normalize_dates(column)
+    vectorized_seconds = time.perf_counter() - start
+
+    # Both paths must agree before their timings mean anything
+    assert not rejected.any()
+    assert (pd.to_datetime(legacy).fillna(pd.NaT) == parsed).sum() == parsed.notna().sum()
+
+    print(f"{'path':<12}{'seconds':>10}{'rows/s':>14}")
+    for name, seconds in [('convert_date', legacy_seconds), ('vectorized', vectorized_seconds)]:
+        print(f'{name:<12}{seconds:>10.2f}{args.rows / seconds:>14.0f}')
+    print(f'speed-up: {legacy_seconds / vectorized_seconds:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
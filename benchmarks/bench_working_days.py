@@ -0,0 +1,67 @@
+"""Working-day counting for per-entity productivity ranges: the day-by-day
+is_working_day loop the productivity metric used to run, the prefix-sum
+count per pair, and one vectorized count_many over every pair.
+
+Draws one active range per entity inside a five-year window, no database
+needed:
+
+    PYTHONPATH=. python benchmarks/bench_working_days.py --entities 10000
+"""
+import argparse
+import time
+from datetime import date, timedelta
+
+import numpy as np
+from workalendar.america import Brazil
+
+from src.infra.repository.working_days import calendar_for
+
+
+def legacy_count(calendar, start: date, end: date) -> int:
+    return sum(1 for d in (start + timedelta(n) for n in range((end - start).days + 1)) if calendar.is_working_day(d))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entities', type=int, default=10_000)
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--state', default='SP')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    first = date(2020, 1, 1)
+    span = (date(first.year + args.years, 1, 1) - first).days
+    offsets = np.sort(rng.integers(0, span, (args.entities, 2)), axis=1)
+    starts = [first + timedelta(int(n)) for n in offsets[:, 0]]
+    ends = [first + timedelta(int(n)) for n in offsets[:, 1]]
+
+    calendar = calendar_for(args.state)
+    # Build the per-year tables and the busday calendar outside the timings
+    calendar.count(first, first + timedelta(span - 1))
+    calendar.count_many(starts[:1], ends[:1])
+
+    start = time.perf_counter()
+    legacy_calendar = Brazil()
+    legacy = [legacy_count(legacy_calendar, s, e) for s, e in zip(starts, ends)]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    prefix = [calendar.count(s, e) for s, e in zip(starts, ends)]
+    prefix_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = calendar.count_many(starts, ends)
+    vectorized_seconds = time.perf_counter() - start
+
+    # The legacy loop only knows national holidays, so compare it on the national calendar
+    assert legacy == calendar_for().count_many(starts, ends).tolist()
+    assert prefix == vectorized.tolist()
+
+    print(f"{'path':<16}{'seconds':>10}{'pairs/s':>14}")
+    for name, seconds in [('day loop', legacy_seconds), ('prefix sums', prefix_seconds), ('busday_count', vectorized_seconds)]:
+        print(f'{name:<16}{seconds:>10.4f}{args.entities / seconds:>14.0f}')
+    print(f'speed-up: {legacy_seconds / vectorized_seconds:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
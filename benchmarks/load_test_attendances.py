@@ -0,0 +1,94 @@
+"""Requests per second on GET /api/v1/attendances, to compare the flask dev
+server with the gunicorn production server on the same database.
+
+Start each server on its own port, then point the script at both:
+
+    flask run --port=5000
+    gunicorn -c src/infra/config/gunicorn_config.py --bind 0.0.0.0:5001 src.main:app
+
+    PYTHONPATH=. python benchmarks/load_test_attendances.py \\
+        --target dev=http://localhost:5000 --target gunicorn=http://localhost:5001
+
+Logs in with the default seeded user unless --email/--password are given.
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+PATH = '/api/v1/attendances?per_page=20'
+
+
+def login(base_url: str, email: str, password: str) -> str:
+    request = urllib.request.Request(
+        f'{base_url}/api/v1/auth',
+        data=json.dumps({'email': email, 'password': password}).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.load(response)['access_token']
+
+
+def run(base_url: str, token: str, concurrency: int, seconds: float, path: str = PATH) -> dict:
+    request = urllib.request.Request(f'{base_url}{path}', headers={'Authorization': f'Bearer {token}'})
+    deadline = time.perf_counter() + seconds
+    latencies, errors = [], 0
+    lock = threading.Lock()
+
+    def client():
+        nonlocal errors
+        local, failed = [], 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    response.read()
+                local.append(time.perf_counter() - start)
+            except OSError:
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors += failed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(client)
+    elapsed = time.perf_counter() - started
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed,
+        'p50': np.percentile(latencies, 50) if len(latencies) else 0,
+        'p95': np.percentile(latencies, 95) if len(latencies) else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target', action='append', required=True, help='name=base_url, repeatable')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--seconds', type=float, default=20)
+    parser.add_argument('--email', default='admin@admin.com')
+    parser.add_argument('--password', default='admin')
+    args = parser.parse_args()
+
+    print(f"{'server':<12}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for target in args.target:
+        name, base_url = target.split('=', 1)
+        token = login(base_url, args.email, args.password)
+        # One short warm-up round so connection pools and caches are filled
+        run(base_url, token, args.concurrency, 2)
+        result = run(base_url, token, args.concurrency, args.seconds)
+        print(f"{name:<12}{result['requests']:>10}{result['errors']:>8}{result['rps']:>10.1f}{result['p50']:>10.1f}{result['p95']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,4 +7,5 @@ alembic upgrade head
 
 python3 src/infra/database/seeder/seed_users.py
 
-flask run --host=0.0.0.0 --port=5000
\ No newline at end of file
+# Production server; see src/infra/config/gunicorn_config.py for the WEB_* settings
+exec gunicorn -c src/infra/config/gunicorn_config.py src.main:app
@@ -4,20 +4,28 @@ from src.domain.repository.attendance import IAttendanceRepository
 from src.domain.repository.client import IClientRepository
 from src.domain.repository.green_angel import IGreenAngelRepository
 from src.domain.repository.hub import IHubRepository
+from src.domain.repository.sla_rollup import ISlaRollupRepository
 from src.domain.entities.attendance import Attendance
 from src.interface.web.schemas.attendance import (
-    AttendanceSchema, AttendancesPaginatedSchema, AttendanceUpdateSchema)
+    AttendanceSchema, AttendancesPaginatedSchema, AttendanceUpdateSchema, AttendanceCreateSchema,
+    AttendanceBulkUpdateItemSchema, AttendanceBulkResultSchema)
 
 
 class AttendanceService:
-    def __init__(self, attendance_repository: IAttendanceRepository, green_angel_repository: IGreenAngelRepository, hub_repository: IHubRepository, client_repository: IClientRepository):
+    def __init__(self, attendance_repository: IAttendanceRepository, green_angel_repository: IGreenAngelRepository, hub_repository: IHubRepository, client_repository: IClientRepository, sla_rollup_repository: ISlaRollupRepository):
         self.attendance_repository = attendance_repository
         self.green_angel_repository = green_angel_repository
         self.hub_repository = hub_repository
         self.client_repository = client_repository
+        self.sla_rollup_repository = sla_rollup_repository
 
-    def get_attendances_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        attendances = self.attendance_repository.get_attendances_paginated(page, per_page, filters, order_by, order_direction)
+    def _track_sla(self, attendance: Attendance, delta: int):
+        # Runs in the same transaction that save() commits
+        if attendance.is_active is not False:
+            self.sla_rollup_repository.apply(attendance.green_angel_id, attendance.hub_id, attendance.limit_date, attendance.attendance_date, delta)
+
+    def get_attendances_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, pagination: str = 'offset', cursor: str = None, count_mode: str = 'exact') -> dict:
+        attendances = self.attendance_repository.get_attendances_paginated(page, per_page, filters, order_by, order_direction, pagination, cursor, count_mode)
         return AttendancesPaginatedSchema.model_validate(attendances).model_dump()
 
     def find_attendance(self, attendance_id: int) -> dict:
@@ -42,14 +50,18 @@ class AttendanceService:
             attendance_date=attendance_create.attendance_date,
             is_active=attendance_create.is_active
         )
+        self._track_sla(attendance, 1)
         self.attendance_repository.save(attendance)
         return AttendanceSchema.model_validate(attendance).model_dump()
 
     def update_attendance(self, attendance_id: int, attendance_update: AttendanceUpdateSchema) -> dict:
-        attendance = self.attendance_repository.find_by_id(attendance_id)
+        # Locked until save() commits: the -1 below must subtract the row as it is now,
+        # not a version another request is changing at the same time
+        attendance = self.attendance_repository.find_by_id(attendance_id, for_update=True)
         if not attendance:
             raise DomainException(ErrorCode.ATTENDANCE_NOT_FOUND)
 
+        self._track_sla(attendance, -1)
         if attendance_update.green_angel_id:
             attendance.green_angel_id = attendance_update.green_angel_id
         if attendance_update.hub_id:
@@ -58,33 +70,148 @@ class AttendanceService:
             attendance.limit_date = attendance_update.limit_date
         if attendance_update.attendance_date:
             attendance.attendance_date = attendance_update.attendance_date
+        self._track_sla(attendance, 1)
         self.attendance_repository.save(attendance)
         return AttendanceSchema.model_validate(attendance).model_dump()
 
     def delete_attendance(self, attendance_id: int) -> dict:
-        attendance = self.attendance_repository.find_by_id(attendance_id)
+        attendance = self.attendance_repository.find_by_id(attendance_id, for_update=True)
         if not attendance:
             raise DomainException(ErrorCode.ATTENDANCE_NOT_FOUND)
         if not attendance.is_active:
             raise DomainException(ErrorCode.ATTENDANCE_ALREADY_DELETED)
+        self._track_sla(attendance, -1)
         attendance.is_active = False
         self.attendance_repository.save(attendance)
         return AttendanceSchema.model_validate(attendance).model_dump()
 
-    def get_sla_metrics(self) -> dict:
-        return self.attendance_repository.get_sla_metrics()
+    @staticmethod
+    def _sla_change(state: dict, delta: int) -> tuple:
+        return state['green_angel_id'], state['hub_id'], state['limit_date'], state['attendance_date'], delta
+
+    @staticmethod
+    def _reference_error(item, green_angel_ids: set, hub_ids: set, client_ids: set = None):
+        if item.green_angel_id and item.green_angel_id not in green_angel_ids:
+            return ErrorCode.GREEN_ANGEL_NOT_FOUND
+        if item.hub_id and item.hub_id not in hub_ids:
+            return ErrorCode.HUB_NOT_FOUND
+        if client_ids is not None and item.client_id not in client_ids:
+            return ErrorCode.CLIENT_NOT_FOUND
+        return None
+
+    @staticmethod
+    def _bulk_result(results: list[dict]) -> dict:
+        failed = sum(1 for result in results if result.get('error'))
+        return AttendanceBulkResultSchema(
+            succeeded=len(results) - failed,
+            failed=failed,
+            items=sorted(results, key=lambda result: result['index'])
+        ).model_dump()
+
+    def create_attendances(self, attendances_create: list[AttendanceCreateSchema]) -> dict:
+        """Create many attendances with one IN query per dimension and one INSERT.
+
+        Items referencing a missing green angel, hub or client are reported
+        and skipped; the others are inserted in a single transaction.
+        """
+        green_angel_ids = self.green_angel_repository.find_existing_ids({item.green_angel_id for item in attendances_create})
+        hub_ids = self.hub_repository.find_existing_ids({item.hub_id for item in attendances_create})
+        client_ids = self.client_repository.find_existing_ids({item.client_id for item in attendances_create})
+
+        results, rows = [], []
+        for index, item in enumerate(attendances_create):
+            error = self._reference_error(item, green_angel_ids, hub_ids, client_ids)
+            if error:
+                results.append({'index': index, 'status': 'error', 'error': error.message})
+                continue
+            rows.append((index, {
+                'client_id': item.client_id,
+                'green_angel_id': item.green_angel_id,
+                'hub_id': item.hub_id,
+                'limit_date': item.limit_date,
+                'attendance_date': item.attendance_date,
+                'is_active': item.is_active is not False
+            }))
+
+        self.sla_rollup_repository.apply_many([self._sla_change(row, 1) for _, row in rows if row['is_active']])
+        ids = self.attendance_repository.bulk_insert([row for _, row in rows])
+        results += [{'index': index, 'id': attendance_id, 'status': 'created'} for (index, _), attendance_id in zip(rows, ids)]
+        return self._bulk_result(results)
+
+    def update_attendances(self, attendances_update: list[AttendanceBulkUpdateItemSchema]) -> dict:
+        attendances = {attendance.id: attendance for attendance in self.attendance_repository.find_by_ids({item.id for item in attendances_update}, for_update=True)}
+        green_angel_ids = self.green_angel_repository.find_existing_ids({item.green_angel_id for item in attendances_update if item.green_angel_id})
+        hub_ids = self.hub_repository.find_existing_ids({item.hub_id for item in attendances_update if item.hub_id})
 
-    def get_sla_paginated_by_green_angels(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        return self.attendance_repository.get_sla_paginated_by_green_angels(page, per_page, filters, order_by, order_direction)
+        # Changes are applied to plain dicts: mutating the loaded entities would
+        # make the commit flush them again, one UPDATE per row
+        states, changes, results = {}, [], []
+        for index, item in enumerate(attendances_update):
+            attendance = attendances.get(item.id)
+            error = ErrorCode.ATTENDANCE_NOT_FOUND if not attendance or not attendance.is_active else self._reference_error(item, green_angel_ids, hub_ids)
+            if error:
+                results.append({'index': index, 'id': item.id, 'status': 'error', 'error': error.message})
+                continue
+
+            state = states.setdefault(item.id, {
+                'id': attendance.id,
+                'green_angel_id': attendance.green_angel_id,
+                'hub_id': attendance.hub_id,
+                'limit_date': attendance.limit_date,
+                'attendance_date': attendance.attendance_date
+            })
+            changes.append(self._sla_change(state, -1))
+            for field in ('green_angel_id', 'hub_id', 'limit_date', 'attendance_date'):
+                if getattr(item, field):
+                    state[field] = getattr(item, field)
+            changes.append(self._sla_change(state, 1))
+            results.append({'index': index, 'id': item.id, 'status': 'updated'})
+
+        self.sla_rollup_repository.apply_many(changes)
+        self.attendance_repository.bulk_update(list(states.values()))
+        return self._bulk_result(results)
+
+    def delete_attendances(self, attendance_ids: list[int]) -> dict:
+        attendances = {attendance.id: attendance for attendance in self.attendance_repository.find_by_ids(set(attendance_ids), for_update=True)}
+
+        deleted, changes, results = set(), [], []
+        for index, attendance_id in enumerate(attendance_ids):
+            attendance = attendances.get(attendance_id)
+            if not attendance:
+                error = ErrorCode.ATTENDANCE_NOT_FOUND
+            elif not attendance.is_active or attendance_id in deleted:
+                error = ErrorCode.ATTENDANCE_ALREADY_DELETED
+            else:
+                deleted.add(attendance_id)
+                changes.append((attendance.green_angel_id, attendance.hub_id, attendance.limit_date, attendance.attendance_date, -1))
+                results.append({'index': index, 'id': attendance_id, 'status': 'deleted'})
+                continue
+            results.append({'index': index, 'id': attendance_id, 'status': 'error', 'error': error.message})
+
+        self.sla_rollup_repository.apply_many(changes)
+        self.attendance_repository.bulk_deactivate(deleted)
+        return self._bulk_result(results)
+
+    def get_sla_metrics(self, filters: dict = None) -> dict:
+        return self.attendance_repository.get_sla_metrics(filters)
+
+    def get_sla_paginated_by_green_angels(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact', top_n: int = None) -> dict:
+        return self.attendance_repository.get_sla_paginated_by_green_angels(page, per_page, filters, order_by, order_direction, count_mode, top_n)
 
     def find_sla_by_green_angel(self, green_angel_id: int) -> dict:
         return self.attendance_repository.find_sla_by_green_angel_id(green_angel_id)
 
-    def get_sla_paginated_by_hubs(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        return self.attendance_repository.get_sla_paginated_by_hubs(page, per_page, filters, order_by, order_direction)
+    def get_sla_paginated_by_hubs(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact', top_n: int = None) -> dict:
+        return self.attendance_repository.get_sla_paginated_by_hubs(page, per_page, filters, order_by, order_direction, count_mode, top_n)
 
     def find_sla_by_hub(self, hub_id: int) -> dict:
         return self.attendance_repository.find_sla_by_hub_id(hub_id)
 
-    def get_productivity_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        return self.attendance_repository.get_productivity_paginated(page, per_page, filters, order_by, order_direction)
+    def get_productivity_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact') -> dict:
+        return self.attendance_repository.get_productivity_paginated(page, per_page, filters, order_by, order_direction, count_mode)
+
+    def get_sla_timeseries(self, filters: dict, interval: str = 'day') -> dict:
+        return self.attendance_repository.get_sla_timeseries(filters, interval)
+
+    def get_productivity_timeseries(self, filters: dict, interval: str = 'day') -> dict:
+        return self.attendance_repository.get_productivity_timeseries(filters, interval)
@@ -0,0 +1,69 @@
+import os
+from datetime import datetime as dt
+from typing import BinaryIO
+from uuid import uuid4
+
+from src.domain.entities.import_job import ImportJob
+from src.domain.exception.domain_exception import DomainException
+from src.domain.exception.error_code import ErrorCode
+from src.domain.repository.import_job import IImportJobRepository, IImportRunner
+from src.interface.web.schemas.import_job import ImportJobSchema
+
+
+class AttendanceImportService:
+    def __init__(self, import_job_repository: IImportJobRepository, import_runner: IImportRunner):
+        self.import_job_repository = import_job_repository
+        self.import_runner = import_runner
+
+    def start_import(self, stream: BinaryIO, file_name: str = None) -> dict:
+        path, file_hash, bytes_received = self.import_runner.spool(stream)
+        job = ImportJob(
+            id=str(uuid4()),
+            file_name=file_name,
+            file_hash=file_hash,
+            file_path=path,
+            bytes_received=bytes_received,
+            status='queued'
+        )
+        # Saved as queued is enqueued: the importer process picks it up from import_jobs
+        self.import_job_repository.save(job)
+        return self._job_status(job)
+
+    def find_import(self, job_id: str) -> dict:
+        job = self.import_job_repository.find_by_id(job_id)
+        if not job:
+            raise DomainException(ErrorCode.IMPORT_JOB_NOT_FOUND)
+        return self._job_status(job)
+
+    def find_import_rejects(self, job_id: str) -> str:
+        job = self.import_job_repository.find_by_id(job_id)
+        if not job:
+            raise DomainException(ErrorCode.IMPORT_JOB_NOT_FOUND)
+        if not job.rejects_path or not os.path.exists(job.rejects_path):
+            raise DomainException(ErrorCode.IMPORT_REJECTS_NOT_FOUND)
+        return job.rejects_path
+
+    def _job_status(self, job: ImportJob) -> dict:
+        # Progress is read from the batch checkpoints the importer commits for this job
+        progress = {'rows': 0, 'inserted': 0, 'rejected': 0}
+        rows_per_second = 0
+        if job.started_at:
+            progress = self.import_job_repository.get_progress(job.id)
+            elapsed = ((job.finished_at or dt.utcnow()) - job.started_at).total_seconds()
+            rows_per_second = round(progress['rows'] / elapsed, 2) if elapsed > 0 else 0
+
+        return ImportJobSchema(
+            id=job.id,
+            file_name=job.file_name,
+            status=job.status,
+            bytes_received=job.bytes_received,
+            rows_processed=progress['rows'],
+            rows_inserted=progress['inserted'],
+            rows_rejected=progress['rejected'],
+            rows_per_second=rows_per_second,
+            has_rejects=bool(job.rejects_path),
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at
+        ).model_dump()
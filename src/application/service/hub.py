@@ -10,8 +10,8 @@ class HubService:
     def __init__(self, hub_repository: IHubRepository):
         self.hub_repository = hub_repository
 
-    def get_hubs_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        hubs = self.hub_repository.get_hubs_paginated(page, per_page, filters, order_by, order_direction)
+    def get_hubs_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact') -> dict:
+        hubs = self.hub_repository.get_hubs_paginated(page, per_page, filters, order_by, order_direction, count_mode)
         return HubsPaginatedSchema.model_validate(hubs).model_dump()
 
     def find_hub(self, hub_id: int) -> dict:
@@ -23,6 +23,7 @@ class HubService:
     def create_hub(self, hub_create: HubSchema) -> dict:
         hub = Hub(
             name=hub_create.name,
+            state=hub_create.state,
             is_active=hub_create.is_active
         )
         self.hub_repository.save(hub)
@@ -35,6 +36,8 @@ class HubService:
 
         if hub_update.name:
             hub.name = hub_update.name
+        if hub_update.state:
+            hub.state = hub_update.state
         if hub_update.is_active:
             hub.is_active = hub_update.is_active
         self.hub_repository.save(hub)
@@ -16,8 +16,8 @@ class UserService:
         self.auth_service = auth_service
         self.rule_password = r'^(?=.*\d)(?=.*[a-z])(?=.*[A-Z]).{8,}$'
 
-    def get_users_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        users = self.user_repository.get_users_paginated(page, per_page, filters, order_by, order_direction)
+    def get_users_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact') -> dict:
+        users = self.user_repository.get_users_paginated(page, per_page, filters, order_by, order_direction, count_mode)
         return UsersPaginatedSchema.model_validate(users).model_dump()
 
     def find_user(self, user_id: int) -> dict:
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, Column, Boolean, DateTime, ForeignKey
+from sqlalchemy import Integer, Column, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime as dt
 
@@ -10,6 +10,16 @@ from src.infra.database.database import Base
 
 class Attendance(Base):
     __tablename__ = 'attendances'
+    __table_args__ = (
+        Index('ix_attendances_client_id_active', 'client_id', 'id', postgresql_where=text('is_active')),
+        Index('ix_attendances_green_angel_id_active', 'green_angel_id', 'id', postgresql_where=text('is_active'),
+              postgresql_include=['hub_id', 'limit_date', 'attendance_date']),
+        Index('ix_attendances_hub_id_active', 'hub_id', 'id', postgresql_where=text('is_active'),
+              postgresql_include=['green_angel_id', 'limit_date', 'attendance_date']),
+        Index('ix_attendances_limit_date_active', 'limit_date', 'id', postgresql_where=text('is_active')),
+        Index('ix_attendances_attendance_date_active', 'attendance_date', 'id', postgresql_where=text('is_active'),
+              postgresql_include=['green_angel_id']),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     client_id = Column(Integer, ForeignKey('clients.id'), nullable=False)
@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Integer, Column, DateTime, String
+from datetime import datetime as dt
+
+from src.infra.database.database import Base
+
+
+class CsvImportBatch(Base):
+    __tablename__ = 'csv_import_batches'
+
+    file_hash = Column(String(64), primary_key=True)
+    # Import job the batch belongs to, '' for command-line imports
+    job_id = Column(String(36), primary_key=True, default='', server_default='')
+    start_offset = Column(BigInteger, primary_key=True)
+    end_offset = Column(BigInteger, nullable=False)
+    first_row = Column(BigInteger, nullable=False)
+    rows = Column(Integer, nullable=False)
+    inserted = Column(Integer, default=0, nullable=False)
+    rejected = Column(Integer, default=0, nullable=False)
+    committed_at = Column(DateTime, default=dt.utcnow)
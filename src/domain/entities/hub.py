@@ -10,6 +10,8 @@ class Hub(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, index=True, unique=True, nullable=False)
+    # UF of the hub, selects the regional holiday calendar for working days
+    state = Column(String(2), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=dt.utcnow)
     updated_at = Column(DateTime, default=dt.utcnow, onupdate=dt.utcnow)
@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger, Column, DateTime, String
+from datetime import datetime as dt
+
+from src.infra.database.database import Base
+
+
+class ImportJob(Base):
+    __tablename__ = 'import_jobs'
+
+    id = Column(String(36), primary_key=True)
+    file_name = Column(String)
+    file_hash = Column(String(64))
+    bytes_received = Column(BigInteger, default=0, nullable=False)
+    # Spooled upload the importer process reads, removed once the job completes;
+    # partial and failed jobs keep it, with their checkpoints, to be resumed
+    file_path = Column(String)
+    # Rows the importer could not import, with the reason, kept for the uploader
+    rejects_path = Column(String)
+    status = Column(String(20), default='queued', nullable=False)
+    error = Column(String)
+    created_at = Column(DateTime, default=dt.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
@@ -0,0 +1,43 @@
+from sqlalchemy import Integer, Column, Date, DateTime, MetaData, String, Table
+from datetime import datetime as dt
+
+from src.infra.database.database import Base
+
+# Materialized views are created by the migrations, never by create_all, so
+# they live outside Base.metadata
+views = MetaData()
+
+SlaByGreenAngelView = Table(
+    'mv_sla_by_green_angel', views,
+    Column('green_angel_id', Integer, primary_key=True),
+    Column('total', Integer),
+    Column('on_time', Integer),
+    Column('late', Integer),
+    Column('not_attended', Integer)
+)
+
+SlaByHubView = Table(
+    'mv_sla_by_hub', views,
+    Column('hub_id', Integer, primary_key=True),
+    Column('total', Integer),
+    Column('on_time', Integer),
+    Column('late', Integer),
+    Column('not_attended', Integer)
+)
+
+ProductivityDailyView = Table(
+    'mv_productivity_daily', views,
+    Column('green_angel_id', Integer, primary_key=True),
+    Column('hub_id', Integer, primary_key=True),
+    Column('day', Date, primary_key=True),
+    Column('attendances', Integer)
+)
+
+METRIC_VIEWS = [SlaByGreenAngelView.name, SlaByHubView.name, ProductivityDailyView.name]
+
+
+class MetricViewRefresh(Base):
+    __tablename__ = 'metric_view_refreshes'
+
+    name = Column(String(63), primary_key=True)
+    refreshed_at = Column(DateTime, default=dt.utcnow, nullable=False)
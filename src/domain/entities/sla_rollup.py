@@ -0,0 +1,17 @@
+from sqlalchemy import Integer, Column, Date, DateTime, ForeignKey
+from datetime import datetime as dt
+
+from src.infra.database.database import Base
+
+
+class SlaRollup(Base):
+    __tablename__ = 'sla_rollup'
+
+    green_angel_id = Column(Integer, ForeignKey('green_angels.id'), primary_key=True)
+    hub_id = Column(Integer, ForeignKey('hubs.id'), primary_key=True, index=True)
+    day = Column(Date, primary_key=True)
+    total = Column(Integer, default=0, nullable=False)
+    on_time = Column(Integer, default=0, nullable=False)
+    late = Column(Integer, default=0, nullable=False)
+    pending = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=dt.utcnow, onupdate=dt.utcnow)
@@ -14,6 +14,12 @@ class ErrorCode(Enum):
     USER_EXIST = {"code": 409, "detail": "USER_EXIST", "description": "The user already exists"}
     UNAUTHORIZED = {"code": 401, "detail": "UNAUTHORIZED", "description": "Invalid credentials"}
     BAD_FORMAT_PASSWORD = {"code": 400, "detail": "BAD_FORMAT_PASSWORD", "description": "The password format is invalid"}
+    IMPORT_JOB_NOT_FOUND = {"code": 404, "detail": "IMPORT_JOB_NOT_FOUND", "description": "The import job does not exist"}
+    IMPORT_REJECTS_NOT_FOUND = {"code": 404, "detail": "IMPORT_REJECTS_NOT_FOUND", "description": "The import job has no rejected rows file"}
+    INVALID_IMPORT_FILE = {"code": 400, "detail": "INVALID_IMPORT_FILE", "description": "The uploaded file is empty or is not a valid CSV or gzip stream"}
+    INVALID_COUNT_MODE = {"code": 400, "detail": "INVALID_COUNT_MODE", "description": "The count mode must be exact or estimated"}
+    INVALID_SEARCH_MODE = {"code": 400, "detail": "INVALID_SEARCH_MODE", "description": "The search mode must be contains or similarity"}
+    INVALID_CURSOR = {"code": 400, "detail": "INVALID_CURSOR", "description": "The pagination cursor is invalid or does not match the requested ordering"}
 
     def __init__(self, details):
         self.code = details["code"]
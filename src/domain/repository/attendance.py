@@ -6,36 +6,60 @@ from src.domain.entities.attendance import Attendance
 class IAttendanceRepository(ABC):
 
     @abstractmethod
-    def get_attendances_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
+    def get_attendances_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, pagination: str, cursor: str, count_mode: str) -> dict:
         pass
 
     @abstractmethod
-    def find_by_id(self, attendance_id : int) -> Attendance:
+    def find_by_id(self, attendance_id : int, for_update: bool = False) -> Attendance:
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, attendance_ids: set[int], for_update: bool = False) -> list[Attendance]:
         pass
 
     @abstractmethod
     def save(self, attendance: Attendance):
         pass
 
+    @abstractmethod
+    def bulk_insert(self, rows: list[dict]) -> list[int]:
+        pass
+
+    @abstractmethod
+    def bulk_update(self, rows: list[dict]):
+        pass
+
+    @abstractmethod
+    def bulk_deactivate(self, attendance_ids: set[int]):
+        pass
+
     @abstractmethod
     def delete(self, attendance: Attendance):
         pass
 
     @abstractmethod
-    def get_sla_metrics(self) -> dict:
+    def get_sla_metrics(self, filters: dict) -> dict:
         pass
 
-    def get_sla_paginated_by_green_angels(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
+    def get_sla_paginated_by_green_angels(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str, top_n: int) -> dict:
         pass
 
     def find_sla_by_green_angel_id(self, green_angel_id: int) -> dict:
         pass
 
-    def get_sla_paginated_by_hubs(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
+    def get_sla_paginated_by_hubs(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str, top_n: int) -> dict:
         pass
 
     def find_sla_by_hub_id(self, hub_id: int) -> dict:
         pass
 
-    def get_productivity_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
+    def get_productivity_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str) -> dict:
+        pass
+
+    @abstractmethod
+    def get_sla_timeseries(self, filters: dict, interval: str) -> dict:
+        pass
+
+    @abstractmethod
+    def get_productivity_timeseries(self, filters: dict, interval: str) -> dict:
         pass
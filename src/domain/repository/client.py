@@ -6,13 +6,17 @@ from src.domain.entities.client import Client
 class IClientRepository(ABC):
 
     @abstractmethod
-    def get_clients_paginated(self, page: int, per_page: int, order_by: str, order_direction: str) -> dict:
+    def get_clients_paginated(self, page: int, per_page: int, order_by: str, order_direction: str, count_mode: str) -> dict:
         pass
 
     @abstractmethod
     def find_by_id(self, client_id : int):
         pass
 
+    @abstractmethod
+    def find_existing_ids(self, client_ids: set[int]) -> set[int]:
+        pass
+
     @abstractmethod
     def save(self, client: Client):
         pass
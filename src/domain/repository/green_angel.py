@@ -6,13 +6,17 @@ from src.domain.entities.green_angel import GreenAngel
 class IGreenAngelRepository(ABC):
 
     @abstractmethod
-    def get_green_angels_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
+    def get_green_angels_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str) -> dict:
         pass
 
     @abstractmethod
     def find_by_id(self, green_angel_id : int):
         pass
 
+    @abstractmethod
+    def find_existing_ids(self, green_angel_ids: set[int]) -> set[int]:
+        pass
+
     @abstractmethod
     def save(self, green_angel: GreenAngel):
         pass
@@ -6,13 +6,17 @@ from src.domain.entities.hub import Hub
 class IHubRepository(ABC):
 
     @abstractmethod
-    def get_hubs_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
+    def get_hubs_paginated(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str) -> dict:
         pass
 
     @abstractmethod
     def find_by_id(self, hub_id : int):
         pass
 
+    @abstractmethod
+    def find_existing_ids(self, hub_ids: set[int]) -> set[int]:
+        pass
+
     @abstractmethod
     def save(self, hub: Hub):
         pass
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+from src.domain.entities.import_job import ImportJob
+
+
+class IImportJobRepository(ABC):
+
+    @abstractmethod
+    def find_by_id(self, job_id: str) -> ImportJob:
+        pass
+
+    @abstractmethod
+    def save(self, job: ImportJob):
+        pass
+
+    @abstractmethod
+    def claim_next(self) -> ImportJob:
+        pass
+
+    @abstractmethod
+    def requeue_running(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_progress(self, job_id: str) -> dict:
+        pass
+
+
+class IImportRunner(ABC):
+
+    @abstractmethod
+    def spool(self, stream: BinaryIO) -> tuple[str, str, int]:
+        pass
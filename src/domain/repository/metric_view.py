@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class IMetricViewRepository(ABC):
+
+    @abstractmethod
+    def refresh_all(self) -> bool:
+        pass
+
+    @abstractmethod
+    def refreshed_at(self, name: str) -> datetime:
+        pass
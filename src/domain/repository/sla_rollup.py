@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class ISlaRollupRepository(ABC):
+
+    @abstractmethod
+    def apply(self, green_angel_id: int, hub_id: int, limit_date: datetime, attendance_date: datetime, delta: int):
+        pass
+
+    @abstractmethod
+    def apply_many(self, changes: list[tuple[int, int, datetime, datetime, int]]):
+        pass
@@ -8,9 +8,38 @@ class Settings:
         self.SECRET_KEY = os.getenv('SECRET_KEY')
         self.ALGORITHM = os.getenv('ALGORITHM')
         self.ACCESS_TOKEN_EXPIRE = int(os.getenv('ACCESS_TOKEN_EXPIRE', 8))
+        # Verified access tokens kept per process, 0 verifies every request
+        self.TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', 1024))
 
         self.SQLALCHEMY_DATABASE_URI = os.getenv('SQLALCHEMY_DATABASE_URI')
 
+        # Connection pool of each app process
+        self.DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+        self.DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 10))
+        self.DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))
+        self.DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))
+        self.DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+        # Milliseconds, 0 leaves the server default
+        self.DB_STATEMENT_TIMEOUT = int(os.getenv('DB_STATEMENT_TIMEOUT', 0))
+        # 'internal' pools in the app; 'pgbouncer' leaves pooling to an external
+        # transaction pooler and keeps no state on the server connection
+        self.DB_POOL_MODE = os.getenv('DB_POOL_MODE', 'internal')
+
+        # Comma-separated streaming replicas for the read-only routes, empty reads from the primary
+        self.SQLALCHEMY_REPLICA_URIS = [url.strip() for url in os.getenv('SQLALCHEMY_REPLICA_URIS', '').split(',') if url.strip()]
+        # Seconds between health checks of a replica, and the replication lag above which it is skipped
+        self.DB_REPLICA_CHECK_SECONDS = int(os.getenv('DB_REPLICA_CHECK_SECONDS', 5))
+        self.DB_REPLICA_MAX_LAG = int(os.getenv('DB_REPLICA_MAX_LAG', 30))
+
+        # Directory shared by the web app, which spools uploads there, and the importer process
+        self.IMPORT_SPOOL_DIR = os.getenv('IMPORT_SPOOL_DIR') or None
+        # Seconds the importer waits between looks at an empty queue, and its writer threads
+        self.IMPORT_POLL_SECONDS = int(os.getenv('IMPORT_POLL_SECONDS', 2))
+        self.IMPORT_WORKERS = int(os.getenv('IMPORT_WORKERS', 4))
+
+        # Seconds between refreshes of the metric materialized views, 0 disables the scheduler
+        self.METRIC_VIEWS_REFRESH_SECONDS = int(os.getenv('METRIC_VIEWS_REFRESH_SECONDS', 300))
+
 
 @lru_cache
 def get_settings():
@@ -0,0 +1,55 @@
+"""Gunicorn settings for the production server, all overridable through env vars:
+
+    gunicorn -c src/infra/config/gunicorn_config.py src.main:app
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('WEB_BIND', '0.0.0.0:5000')
+
+# Pre-fork workers, each serving requests on a thread pool (gthread) or on
+# greenlets (gevent, needs the gevent and psycogreen packages)
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('WEB_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('WEB_THREADS', 4))
+worker_connections = int(os.getenv('WEB_WORKER_CONNECTIONS', 1000))
+
+timeout = int(os.getenv('WEB_TIMEOUT', 60))
+graceful_timeout = int(os.getenv('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('WEB_KEEPALIVE', 5))
+
+# Recycle workers now and then so a slow leak cannot grow forever
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', 10000))
+max_requests_jitter = int(os.getenv('WEB_MAX_REQUESTS_JITTER', 1000))
+
+# Import the app and build the Container once in the master, workers share its pages
+preload_app = True
+
+accesslog = os.getenv('WEB_ACCESS_LOG', '-')
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    if worker_class == 'gevent':
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+
+    # Connections opened in the master must not be shared with a worker;
+    # close=False leaves them to the master instead of closing its sockets
+    from src.infra.database.database import engine, replica_engines
+    for db_engine in [engine, *replica_engines]:
+        db_engine.dispose(close=False)
+
+    # Threads are started only after the fork: the master stays single-threaded,
+    # so no worker inherits a lock some thread of the master was holding
+    from src.main import container
+    container.metric_view_refresher().start()
+
+
+def worker_exit(server, worker):
+    from src.main import container
+    container.metric_view_refresher().stop()
+
+    from src.infra.database.database import engine, replica_engines
+    for db_engine in [engine, *replica_engines]:
+        db_engine.dispose()
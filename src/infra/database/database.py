@@ -1,16 +1,72 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm  import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 from src.infra.config.config import get_settings
+from src.infra.database.replicas import ReplicaSet, RoutingSession
 
 settings = get_settings()
 
 SQLALCHEMY_DATABASE_URL = settings.SQLALCHEMY_DATABASE_URI
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def engine_options(settings, url: str = None) -> dict:
+    """Pool and connection arguments for create_engine, taken from Settings.
+
+    url defaults to the primary; replicas pass their own and get the same pool.
+    """
+    url = make_url(url or settings.SQLALCHEMY_DATABASE_URI)
+    if url.get_backend_name() == 'sqlite':
+        # SQLite's pools take none of the QueuePool arguments
+        return {}
+
+    if settings.DB_POOL_MODE == 'pgbouncer':
+        # The pooler owns the server connections: hold none between requests,
+        # and send no startup options, which PgBouncer rejects
+        options = {'poolclass': NullPool}
+        if url.get_driver_name() == 'psycopg':
+            # psycopg 3 prepares repeated statements server-side; psycopg2 never does
+            options['connect_args'] = {'prepare_threshold': None}
+        return options
+
+    options = {
+        'pool_size': settings.DB_POOL_SIZE,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_timeout': settings.DB_POOL_TIMEOUT,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+        'pool_pre_ping': settings.DB_POOL_PRE_PING,
+    }
+    if settings.DB_STATEMENT_TIMEOUT:
+        options['connect_args'] = {'options': f'-c statement_timeout={settings.DB_STATEMENT_TIMEOUT}'}
+    return options
+
+
+def set_statement_timeout(conn):
+    conn.exec_driver_sql(f'SET LOCAL statement_timeout = {settings.DB_STATEMENT_TIMEOUT}')
+
+
+def create_db_engine(url: str):
+    db_engine = create_engine(url, **engine_options(settings, url))
+    if settings.DB_POOL_MODE == 'pgbouncer' and settings.DB_STATEMENT_TIMEOUT:
+        # Session settings would leak to whichever client gets the server
+        # connection next, so the timeout is set per transaction instead
+        event.listen(db_engine, 'begin', set_statement_timeout)
+    return db_engine
+
+
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
+
+# Read replicas for the routes marked with read_replica, empty without SQLALCHEMY_REPLICA_URIS
+replica_engines = [create_db_engine(url) for url in settings.SQLALCHEMY_REPLICA_URIS]
+replicas = ReplicaSet(replica_engines, settings.DB_REPLICA_CHECK_SECONDS, settings.DB_REPLICA_MAX_LAG)
+
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine, replicas=replicas)
+
+# One session per thread, so each request served by a worker thread gets its
+# own; remove_session closes it when the request's app context ends
+ScopedSession = scoped_session(SessionLocal)
 
 Base = declarative_base()
 
@@ -20,3 +76,6 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def remove_session(exception=None):
+    ScopedSession.remove()
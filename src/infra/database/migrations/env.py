@@ -27,6 +27,10 @@ from src.domain.entities.user import User
 from src.domain.entities.client import Client
 from src.domain.entities.attendance import Attendance
 from src.domain.entities.green_angel import GreenAngel
+from src.domain.entities.sla_rollup import SlaRollup
+from src.domain.entities.csv_import_batch import CsvImportBatch
+from src.domain.entities.import_job import ImportJob
+from src.domain.entities.metric_view import MetricViewRefresh
 from src.infra.database.database import Base
 
 target_metadata = Base.metadata
@@ -0,0 +1,53 @@
+"""add sla rollup
+
+Revision ID: 3192d0ec8b58
+Revises: be9831cd90ea
+Create Date: 2026-10-18 09:12:41.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3192d0ec8b58'
+down_revision: Union[str, None] = 'be9831cd90ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sla_rollup',
+    sa.Column('green_angel_id', sa.Integer(), nullable=False),
+    sa.Column('hub_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('on_time', sa.Integer(), nullable=False),
+    sa.Column('late', sa.Integer(), nullable=False),
+    sa.Column('pending', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['green_angel_id'], ['green_angels.id'], ),
+    sa.ForeignKeyConstraint(['hub_id'], ['hubs.id'], ),
+    sa.PrimaryKeyConstraint('green_angel_id', 'hub_id', 'day')
+    )
+    op.create_index(op.f('ix_sla_rollup_hub_id'), 'sla_rollup', ['hub_id'], unique=False)
+
+    # Backfill from the attendances already loaded
+    op.execute("""
+        INSERT INTO sla_rollup (green_angel_id, hub_id, day, total, on_time, late, pending, updated_at)
+        SELECT green_angel_id, hub_id, limit_date::date, count(*),
+               count(*) FILTER (WHERE attendance_date <= limit_date),
+               count(*) FILTER (WHERE attendance_date > limit_date),
+               count(*) FILTER (WHERE attendance_date IS NULL),
+               NOW()
+        FROM attendances
+        WHERE is_active
+        GROUP BY green_angel_id, hub_id, limit_date::date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_sla_rollup_hub_id'), table_name='sla_rollup')
+    op.drop_table('sla_rollup')
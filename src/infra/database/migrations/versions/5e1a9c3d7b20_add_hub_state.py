@@ -0,0 +1,26 @@
+"""add hub state
+
+Revision ID: 5e1a9c3d7b20
+Revises: 7299fdaa8b16
+Create Date: 2026-10-18 16:20:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1a9c3d7b20'
+down_revision: Union[str, None] = '7299fdaa8b16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('hubs', sa.Column('state', sa.String(length=2), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('hubs', 'state')
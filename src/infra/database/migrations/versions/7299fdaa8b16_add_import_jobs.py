@@ -0,0 +1,37 @@
+"""add import jobs
+
+Revision ID: 7299fdaa8b16
+Revises: 743fc6d9f1b2
+Create Date: 2026-10-18 15:02:44.118023
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7299fdaa8b16'
+down_revision: Union[str, None] = '743fc6d9f1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('import_jobs',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('file_name', sa.String(), nullable=True),
+    sa.Column('file_hash', sa.String(length=64), nullable=True),
+    sa.Column('bytes_received', sa.BigInteger(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('import_jobs')
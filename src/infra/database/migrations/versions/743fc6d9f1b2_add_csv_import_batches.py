@@ -0,0 +1,36 @@
+"""add csv import batches
+
+Revision ID: 743fc6d9f1b2
+Revises: 744311d8e0d7
+Create Date: 2026-10-18 14:21:07.530196
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '743fc6d9f1b2'
+down_revision: Union[str, None] = '744311d8e0d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('csv_import_batches',
+    sa.Column('file_hash', sa.String(length=64), nullable=False),
+    sa.Column('start_offset', sa.BigInteger(), nullable=False),
+    sa.Column('end_offset', sa.BigInteger(), nullable=False),
+    sa.Column('first_row', sa.BigInteger(), nullable=False),
+    sa.Column('rows', sa.Integer(), nullable=False),
+    sa.Column('inserted', sa.Integer(), nullable=False),
+    sa.Column('rejected', sa.Integer(), nullable=False),
+    sa.Column('committed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('file_hash', 'start_offset')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('csv_import_batches')
@@ -0,0 +1,50 @@
+"""add trigram name indexes
+
+Revision ID: 744311d8e0d7
+Revises: c7fb68f64c28
+Create Date: 2026-10-18 11:26:09.530187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '744311d8e0d7'
+down_revision: Union[str, None] = 'c7fb68f64c28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_green_angels_name_trgm', 'green_angels'),
+    ('ix_hubs_name_trgm', 'hubs'),
+    ('ix_users_name_trgm', 'users'),
+]
+
+
+def upgrade() -> None:
+    # Servers without the contrib package keep working: the repositories fall
+    # back to plain ILIKE when pg_trgm is not installed
+    available = op.get_bind().execute(sa.text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")).scalar()
+    if not available:
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, table in INDEXES:
+            op.create_index(
+                name, table, ['name'], unique=False,
+                postgresql_using='gin',
+                postgresql_ops={'name': 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    # The extension is left in place, other objects may depend on it
+    with op.get_context().autocommit_block():
+        for name, table in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
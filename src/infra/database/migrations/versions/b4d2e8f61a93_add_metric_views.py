@@ -0,0 +1,59 @@
+"""add metric views
+
+Revision ID: b4d2e8f61a93
+Revises: 5e1a9c3d7b20
+Create Date: 2026-10-18 17:05:12.880431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d2e8f61a93'
+down_revision: Union[str, None] = '5e1a9c3d7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Counts are cast to int so that summing them gives bigint, not numeric
+SLA_COLUMNS = """
+    count(*)::int AS total,
+    (count(*) FILTER (WHERE attendance_date <= limit_date))::int AS on_time,
+    (count(*) FILTER (WHERE attendance_date > limit_date))::int AS late,
+    (count(*) FILTER (WHERE attendance_date IS NULL))::int AS not_attended
+"""
+
+# name, query, unique index columns (REFRESH ... CONCURRENTLY requires one)
+VIEWS = [
+    ('mv_sla_by_green_angel',
+     f"SELECT green_angel_id, {SLA_COLUMNS} FROM attendances WHERE is_active GROUP BY green_angel_id",
+     ['green_angel_id']),
+    ('mv_sla_by_hub',
+     f"SELECT hub_id, {SLA_COLUMNS} FROM attendances WHERE is_active GROUP BY hub_id",
+     ['hub_id']),
+    ('mv_productivity_daily',
+     "SELECT green_angel_id, hub_id, attendance_date::date AS day, count(*)::int AS attendances FROM attendances "
+     "WHERE is_active AND attendance_date IS NOT NULL GROUP BY green_angel_id, hub_id, attendance_date::date",
+     ['green_angel_id', 'hub_id', 'day']),
+]
+
+
+def upgrade() -> None:
+    op.create_table('metric_view_refreshes',
+    sa.Column('name', sa.String(length=63), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    for name, query, columns in VIEWS:
+        op.execute(f"CREATE MATERIALIZED VIEW {name} AS {query}")
+        op.create_index(f'ux_{name}', name, columns, unique=True)
+        op.execute(f"INSERT INTO metric_view_refreshes (name, refreshed_at) VALUES ('{name}', timezone('utc', now()))")
+
+
+def downgrade() -> None:
+    for name, query, columns in reversed(VIEWS):
+        op.execute(f"DROP MATERIALIZED VIEW {name}")
+    op.drop_table('metric_view_refreshes')
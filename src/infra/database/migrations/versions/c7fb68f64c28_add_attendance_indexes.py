@@ -0,0 +1,48 @@
+"""add attendance indexes
+
+Revision ID: c7fb68f64c28
+Revises: 3192d0ec8b58
+Create Date: 2026-10-18 10:03:55.817342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7fb68f64c28'
+down_revision: Union[str, None] = '3192d0ec8b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every repository query filters on is_active, so the indexes are partial.
+# The id suffix serves ORDER BY id and the (col, id) keyset seek; the INCLUDE
+# columns let the SLA and productivity aggregates run as index-only scans.
+INDEXES = [
+    ('ix_attendances_client_id_active', ['client_id', 'id'], []),
+    ('ix_attendances_green_angel_id_active', ['green_angel_id', 'id'], ['hub_id', 'limit_date', 'attendance_date']),
+    ('ix_attendances_hub_id_active', ['hub_id', 'id'], ['green_angel_id', 'limit_date', 'attendance_date']),
+    ('ix_attendances_limit_date_active', ['limit_date', 'id'], []),
+    ('ix_attendances_attendance_date_active', ['attendance_date', 'id'], ['green_angel_id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps attendances writable while the indexes build
+    with op.get_context().autocommit_block():
+        for name, columns, include in INDEXES:
+            op.create_index(
+                name, 'attendances', columns, unique=False,
+                postgresql_where=sa.text('is_active'),
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='attendances', postgresql_concurrently=True, if_exists=True)
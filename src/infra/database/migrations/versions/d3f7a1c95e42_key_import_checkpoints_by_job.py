@@ -0,0 +1,36 @@
+"""key import checkpoints by job
+
+Revision ID: d3f7a1c95e42
+Revises: b4d2e8f61a93
+Create Date: 2026-10-18 21:12:40.275613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f7a1c95e42'
+down_revision: Union[str, None] = 'b4d2e8f61a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # '' marks the checkpoints of command-line imports, which have no job
+    op.add_column('csv_import_batches', sa.Column('job_id', sa.String(length=36), server_default='', nullable=False))
+    op.drop_constraint('csv_import_batches_pkey', 'csv_import_batches', type_='primary')
+    op.create_primary_key('csv_import_batches_pkey', 'csv_import_batches', ['file_hash', 'job_id', 'start_offset'])
+
+    op.add_column('import_jobs', sa.Column('file_path', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('import_jobs', 'file_path')
+
+    op.execute("DELETE FROM csv_import_batches WHERE job_id <> ''")
+    op.drop_constraint('csv_import_batches_pkey', 'csv_import_batches', type_='primary')
+    op.create_primary_key('csv_import_batches_pkey', 'csv_import_batches', ['file_hash', 'start_offset'])
+    op.drop_column('csv_import_batches', 'job_id')
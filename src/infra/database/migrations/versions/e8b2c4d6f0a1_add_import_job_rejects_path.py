@@ -0,0 +1,26 @@
+"""add import job rejects path
+
+Revision ID: e8b2c4d6f0a1
+Revises: d3f7a1c95e42
+Create Date: 2026-10-18 23:40:12.508214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b2c4d6f0a1'
+down_revision: Union[str, None] = 'd3f7a1c95e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('import_jobs', sa.Column('rejects_path', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('import_jobs', 'rejects_path')
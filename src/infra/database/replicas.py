@@ -0,0 +1,98 @@
+import itertools
+import threading
+import time
+
+from sqlalchemy import Select, text
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Seconds the replica is behind the primary, 0 once it has replayed all the WAL it
+# received. NULL when it is not a streaming standby: with the WAL receiver gone the
+# received and replayed positions stay equal however far the primary moves on.
+# Reading status needs pg_read_all_stats (or superuser); without it every probe fails.
+LAG_SQL = text("""
+    SELECT CASE WHEN NOT pg_is_in_recovery()
+                  OR NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL
+                WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0) END
+""")
+
+
+class Replica:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.healthy = True
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+
+class ReplicaSet:
+    """Round-robin over the read replicas, skipping the unhealthy ones.
+
+    A replica is probed at most every check_seconds, by whichever request
+    picks it first; it is unhealthy when unreachable, not streaming from
+    the primary, or lagging more than max_lag seconds. With no healthy
+    replica, reads go to the primary.
+    """
+
+    def __init__(self, engines: list[Engine], check_seconds: float = 5, max_lag: float = 30):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.check_seconds = check_seconds
+        self.max_lag = max_lag
+        self._next = itertools.cycle(range(len(self.replicas)))
+        self._lock = threading.Lock()
+
+    def _probe(self, replica: Replica) -> bool:
+        try:
+            with replica.engine.connect() as conn:
+                if replica.engine.dialect.name != 'postgresql':
+                    return conn.execute(text('SELECT 1')).scalar() == 1
+                lag = conn.execute(LAG_SQL).scalar()
+                return lag is not None and lag <= self.max_lag
+        except Exception:
+            return False
+
+    def _is_healthy(self, replica: Replica) -> bool:
+        if time.monotonic() - replica.checked_at >= self.check_seconds and replica.lock.acquire(blocking=False):
+            # Other requests keep the last known state while one of them probes
+            try:
+                replica.healthy = self._probe(replica)
+                replica.checked_at = time.monotonic()
+            finally:
+                replica.lock.release()
+        return replica.healthy
+
+    def pick(self) -> Engine:
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = self.replicas[next(self._next)]
+            if self._is_healthy(replica):
+                return replica.engine
+        return None
+
+
+class RoutingSession(Session):
+    """Session that sends plain SELECTs to a replica once reads were routed there.
+
+    Routing is opt-in per session (info['replica'], set by the read_replica
+    route decorator). The first write, or any flush, pins the session to the
+    primary for the rest of its life, so a request reads its own writes.
+    Text statements and bare connections always run on the primary.
+    """
+
+    def __init__(self, *args, replicas: ReplicaSet = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info['primary'] = True
+
+        if self.replicas and self.replicas.replicas and self.info.get('replica') and not self.info.get('primary') and isinstance(clause, Select):
+            # One replica per session, so the page and its count see the same snapshot
+            if 'replica_engine' not in self.info:
+                self.info['replica_engine'] = self.replicas.pick()
+            if self.info['replica_engine'] is not None:
+                return self.info['replica_engine']
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
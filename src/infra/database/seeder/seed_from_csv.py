@@ -1,9 +1,18 @@
+import argparse
+import hashlib
+import io
+import itertools
+import multiprocessing
+import numpy as np
 import os
+import queue
 import pandas as pd
 import threading
-import psycopg2
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime as dt
+from typing import NamedTuple
 from dotenv import load_dotenv
+import psycopg2
 from psycopg2 import pool
 from passlib.context import CryptContext
 import time
@@ -14,101 +23,568 @@ SQLALCHEMY_DATABASE_URI = os.getenv('SQLALCHEMY_DATABASE_URI')
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CSV_FILE_PATH = os.path.join(BASE_DIR, os.getenv('CSV_FILE_NAME', 'data.csv'))
 
-conn_pool = psycopg2.pool.SimpleConnectionPool(1, 10, SQLALCHEMY_DATABASE_URI)
+# Columns of the shaped batch, in the order they are copied into staging
+STAGING_COLUMNS = ['id', 'client_id', 'green_angel_id', 'hub_id', 'limit_date', 'attendance_date']
 
-def convert_date(date_str):
-    if pd.isna(date_str) or date_str.strip() == '' or date_str.strip() == '-':
-        return None
-    try:
-        dt.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-        return date_str
-    except ValueError:
-        try:
-            return pd.to_datetime(date_str.strip(), format='%d/%m%Y %H:%M').strftime('%Y-%m-%d %H:%M:%S')
-        except ValueError:
-            return pd.to_datetime(date_str.strip(), format='mixed', dayfirst=True).strftime('%Y-%m-%d %H:%M:%S')
+# One staging table per connection, emptied by every commit or rollback
+CREATE_STAGING_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS attendances_staging (
+        id integer,
+        client_id integer,
+        green_angel_id integer,
+        hub_id integer,
+        limit_date timestamp,
+        attendance_date timestamp
+    ) ON COMMIT DELETE ROWS
+"""
 
-def import_csv():
-    if not os.path.isfile(CSV_FILE_PATH):
-        print("CSV file not found!")
-        return
+COPY_STAGING_SQL = f"""
+    COPY attendances_staging ({', '.join(STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv)
+"""
+
+INSERT_NAMES_SQL = """
+    INSERT INTO {table} (name, is_active, created_at, updated_at)
+    SELECT unnest(%s::text[]), true, NOW(), NOW()
+    ON CONFLICT (name) DO NOTHING
+"""
+
+SELECT_NAMES_SQL = "SELECT name, id FROM {table} WHERE name = ANY(%s)"
+
+INSERT_CLIENTS_SQL = """
+    INSERT INTO clients (id, is_active, created_at, updated_at)
+    SELECT unnest(%s::integer[]), true, NOW(), NOW()
+    ON CONFLICT (id) DO NOTHING
+"""
+
+# Inserts the batch and adds only the rows actually inserted to sla_rollup,
+# so re-running a file neither duplicates attendances nor double counts them
+INSERT_ATTENDANCES_SQL = """
+    WITH inserted AS (
+        INSERT INTO attendances (id, client_id, green_angel_id, hub_id, limit_date, attendance_date, is_active, created_at, updated_at)
+        SELECT id, client_id, green_angel_id, hub_id, limit_date, attendance_date, true, NOW(), NOW()
+        FROM attendances_staging
+        WHERE id IS NOT NULL AND client_id IS NOT NULL AND green_angel_id IS NOT NULL
+          AND hub_id IS NOT NULL AND limit_date IS NOT NULL
+        ON CONFLICT DO NOTHING
+        RETURNING green_angel_id, hub_id, limit_date, attendance_date
+    ), rollup AS (
+        INSERT INTO sla_rollup (green_angel_id, hub_id, day, total, on_time, late, pending, updated_at)
+        SELECT green_angel_id, hub_id, limit_date::date, count(*),
+               count(*) FILTER (WHERE attendance_date <= limit_date),
+               count(*) FILTER (WHERE attendance_date > limit_date),
+               count(*) FILTER (WHERE attendance_date IS NULL),
+               NOW()
+        FROM inserted
+        GROUP BY green_angel_id, hub_id, limit_date::date
+        ON CONFLICT (green_angel_id, hub_id, day) DO UPDATE SET
+            total = sla_rollup.total + EXCLUDED.total,
+            on_time = sla_rollup.on_time + EXCLUDED.on_time,
+            late = sla_rollup.late + EXCLUDED.late,
+            pending = sla_rollup.pending + EXCLUDED.pending,
+            updated_at = NOW()
+    )
+    SELECT count(*) FROM inserted
+"""
+
+# Committed together with each batch, so a checkpoint exists only for rows that landed
+INSERT_CHECKPOINT_SQL = """
+    INSERT INTO csv_import_batches (file_hash, job_id, start_offset, end_offset, first_row, rows, inserted, rejected, committed_at)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW())
+    ON CONFLICT (file_hash, job_id, start_offset) DO UPDATE SET
+        end_offset = EXCLUDED.end_offset,
+        first_row = EXCLUDED.first_row,
+        rows = EXCLUDED.rows,
+        inserted = EXCLUDED.inserted,
+        rejected = EXCLUDED.rejected,
+        committed_at = NOW()
+"""
+
+SELECT_CHECKPOINTS_SQL = """
+    SELECT start_offset, end_offset, first_row + rows FROM csv_import_batches
+    WHERE file_hash = %s AND job_id = %s ORDER BY start_offset
+"""
+
+DELETE_CHECKPOINTS_SQL = "DELETE FROM csv_import_batches WHERE file_hash = %s AND job_id = %s"
+
+# On resume the batches after the committed prefix are read again, with new
+# boundaries; their old checkpoints would count those rows a second time
+DELETE_CHECKPOINTS_FROM_SQL = "DELETE FROM csv_import_batches WHERE file_hash = %s AND job_id = %s AND start_offset >= %s"
+
+# Tried in order on the values still unparsed; whatever remains goes through
+# pandas' per-value 'mixed' inference before being rejected
+DATE_FORMATS = ['%Y-%m-%d %H:%M:%S', '%d/%m/%Y %H:%M', '%d/%m/%Y %H:%M:%S']
+
+def normalize_dates(column):
+    """Parses a whole date column at once.
+
+    Returns the parsed column and a mask of the values no format understood.
+    Blank and '-' cells are missing dates, not rejects.
+    """
+    values = column.astype('string').str.strip()
+    blank = (values.isna() | values.isin(['', '-'])).fillna(True)
+    values = values.astype(object)
+
+    parsed = pd.Series(pd.NaT, index=column.index, dtype='datetime64[ns]')
+    for date_format in DATE_FORMATS + ['mixed']:
+        pending = parsed.isna() & ~blank
+        if not pending.any():
+            break
+        parsed[pending] = pd.to_datetime(values[pending], format=date_format, dayfirst=True, errors='coerce')
+
+    return parsed, parsed.isna() & ~blank
+
+class DimensionCache:
+    """Green angel and hub ids by name, and the known client ids, kept across batches.
+
+    Only values missing from the cache reach Postgres, so the dimension
+    upserts grow with the distinct new names instead of the CSV rows.
+    """
+
+    def __init__(self):
+        self.green_angels = {}
+        self.hubs = {}
+        self.clients = set()
+        self.lock = threading.Lock()
+
+    def warm(self, cur):
+        cur.execute("SELECT name, id FROM green_angels")
+        self.green_angels.update(cur.fetchall())
+        cur.execute("SELECT name, id FROM hubs")
+        self.hubs.update(cur.fetchall())
+        cur.execute("SELECT id FROM clients")
+        self.clients.update(row[0] for row in cur.fetchall())
+
+    def _resolve_names(self, cur, table, ids, names):
+        missing = [name for name in names.dropna().unique().tolist() if name not in ids]
+        if missing:
+            cur.execute(INSERT_NAMES_SQL.format(table=table), (missing,))
+            cur.execute(SELECT_NAMES_SQL.format(table=table), (missing,))
+            ids.update(cur.fetchall())
+        return len(missing)
+
+    def resolve(self, conn, batch_df):
+        """Creates the dimension rows this batch needs and the cache lacks.
+
+        They are committed on their own so a failed batch cannot leave ids in
+        the cache that were rolled back. Returns how many values were new.
+        """
+        with self.lock, conn.cursor() as cur:
+            new = self._resolve_names(cur, 'green_angels', self.green_angels, batch_df['angel'])
+            new += self._resolve_names(cur, 'hubs', self.hubs, batch_df['polo'])
+
+            missing = [client for client in batch_df['id_cliente'].dropna().unique().tolist() if client not in self.clients]
+            if missing:
+                cur.execute(INSERT_CLIENTS_SQL, (missing,))
+                self.clients.update(missing)
+            new += len(missing)
+            conn.commit()
+        return new
+
+def _blank(column):
+    """Mask of the cells that are empty or only whitespace."""
+    values = column.astype('string').str.strip()
+    return (values.isna() | (values == '')).fillna(True)
+
+def normalize_ids(column):
+    """Parses an id column; returns it with the masks of missing and of non-integer values."""
+    missing = _blank(column)
+    ids = pd.to_numeric(column.where(~missing), errors='coerce')
+    invalid = ~missing & (ids.isna() | (ids % 1 != 0))
+    return ids.where(~invalid), missing, invalid
+
+def normalize_batch(batch_df):
+    """Types the ids and dates of a batch and splits off the rows that cannot be imported.
+
+    Every row the insert would skip is rejected here, so none is lost
+    silently. Returns the normalized batch and the rejected rows, as read
+    from the CSV plus a reason column.
+    """
+    attendance_id, missing_attendance_id, invalid_attendance_id = normalize_ids(batch_df['id_atendimento'])
+    client_id, missing_client_id, invalid_client_id = normalize_ids(batch_df['id_cliente'])
+    limit_date, invalid_limit_date = normalize_dates(batch_df['data_limite'])
+    attendance_date, invalid_attendance_date = normalize_dates(batch_df['data_de_atendimento'])
+    missing_limit_date = limit_date.isna() & ~invalid_limit_date
+
+    reason = pd.Series(np.select(
+        [missing_attendance_id, invalid_attendance_id, missing_client_id, invalid_client_id,
+         _blank(batch_df['angel']), _blank(batch_df['polo']),
+         invalid_limit_date, missing_limit_date, invalid_attendance_date],
+        ['missing id_atendimento', 'invalid id_atendimento', 'missing id_cliente', 'invalid id_cliente',
+         'missing angel', 'missing polo',
+         'invalid data_limite', 'missing data_limite', 'invalid data_de_atendimento'],
+        default=''
+    ), index=batch_df.index)
+    rejected = reason != ''
+    rejects_df = batch_df[rejected].assign(reason=reason[rejected])
+
+    batch_df = batch_df[~rejected].copy()
+    batch_df['id_atendimento'] = attendance_id[~rejected].astype('Int64')
+    batch_df['id_cliente'] = client_id[~rejected].astype('Int64')
+    batch_df['data_limite'] = limit_date[~rejected]
+    batch_df['data_de_atendimento'] = attendance_date[~rejected]
+    return batch_df, rejects_df
+
+class RejectsFile:
+    """Collects the rejected CSV rows of an import, with their data row number and the reason for each."""
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.rows = 0
+        self.append = append and os.path.isfile(path)
+        self.lock = threading.Lock()
+
+    def discard_from(self, row):
+        """Drops the rejects from data row `row` on, which a resumed import reads again."""
+        if not self.append:
+            return
+        with self.lock:
+            existing = pd.read_csv(self.path, sep=';', dtype=str, keep_default_na=False)
+            if 'row' not in existing.columns:
+                return
+            kept = existing[existing['row'].astype(int) < row]
+            kept.to_csv(self.path, sep=';', index=False)
+            # An emptied file is rewritten from scratch, header included
+            self.append = not kept.empty
+
+    def write(self, rejects_df):
+        if rejects_df.empty:
+            return
+        with self.lock:
+            rejects_df.to_csv(self.path, sep=';', index=False, header=not (self.rows or self.append),
+                              mode='a' if self.rows or self.append else 'w')
+            self.rows += len(rejects_df)
+
+def _copy_field(column):
+    """Renders a typed column as COPY fields; missing values become empty (NULL) fields."""
+    if column.dtype.kind == 'M':
+        values = np.datetime_as_string(column.to_numpy(), unit='s')
+    else:
+        values = column.to_numpy(dtype='int64', na_value=0).astype(str)
+    return np.where(column.isna().to_numpy(), '', values).tolist()
+
+def to_copy_buffer(batch_df, cache):
+    """Renders a normalized CSV chunk as the COPY payload of attendances_staging.
+
+    Built column by column from the NumPy arrays; only integers and
+    timestamps are copied, so no field ever needs CSV quoting.
+    """
+    fields = [_copy_field(column) for column in [
+        batch_df['id_atendimento'],
+        batch_df['id_cliente'],
+        batch_df['angel'].map(cache.green_angels).astype('Int64'),
+        batch_df['polo'].map(cache.hubs).astype('Int64'),
+        batch_df['data_limite'],
+        batch_df['data_de_atendimento'],
+    ]]
+    return io.StringIO(''.join(line + '\n' for line in map(','.join, zip(*fields))))
+
+def load_batch(cur, buffer):
+    """Copies one batch into staging and inserts it; returns the attendances inserted."""
+    cur.execute(CREATE_STAGING_SQL)
+    cur.copy_expert(COPY_STAGING_SQL, buffer)
+    cur.execute(INSERT_ATTENDANCES_SQL)
+    return cur.fetchone()[0]
 
-    batch_size = 1000
-    df_iter = pd.read_csv(CSV_FILE_PATH, delimiter=';', chunksize=batch_size)
-    batch_num = 0
+class StageStats:
+    """Rows and busy seconds per pipeline stage, summed over its workers."""
 
-    for batch_df in df_iter:
-        start_time = time.time()
+    STAGES = ['read', 'shape', 'write']
 
-        batch_df['data_limite'] = batch_df['data_limite'].apply(convert_date)
-        batch_df['data_de_atendimento'] = batch_df['data_de_atendimento'].apply(convert_date)
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rows = dict.fromkeys(self.STAGES, 0)
+        self.seconds = dict.fromkeys(self.STAGES, 0.0)
+        self.failed = 0
 
-        green_angels_data = [(row['angel'], True, dt.utcnow(), dt.utcnow()) for index, row in batch_df.iterrows()]
-        hubs_data = [(row['polo'], True, dt.utcnow(), dt.utcnow()) for index, row in batch_df.iterrows()]
-        clients_data = [(row['id_cliente'], True, dt.utcnow(), dt.utcnow()) for index, row in batch_df.iterrows()]
+    def add(self, stage, rows, seconds):
+        with self.lock:
+            self.rows[stage] += rows
+            self.seconds[stage] += seconds
 
-        conn = conn_pool.getconn()
-        cur = conn.cursor()
+    def add_failure(self):
+        with self.lock:
+            self.failed += 1
 
+    def summary(self, elapsed):
+        lines = [f"{'stage':<8}{'rows':>12}{'busy':>10}{'rows/s':>12}"]
+        for stage in self.STAGES:
+            rate = self.rows[stage] / self.seconds[stage] if self.seconds[stage] else 0
+            lines.append(f"{stage:<8}{self.rows[stage]:>12}{self.seconds[stage]:>9.1f}s{rate:>12.0f}")
+        rate = self.rows['write'] / elapsed if elapsed else 0
+        lines.append(f"{'total':<8}{self.rows['write']:>12}{elapsed:>9.1f}s{rate:>12.0f}")
+        if self.failed:
+            lines.append(f"{self.failed} batches failed")
+        return "\n".join(lines)
+
+class BatchSizer:
+    """Chooses the size of the next chunk so a batch commits in about `target` seconds.
+
+    Every committed batch updates a smoothed rows-per-second estimate of the
+    writers under the current database load; the next size is that rate
+    times the target, moving at most 2x per step and kept in [minimum, maximum].
+    """
+
+    SMOOTHING = 0.3
+
+    def __init__(self, minimum, maximum, target):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target = target
+        self.size = minimum
+        self.rate = None
+        self.lock = threading.Lock()
+
+    def observe(self, rows, seconds):
+        if not rows or seconds <= 0:
+            return
+        with self.lock:
+            rate = rows / seconds
+            self.rate = rate if self.rate is None else self.rate + self.SMOOTHING * (rate - self.rate)
+            size = min(max(self.rate * self.target, self.size / 2), self.size * 2)
+            self.size = int(min(max(size, self.minimum), self.maximum))
+
+def shape_batch(batch_df):
+    """Runs in the process pool: the CPU-bound part of a batch."""
+    start_time = time.perf_counter()
+    batch_df, rejects_df = normalize_batch(batch_df)
+    return batch_df, rejects_df, time.perf_counter() - start_time
+
+class Batch(NamedTuple):
+    num: int
+    start_offset: int
+    end_offset: int
+    first_row: int
+    rows: int
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as csv_file:
+        for block in iter(lambda: csv_file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def read_batches(path, sizer, start_offset=None, first_row=0):
+    """Yields (Batch, DataFrame) for consecutive chunks of the CSV, from start_offset on.
+
+    Lines are read raw so each batch knows the byte range it came from, which
+    is what the checkpoints record and what --resume seeks back to.
+    """
+    with open(path, 'rb') as csv_file:
+        header = csv_file.readline()
+        columns = header.decode('utf-8-sig').strip().split(';')
+        offset = start_offset or len(header)
+        csv_file.seek(offset)
+
+        batch_num = 0
+        while True:
+            lines = list(itertools.islice(csv_file, sizer.size))
+            if not lines:
+                return
+            data = b''.join(lines)
+            batch = Batch(batch_num, offset, offset + len(data), first_row, len(lines))
+            yield batch, pd.read_csv(io.BytesIO(data), delimiter=';', header=None, names=columns)
+
+            offset = batch.end_offset
+            first_row += batch.rows
+            batch_num += 1
+
+class CsvImporter:
+    """Imports one CSV through a reader -> shaping processes -> writer threads pipeline.
+
+    The queue between the reader and the writers is bounded, so the reader
+    (and the shaping it submits) blocks when the writers fall behind. Each
+    chunk is read with the size the BatchSizer currently asks for.
+
+    Every batch commits together with its checkpoint row in
+    csv_import_batches, keyed by the file hash, the import job (job_id, ''
+    from the command line) and the batch byte range.
+    With resume=True the import seeks straight past the contiguous run of
+    committed batches. Batches whose write fails are retried once the file
+    has been read; those still failing are left unchecked for the next resume.
+    """
+
+    def __init__(self, csv_path, workers=4, shapers=None, warm_cache=False, rejects_path=None,
+                 min_batch=1000, max_batch=50000, target_seconds=2.0, resume=False, retries=3, file_hash=None, job_id=''):
+        self.csv_path = csv_path
+        self.workers = workers
+        self.shapers = shapers
+        self.warm_cache = warm_cache
+        self.resume = resume
+        self.retries = retries
+
+        self.cache = DimensionCache()
+        self.stats = StageStats()
+        self.sizer = BatchSizer(min_batch, max_batch, target_seconds)
+        self.rejects = RejectsFile(rejects_path or os.path.splitext(csv_path)[0] + '_rejects.csv', append=resume)
+        self.batches = queue.Queue(maxsize=workers * 2)
+        self.retry_queue = queue.Queue()
+        self.file_hash = file_hash
+        self.job_id = job_id
+        self.conn_pool = None
+
+    def run(self):
+        # Owned by this import alone: one connection per writer plus one for
+        # the setup and the retries, closed once every writer has finished.
+        # Opened here, so the shaping processes never open connections.
+        self.conn_pool = pool.ThreadedConnectionPool(1, self.workers + 1, SQLALCHEMY_DATABASE_URI)
         try:
-            # Process the batch in the database
-            green_angel_ids = {}
-            for data in green_angels_data:
-                cur.execute(
-                    "INSERT INTO green_angels (name, is_active, created_at, updated_at) VALUES (%s, %s, %s, %s) ON CONFLICT (name) DO UPDATE SET updated_at = NOW() RETURNING id, name",
-                    data)
-                result = cur.fetchone()
-                green_angel_ids[result[1]] = result[0]
-
-            hub_ids = {}
-            for data in hubs_data:
-                cur.execute(
-                    "INSERT INTO hubs (name, is_active, created_at, updated_at) VALUES (%s, %s, %s, %s) ON CONFLICT (name) DO UPDATE SET updated_at = NOW() RETURNING id, name",
-                    data)
-                result = cur.fetchone()
-                hub_ids[result[1]] = result[0]
-
-            client_ids = {}
-            for data in clients_data:
-                cur.execute(
-                    "INSERT INTO clients (id, is_active, created_at, updated_at) VALUES (%s, %s, %s, %s) ON CONFLICT (id) DO UPDATE SET updated_at = NOW() RETURNING id",
-                    data)
-                result = cur.fetchone()
-                client_ids[result[0]] = result[0]
-
-            attendances_data = [(row['id_atendimento'], client_ids.get(row['id_cliente']), green_angel_ids.get(row['angel']),
-                                 hub_ids.get(row['polo']), row['data_limite'],
-                                 row['data_de_atendimento'], True, dt.utcnow(), dt.utcnow()) for index, row in batch_df.iterrows()]
-
-            # Filter out rows with null green_angel_id, hub_id, or client_id
-            attendances_data = [data for data in attendances_data if data[1] is not None and data[2] is not None and data[3] is not None]
-
-            cur.executemany(
-                "INSERT INTO attendances (id, client_id, green_angel_id, hub_id, limit_date, attendance_date, is_active, created_at, updated_at) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT DO NOTHING",
-                attendances_data)
+            return self._run()
+        finally:
+            self.conn_pool.closeall()
 
+    def _run(self):
+        start_time = time.perf_counter()
+        self.file_hash = self.file_hash or hash_file(self.csv_path)
+
+        conn = self.conn_pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                start_offset, first_row = self._start_point(cur)
+                if self.resume:
+                    self.rejects.discard_from(first_row)
+                if self.warm_cache:
+                    self.cache.warm(cur)
+                    print(f"Cache warmed with {len(self.cache.green_angels)} green angels, {len(self.cache.hubs)} hubs and {len(self.cache.clients)} clients.")
             conn.commit()
-        except Exception as e:
-            print(f"Error processing batch {batch_num}: {e}")
-            conn.rollback()
         finally:
-            cur.close()
-            conn_pool.putconn(conn)
+            self.conn_pool.putconn(conn)
+        if first_row:
+            print(f"Resuming at row {first_row} (byte {start_offset}).")
 
-        # Evaluate the processing time of the batch
-        elapsed_time = time.time() - start_time
-        print(f"Processed batch {batch_num} with {len(batch_df)} rows in {elapsed_time:.2f} seconds.")
+        writers = [threading.Thread(target=self._write_batches) for _ in range(self.workers)]
+        for writer in writers:
+            writer.start()
 
-        # Dynamically adjust the batch size (optional)
-        if elapsed_time < 1:
-            batch_size = min(batch_size + 1000, 10000)  # Gradually increase the batch size
-        elif elapsed_time > 5:
-            batch_size = max(batch_size - 500, 500)  # Reduce the batch size if too slow
+        # Spawned, not forked: the writer threads (and a web server, when run
+        # from the import endpoint) are already running in this process
+        with ProcessPoolExecutor(max_workers=self.shapers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            try:
+                reader = read_batches(self.csv_path, self.sizer, start_offset, first_row)
+                while True:
+                    read_start = time.perf_counter()
+                    item = next(reader, None)
+                    if item is None:
+                        break
+                    batch, batch_df = item
+                    self.stats.add('read', len(batch_df), time.perf_counter() - read_start)
 
-        batch_num += 1
+                    self.batches.put((batch, executor.submit(shape_batch, batch_df)))
+            finally:
+                for _ in writers:
+                    self.batches.put(None)
+                for writer in writers:
+                    writer.join()
+
+        self._retry_failed()
+
+        print(self.stats.summary(time.perf_counter() - start_time))
+        print(f"Final batch size: {self.sizer.size} rows")
+        if self.rejects.rows:
+            print(f"{self.rejects.rows} rows rejected, see {self.rejects.path}")
+        return self.stats
+
+    def _start_point(self, cur):
+        """Byte offset and row to start reading from: the end of the committed prefix on resume."""
+        if not self.resume:
+            cur.execute(DELETE_CHECKPOINTS_SQL, (self.file_hash, self.job_id))
+            return None, 0
+
+        with open(self.csv_path, 'rb') as csv_file:
+            offset, next_row = len(csv_file.readline()), 0
+        cur.execute(SELECT_CHECKPOINTS_SQL, (self.file_hash, self.job_id))
+        for start_offset, end_offset, end_row in cur.fetchall():
+            if start_offset > offset:
+                break
+            if end_offset > offset:
+                offset, next_row = end_offset, end_row
+        # Committed by run() together with the lookup above
+        cur.execute(DELETE_CHECKPOINTS_FROM_SQL, (self.file_hash, self.job_id, offset))
+        return offset, next_row
+
+    def _write(self, conn, batch, batch_df, rejected):
+        start_time = time.perf_counter()
+        self.cache.resolve(conn, batch_df)
+        with conn.cursor() as cur:
+            inserted = load_batch(cur, to_copy_buffer(batch_df, self.cache))
+            cur.execute(INSERT_CHECKPOINT_SQL, (
+                self.file_hash, self.job_id, batch.start_offset, batch.end_offset, batch.first_row, batch.rows, inserted, rejected
+            ))
+        conn.commit()
+
+        elapsed_time = time.perf_counter() - start_time
+        self.stats.add('write', len(batch_df), elapsed_time)
+        self.sizer.observe(len(batch_df), elapsed_time)
+        print(f"Processed batch {batch.num} (rows {batch.first_row}-{batch.first_row + batch.rows - 1}) "
+              f"with {len(batch_df)} rows ({inserted} new) in {elapsed_time:.2f} seconds.")
+
+    def _write_batches(self):
+        """Writer worker: commits shaped batches on its own pooled connection.
+
+        Batches are taken in whatever order shaping finishes; ON CONFLICT makes
+        every write idempotent, so the order they land in does not matter.
+        """
+        conn = self.conn_pool.getconn()
+        try:
+            while True:
+                item = self.batches.get()
+                if item is None:
+                    return
+                batch, future = item
+                # A writer that dies leaves the reader, and the sentinels, blocked on
+                # the full queue: whatever goes wrong, the batch is counted and it goes on
+                try:
+                    batch_df, rejects_df, shape_seconds = future.result()
+                    self.stats.add('shape', len(batch_df) + len(rejects_df), shape_seconds)
+                    # Read from the CSV with a 0-based index, so index + first_row is the data row
+                    self.rejects.write(rejects_df.assign(row=rejects_df.index + batch.first_row))
+
+                    try:
+                        self._write(conn, batch, batch_df, len(rejects_df))
+                    except Exception as e:
+                        print(f"Error processing batch {batch.num}, queued for retry: {e}")
+                        conn.rollback()
+                        self.retry_queue.put((batch, batch_df, len(rejects_df)))
+                except Exception as e:
+                    print(f"Error processing batch {batch.num}, not imported: {e}")
+                    self.stats.add_failure()
+        finally:
+            self.conn_pool.putconn(conn)
+
+    def _retry_failed(self):
+        conn = self.conn_pool.getconn()
+        try:
+            for attempt in range(1, self.retries + 1):
+                failed = []
+                while not self.retry_queue.empty():
+                    failed.append(self.retry_queue.get())
+                if not failed:
+                    return
+
+                time.sleep(min(2 ** attempt, 30))
+                print(f"Retrying {len(failed)} batches (attempt {attempt} of {self.retries})...")
+                for batch, batch_df, rejected in failed:
+                    try:
+                        self._write(conn, batch, batch_df, rejected)
+                    except Exception as e:
+                        print(f"Error retrying batch {batch.num}: {e}")
+                        conn.rollback()
+                        self.retry_queue.put((batch, batch_df, rejected))
+
+            while not self.retry_queue.empty():
+                batch, _, _ = self.retry_queue.get()
+                print(f"Batch {batch.num} (rows {batch.first_row}-{batch.first_row + batch.rows - 1}) was not imported; run again with --resume.")
+                self.stats.add_failure()
+        finally:
+            self.conn_pool.putconn(conn)
+
+def import_csv(csv_path=CSV_FILE_PATH, **options):
+    if not os.path.isfile(csv_path):
+        print("CSV file not found!")
+        return
+    CsvImporter(csv_path, **options).run()
 
 def seed_users():
-    conn = conn_pool.getconn()
+    conn = psycopg2.connect(SQLALCHEMY_DATABASE_URI)
     cur = conn.cursor()
 
     pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -118,17 +594,39 @@ def seed_users():
 
     conn.commit()
     cur.close()
-    conn_pool.putconn(conn)
+    conn.close()
 
-def run_import_csv_in_background():
-    thread = threading.Thread(target=import_csv)
+def run_import_csv_in_background(**options):
+    thread = threading.Thread(target=import_csv, kwargs=options)
     thread.start()
     return thread
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seeds the admin user and imports the attendances CSV.")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="writer threads, each holding its own database connection")
+    parser.add_argument('--shapers', type=int, default=None,
+                        help="processes normalising the batches (default: one per CPU)")
+    parser.add_argument('--warm-cache', action='store_true',
+                        help="load the existing green angel, hub and client ids before the first batch")
+    parser.add_argument('--rejects', default=None,
+                        help="file receiving the rows that could not be imported (default: <csv>_rejects.csv)")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue a previous import of the same file after its last committed batch")
+    parser.add_argument('--retries', type=int, default=3, help="attempts for batches whose write failed")
+    parser.add_argument('--min-batch', type=int, default=1000, help="smallest batch, in rows")
+    parser.add_argument('--max-batch', type=int, default=50000, help="largest batch, in rows")
+    parser.add_argument('--target-seconds', type=float, default=2.0,
+                        help="commit latency the batch size is adjusted towards")
+    args = parser.parse_args()
+
     print("Seeding users...")
     seed_users()
     print("Users seeded successfully!")
     print("Importing CSV data in batches...")
-    run_import_csv_in_background()
+    run_import_csv_in_background(
+        workers=args.workers, shapers=args.shapers, warm_cache=args.warm_cache, rejects_path=args.rejects,
+        min_batch=args.min_batch, max_batch=args.max_batch, target_seconds=args.target_seconds,
+        resume=args.resume, retries=args.retries
+    ).join()
     print("CSV data imported successfully!")
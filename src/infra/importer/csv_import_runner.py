@@ -0,0 +1,75 @@
+import hashlib
+import itertools
+import os
+import tempfile
+import zlib
+from typing import BinaryIO, Iterator
+
+from src.domain.exception.domain_exception import DomainException
+from src.domain.exception.error_code import ErrorCode
+from src.domain.repository.import_job import IImportRunner
+
+CHUNK_SIZE = 1 << 20
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _decompressed(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Gunzips a stream of chunks, never inflating more than CHUNK_SIZE at a time."""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        while chunk:
+            yield decompressor.decompress(chunk, CHUNK_SIZE)
+            chunk = decompressor.unconsumed_tail
+    yield decompressor.flush()
+    if not decompressor.eof:
+        raise zlib.error('truncated gzip stream')
+
+
+class CsvImportRunner(IImportRunner):
+    """Spools uploaded CSVs where the importer process (CsvImportWorker) reads them.
+
+    The import itself never runs in a web worker, where gunicorn's
+    timeouts and worker recycling would cut it short.
+    """
+
+    def __init__(self, spool_dir: str = None):
+        self.spool_dir = spool_dir
+        if spool_dir:
+            os.makedirs(spool_dir, exist_ok=True)
+
+    def spool(self, stream: BinaryIO) -> tuple[str, str, int]:
+        """Copies an upload to a temporary CSV file in fixed-size chunks.
+
+        Gzip bodies are detected by their magic bytes and inflated on the fly.
+        Returns the file path, the SHA-256 of the CSV and the bytes received.
+        """
+        received = 0
+
+        def chunks():
+            nonlocal received
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+                received += len(chunk)
+                yield chunk
+
+        body = chunks()
+        first = next(body, b'')
+        body = itertools.chain([first], body)
+        if first.startswith(GZIP_MAGIC):
+            body = _decompressed(body)
+
+        digest = hashlib.sha256()
+        fd, path = tempfile.mkstemp(prefix='attendances_import_', suffix='.csv', dir=self.spool_dir)
+        try:
+            with os.fdopen(fd, 'wb') as csv_file:
+                for data in body:
+                    digest.update(data)
+                    csv_file.write(data)
+                written = csv_file.tell()
+        except zlib.error:
+            os.remove(path)
+            raise DomainException(ErrorCode.INVALID_IMPORT_FILE)
+
+        if not written:
+            os.remove(path)
+            raise DomainException(ErrorCode.INVALID_IMPORT_FILE)
+        return path, digest.hexdigest(), received
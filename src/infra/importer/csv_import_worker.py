@@ -0,0 +1,97 @@
+"""Importer process: runs the queued CSV import jobs, outside the web workers.
+
+    PYTHONPATH=. python -m src.infra.importer.csv_import_worker
+"""
+import logging
+import os
+import threading
+from datetime import datetime as dt
+
+from src.domain.entities.import_job import ImportJob
+from src.infra.config.config import get_settings
+from src.infra.database.database import SessionLocal
+from src.infra.database.seeder.seed_from_csv import CsvImporter
+from src.infra.repository.import_job import ImportJobRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CsvImportWorker:
+    """Runs queued import jobs one at a time through the seeder's CsvImporter.
+
+    Jobs still running when a previous importer was stopped or killed are
+    requeued at start and resume after their last committed batch. Run a
+    single importer per database.
+    """
+
+    def __init__(self, poll_seconds: int = 2, workers: int = 4):
+        self.poll_seconds = poll_seconds
+        self.workers = workers
+        self.stopped = threading.Event()
+
+    def run(self):
+        db = SessionLocal()
+        try:
+            requeued = ImportJobRepository(db).requeue_running()
+        finally:
+            db.close()
+        if requeued:
+            logger.info('requeued %s interrupted import jobs', requeued)
+
+        while not self.stopped.is_set():
+            if not self.run_next():
+                self.stopped.wait(self.poll_seconds)
+
+    def stop(self):
+        self.stopped.set()
+
+    def run_next(self) -> bool:
+        """Runs the oldest queued job; False when there was none."""
+        db = SessionLocal()
+        try:
+            import_job_repository = ImportJobRepository(db)
+            job = import_job_repository.claim_next()
+            if job is None:
+                return False
+            self._import(import_job_repository, job)
+            return True
+        finally:
+            db.close()
+
+    def _import(self, import_job_repository: ImportJobRepository, job: ImportJob):
+        job.rejects_path = os.path.splitext(job.file_path)[0] + '_rejects.csv'
+        import_job_repository.save(job)
+        try:
+            # A requeued job continues after its committed batches, a new one has none yet
+            stats = CsvImporter(job.file_path, workers=self.workers, rejects_path=job.rejects_path, resume=True,
+                                file_hash=job.file_hash, job_id=job.id).run()
+            if stats.failed:
+                job.status = 'partial'
+                job.error = f"{stats.failed} batches could not be imported"
+            else:
+                job.status = 'completed'
+        except Exception as e:
+            import_job_repository.db.rollback()
+            logger.exception('import job %s failed', job.id)
+            job.status = 'failed'
+            job.error = str(e)
+
+        # Not reached when the process is interrupted: the job stays running
+        # with its files, to be requeued and resumed by the next importer
+        if not os.path.exists(job.rejects_path):
+            job.rejects_path = None
+        if job.status == 'completed':
+            # Partial and failed jobs keep the upload, to look into or import again
+            os.remove(job.file_path)
+            job.file_path = None
+        job.finished_at = dt.utcnow()
+        import_job_repository.save(job)
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    settings = get_settings()
+    CsvImportWorker(settings.IMPORT_POLL_SECONDS, settings.IMPORT_WORKERS).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,21 @@
 from dependency_injector import containers, providers
 
-from src.infra.database.database import get_db
+from src.infra.config.config import get_settings
+from src.infra.database.database import ScopedSession
 from src.infra.repository.user import UserRepository
 from src.infra.repository.attendance import AttendanceRepository
 from src.infra.repository.green_angel import GreenAngelRepository
 from src.infra.repository.hub import HubRepository
 from src.infra.repository.client import ClientRepository
+from src.infra.repository.sla_rollup import SlaRollupRepository
+from src.infra.repository.import_job import ImportJobRepository
+from src.infra.importer.csv_import_runner import CsvImportRunner
+from src.infra.scheduler.metric_view_refresher import MetricViewRefresher
 
 from src.application.service.user import UserService
 from src.application.service.auth import AuthService
 from src.application.service.attendance import AttendanceService
+from src.application.service.attendance_import import AttendanceImportService
 from src.application.service.green_angel import GreenAngelService
 from src.application.service.hub import HubService
 from src.application.service.client import ClientService
@@ -17,6 +23,7 @@ from src.application.service.client import ClientService
 from src.interface.web.controller.user import UserController
 from src.interface.web.controller.auth import AuthController
 from src.interface.web.controller.attendance import AttendanceController
+from src.interface.web.controller.attendance_import import AttendanceImportController
 from src.interface.web.controller.green_angel import GreenAngelController
 from src.interface.web.controller.hub import HubController
 from src.interface.web.controller.client import ClientController
@@ -33,7 +40,8 @@ class Container(containers.DeclarativeContainer):
         "src.infra.web_api.routes.client",
         "src.infra.web_api.routes.metrics"
     ])
-    db = providers.Resource(get_db)
+    # Proxy to the current thread's session; main.py removes it at the end of each request
+    db = providers.Object(ScopedSession)
     user_repository = providers.Factory(UserRepository, db=db)
 
     attendance_repository = providers.Factory(AttendanceRepository, db=db)
@@ -44,13 +52,23 @@ class Container(containers.DeclarativeContainer):
 
     client_repository = providers.Factory(ClientRepository, db=db)
 
+    sla_rollup_repository = providers.Factory(SlaRollupRepository, db=db)
+
+    import_job_repository = providers.Factory(ImportJobRepository, db=db)
+
+    import_runner = providers.Singleton(CsvImportRunner, spool_dir=get_settings().IMPORT_SPOOL_DIR)
+
+    metric_view_refresher = providers.Singleton(MetricViewRefresher, interval=get_settings().METRIC_VIEWS_REFRESH_SECONDS)
+
 
     # Providers for services
     auth_service = providers.Factory(AuthService, user_repository=user_repository)
 
     user_service = providers.Factory(UserService, user_repository=user_repository, auth_service=auth_service)
 
-    attendance_service = providers.Factory(AttendanceService, attendance_repository=attendance_repository, green_angel_repository=green_angel_repository, hub_repository=hub_repository, client_repository=client_repository)
+    attendance_service = providers.Factory(AttendanceService, attendance_repository=attendance_repository, green_angel_repository=green_angel_repository, hub_repository=hub_repository, client_repository=client_repository, sla_rollup_repository=sla_rollup_repository)
+
+    attendance_import_service = providers.Factory(AttendanceImportService, import_job_repository=import_job_repository, import_runner=import_runner)
 
     green_angel_service = providers.Factory(GreenAngelService, green_angel_repository=green_angel_repository)
 
@@ -66,6 +84,8 @@ class Container(containers.DeclarativeContainer):
 
     attendance_controller = providers.Factory(AttendanceController, attendance_service=attendance_service)
 
+    attendance_import_controller = providers.Factory(AttendanceImportController, attendance_import_service=attendance_import_service)
+
     green_angel_controller = providers.Factory(GreenAngelController, green_angel_service=green_angel_service)
 
     hub_controller = providers.Factory(HubController, hub_service=hub_service)
@@ -1,23 +1,50 @@
-from typing import Type
+from typing import Type, NamedTuple, Any
+import numpy as np
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
-from sqlalchemy import Integer
+from sqlalchemy import func, insert, update, values, column, cast
+from sqlalchemy import Integer, DateTime
 from sqlalchemy.sql.expression import desc
-from datetime import datetime as dt, timedelta
-
-from workalendar.america import Brazil
+from datetime import datetime as dt, date, timedelta
 
 from src.domain.entities.attendance import Attendance
 from src.domain.entities.green_angel import GreenAngel
 from src.domain.entities.hub import Hub
+from src.domain.entities.sla_rollup import SlaRollup
+from src.domain.entities.metric_view import MetricViewRefresh, SlaByGreenAngelView, SlaByHubView, ProductivityDailyView
 from src.domain.repository.attendance import IAttendanceRepository
+from src.infra.repository.pagination import paginate, encode_cursor, decode_cursor, apply_keyset
+from src.infra.repository.search import name_filter
+from src.infra.repository.timeseries import INTERVALS, date_bucket, bucket_ends
+from src.infra.repository.working_days import calendar_for
+
+# Filters that sla_rollup cannot answer because they are not part of its key
+LIVE_SLA_FILTERS = ['client_id', 'attendance_date', 'limit_date']
+
+SLA_ORDER_BY = ['id', 'name', 'total', 'on_time', 'late', 'on_time_percentage']
+
+
+class SlaSource(NamedTuple):
+    table: Any
+    green_angel_id: Any
+    hub_id: Any
+    day: Any
+    total: Any
+    on_time: Any
+    late: Any
+    not_attended: Any
+    criteria: list
+
+
+def _parse_day(value: str) -> date:
+    # Accepts both the date and the datetime format used by the other metric filters
+    return dt.strptime(value[:10], '%Y-%m-%d').date()
 
 
 class AttendanceRepository(IAttendanceRepository):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_attendances_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc') -> dict:
+    def get_attendances_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc', pagination: str = 'offset', cursor: str = None, count_mode: str = 'exact') -> dict:
         query = self.db.query(Attendance).options(
             joinedload(Attendance.green_angel),
             joinedload(Attendance.hub),
@@ -30,11 +57,11 @@ class AttendanceRepository(IAttendanceRepository):
             if 'green_angel_id' in filters and filters['green_angel_id']:
                 query = query.filter(Attendance.green_angel_id == filters['green_angel_id'])
             if 'green_angel_name' in filters and filters['green_angel_name']:
-                query = query.join(Attendance.green_angel).filter(GreenAngel.name.ilike(f"%{filters['green_angel_name']}%"))
+                query = query.join(Attendance.green_angel).filter(name_filter(self.db, GreenAngel.name, filters['green_angel_name'], filters.get('search_mode', 'contains')))
             if 'hub_id' in filters and filters['hub_id']:
                 query = query.filter(Attendance.hub_id == filters['hub_id'])
             if 'hub_name' in filters and filters['hub_name']:
-                query = query.join(Attendance.hub).filter(Hub.name.ilike(f"%{filters['hub_name']}%"))
+                query = query.join(Attendance.hub).filter(name_filter(self.db, Hub.name, filters['hub_name'], filters.get('search_mode', 'contains')))
             if 'attendance_date' in filters and filters['attendance_date']:
                 query = query.filter(Attendance.attendance_date == filters['attendance_date'])
             if 'limit_date' in filters and filters['limit_date']:
@@ -46,43 +73,20 @@ class AttendanceRepository(IAttendanceRepository):
         if order_by not in allowed_order_by:
             order_by = 'id'
 
+        if order_direction != 'desc':
+            order_direction = 'asc'
+
+        if pagination == 'cursor' or cursor:
+            return self._get_attendances_by_cursor(query, per_page, order_by, order_direction, cursor)
+
         if order_direction == 'desc':
             query = query.order_by(getattr(Attendance, order_by).desc())
         else:
             query = query.order_by(getattr(Attendance, order_by))
 
-        total = self.db.query(Attendance).count()
         page = page if page > 0 else 1
-        attendances = query.offset((page - 1) * per_page).limit(per_page).all()
-
-        items = []
-        for attendance in attendances:
-            item = {
-                'id': attendance.id,
-                'client_id': attendance.client_id,
-                'green_angel_id': attendance.green_angel_id,
-                'green_angel': {
-                    'id': attendance.green_angel.id,
-                    'name': attendance.green_angel.name,
-                    'is_active': attendance.green_angel.is_active
-                },
-                'hub_id': attendance.hub_id,
-                'hub': {
-                    'id': attendance.hub.id,
-                    'name': attendance.hub.name,
-                    'is_active': attendance.hub.is_active
-                },
-                'client': {
-                    'id': attendance.client.id,
-                    'is_active': attendance.client.is_active
-                },
-                'limit_date': attendance.limit_date,
-                'attendance_date': attendance.attendance_date,
-                'is_active': attendance.is_active,
-                'created_at': attendance.created_at,
-                'updated_at': attendance.updated_at
-            }
-            items.append(item)
+        attendances, total = paginate(query, page, per_page, count_mode)
+        items = [self._serialize_attendance(attendance) for attendance in attendances]
 
         return {
             'size': len(items),
@@ -92,8 +96,86 @@ class AttendanceRepository(IAttendanceRepository):
             'items': items
         }
 
-    def find_by_id(self, attendance_id: int) -> Type[Attendance]:
-        return self.db.query(Attendance).filter(Attendance.id == attendance_id, Attendance.is_active == True).first()
+    def _get_attendances_by_cursor(self, query, per_page: int, order_by: str, order_direction: str, cursor: str = None) -> dict:
+        column = getattr(Attendance, order_by)
+
+        if cursor:
+            cursor_value, last_id = decode_cursor(cursor, order_by, order_direction)
+            query = apply_keyset(query, column, Attendance.id, order_direction, cursor_value, last_id)
+
+        # id breaks ties so the (column, id) pair is unique and the seek never skips rows;
+        # NULL placement is pinned to the Postgres default so apply_keyset agrees with it
+        if order_direction == 'desc':
+            query = query.order_by(column.desc().nulls_first(), Attendance.id.desc())
+        else:
+            query = query.order_by(column.asc().nulls_last(), Attendance.id)
+
+        # Fetch one extra row to know whether there is a next page without counting
+        attendances = query.limit(per_page + 1).all()
+        has_next = len(attendances) > per_page
+        attendances = attendances[:per_page]
+
+        next_cursor = None
+        if has_next:
+            last = attendances[-1]
+            next_cursor = encode_cursor(order_by, order_direction, getattr(last, order_by), last.id)
+
+        items = [self._serialize_attendance(attendance) for attendance in attendances]
+
+        return {
+            'size': len(items),
+            'total_pages': None,
+            'page': None,
+            'per_page': per_page,
+            'next_cursor': next_cursor,
+            'items': items
+        }
+
+    @staticmethod
+    def _serialize_attendance(attendance: Attendance) -> dict:
+        return {
+            'id': attendance.id,
+            'client_id': attendance.client_id,
+            'green_angel_id': attendance.green_angel_id,
+            'green_angel': {
+                'id': attendance.green_angel.id,
+                'name': attendance.green_angel.name,
+                'is_active': attendance.green_angel.is_active
+            },
+            'hub_id': attendance.hub_id,
+            'hub': {
+                'id': attendance.hub.id,
+                'name': attendance.hub.name,
+                'is_active': attendance.hub.is_active
+            },
+            'client': {
+                'id': attendance.client.id,
+                'is_active': attendance.client.is_active
+            },
+            'limit_date': attendance.limit_date,
+            'attendance_date': attendance.attendance_date,
+            'is_active': attendance.is_active,
+            'created_at': attendance.created_at,
+            'updated_at': attendance.updated_at
+        }
+
+    def _locked(self, query, for_update: bool):
+        # FOR UPDATE holds the rows until the caller commits, so concurrent
+        # writers read them one after the other; populate_existing replaces
+        # any stale copy already in the session with the locked row
+        return query.with_for_update().populate_existing() if for_update else query
+
+    def find_by_id(self, attendance_id: int, for_update: bool = False) -> Type[Attendance]:
+        query = self.db.query(Attendance).filter(Attendance.id == attendance_id, Attendance.is_active == True)
+        return self._locked(query, for_update).first()
+
+    def find_by_ids(self, attendance_ids: set[int], for_update: bool = False) -> list[Attendance]:
+        # Inactive rows are returned too, so callers can tell deleted from missing
+        if not attendance_ids:
+            return []
+        # Locked in id order, so two overlapping bulk requests cannot deadlock
+        query = self.db.query(Attendance).filter(Attendance.id.in_(attendance_ids)).order_by(Attendance.id)
+        return self._locked(query, for_update).all()
 
     def save(self, attendance: Attendance) -> Attendance:
         self.db.add(attendance)
@@ -101,78 +183,208 @@ class AttendanceRepository(IAttendanceRepository):
         self.db.refresh(attendance)
         return attendance
 
+    def bulk_insert(self, rows: list[dict]) -> list[int]:
+        """Insert many attendances in one multi-row INSERT and commit; returns ids in row order."""
+        if not rows:
+            return []
+        now = dt.utcnow()
+        rows = [{**row, 'created_at': now, 'updated_at': now} for row in rows]
+        ids = self.db.scalars(insert(Attendance).returning(Attendance.id, sort_by_parameter_order=True), rows).all()
+        self.db.commit()
+        return ids
+
+    def bulk_update(self, rows: list[dict]):
+        """Write the full mutable state of many attendances with one UPDATE ... FROM (VALUES ...) and commit."""
+        if not rows:
+            return
+        changes = values(
+            column('id', Integer), column('green_angel_id', Integer), column('hub_id', Integer),
+            column('limit_date', DateTime), column('attendance_date', DateTime),
+            name='changes'
+        ).data([
+            (row['id'], row['green_angel_id'], row['hub_id'], row['limit_date'], row['attendance_date']) for row in rows
+        ])
+        self.db.execute(
+            update(Attendance)
+            .where(Attendance.id == changes.c.id)
+            .values(
+                green_angel_id=changes.c.green_angel_id,
+                hub_id=changes.c.hub_id,
+                limit_date=changes.c.limit_date,
+                # An all-NULL VALUES column would otherwise be typed as text
+                attendance_date=cast(changes.c.attendance_date, DateTime),
+                updated_at=dt.utcnow()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+
+    def bulk_deactivate(self, attendance_ids: set[int]):
+        if not attendance_ids:
+            return
+        self.db.execute(
+            update(Attendance)
+            .where(Attendance.id.in_(attendance_ids))
+            .values(is_active=False, updated_at=dt.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+
     def delete(self, attendance: Attendance) -> Attendance:
         self.db.delete(attendance)
         self.db.commit()
         return attendance
 
-    def get_sla_metrics(self) -> dict:
-        query = self.db.query(Attendance).filter(Attendance.is_active == True)
-        total = query.count()
-        on_time = query.filter(Attendance.attendance_date <= Attendance.limit_date).count()
-        late = total - on_time
-        return {
-            'total': total,
-            'on_time': on_time,
-            'late': late,
-            'on_time_percentage': round((on_time / total) * 100, 2) if total > 0 else 0,
-            'late_percentage': round((late / total) * 100, 2) if total > 0 else 0
-        }
+    def _sla_source(self, filters: dict = None) -> SlaSource:
+        # sla_rollup is keyed by (green_angel_id, hub_id, day); filters on any
+        # other attendance column still have to aggregate the live table
+        if filters and any(filters.get(key) for key in LIVE_SLA_FILTERS):
+            # Every bucket is a FILTER over the same scan, so one pass answers all of them
+            return SlaSource(
+                table=Attendance,
+                green_angel_id=Attendance.green_angel_id,
+                hub_id=Attendance.hub_id,
+                day=Attendance.limit_date,
+                total=func.count(Attendance.id),
+                on_time=func.count(Attendance.id).filter(Attendance.attendance_date <= Attendance.limit_date),
+                late=func.count(Attendance.id).filter(Attendance.attendance_date > Attendance.limit_date),
+                not_attended=func.count(Attendance.id).filter(Attendance.attendance_date.is_(None)),
+                criteria=[Attendance.is_active == True]
+            )
+        return SlaSource(
+            table=SlaRollup,
+            green_angel_id=SlaRollup.green_angel_id,
+            hub_id=SlaRollup.hub_id,
+            day=SlaRollup.day,
+            total=func.coalesce(func.sum(SlaRollup.total), 0),
+            on_time=func.coalesce(func.sum(SlaRollup.on_time), 0),
+            late=func.coalesce(func.sum(SlaRollup.late), 0),
+            not_attended=func.coalesce(func.sum(SlaRollup.pending), 0),
+            criteria=[]
+        )
 
-    def get_sla_paginated_by_green_angels(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc') -> dict:
-        query = self.db.query(
-            GreenAngel.id,
-            GreenAngel.name,
-            func.count(Attendance.id).label('total'),
-            func.sum(
-                func.cast(Attendance.attendance_date <= Attendance.limit_date, Integer)
-            ).label('on_time')
-        ).join(Attendance, Attendance.green_angel_id == GreenAngel.id).filter(Attendance.is_active == True)
+    def _sla_view_source(self, view, filters: dict = None, unsupported: list = None) -> SlaSource:
+        # The views only hold lifetime totals per green angel or per hub, so a
+        # date range or a filter on another dimension needs the regular source
+        if not filters or filters.get('freshness') != 'materialized':
+            return None
+        if any(filters.get(key) for key in LIVE_SLA_FILTERS + ['date_from', 'date_to'] + (unsupported or [])):
+            return None
+        return SlaSource(
+            table=view,
+            green_angel_id=view.c.get('green_angel_id'),
+            hub_id=view.c.get('hub_id'),
+            day=None,
+            total=func.coalesce(func.sum(view.c.total), 0),
+            on_time=func.coalesce(func.sum(view.c.on_time), 0),
+            late=func.coalesce(func.sum(view.c.late), 0),
+            not_attended=func.coalesce(func.sum(view.c.not_attended), 0),
+            criteria=[]
+        )
+
+    def _freshness(self, view=None) -> dict:
+        if view is None:
+            return {'freshness': 'live', 'refreshed_at': None}
+        refreshed_at = self.db.query(MetricViewRefresh.refreshed_at).filter(MetricViewRefresh.name == view.name).scalar()
+        return {'freshness': 'materialized', 'refreshed_at': refreshed_at}
 
+    @staticmethod
+    def _sla_order(entity, source: SlaSource, order_by: str, order_direction: str) -> list:
+        if order_by not in SLA_ORDER_BY:
+            order_by = 'id'
+
+        if order_by in ('id', 'name'):
+            key = getattr(entity, order_by)
+        elif order_by == 'on_time_percentage':
+            # Groups with total = 0 are dropped by HAVING, nullif only guards the division
+            key = source.on_time * 100.0 / func.nullif(source.total, 0)
+        else:
+            key = getattr(source, order_by)
+
+        key = key.desc() if order_direction == 'desc' else key.asc()
+        # Ties on an aggregate are broken by id so pages never overlap
+        return [key] if order_by == 'id' else [key, entity.id]
+
+    @staticmethod
+    def _sla_columns(source: SlaSource) -> list:
+        return [
+            source.total.label('total'),
+            source.on_time.label('on_time'),
+            source.late.label('late'),
+            source.not_attended.label('not_attended')
+        ]
+
+    def _apply_sla_filters(self, query, source: SlaSource, filters: dict = None):
         if filters:
-            if 'green_angel_name' in filters and filters['green_angel_name']:
-                query = query.filter(GreenAngel.name.ilike(f"%{filters['green_angel_name']}%"))
+            if 'green_angel_id' in filters and filters['green_angel_id']:
+                query = query.filter(source.green_angel_id == filters['green_angel_id'])
             if 'hub_id' in filters and filters['hub_id']:
-                query = query.filter(Attendance.hub_id == filters['hub_id'])
+                query = query.filter(source.hub_id == filters['hub_id'])
+            # Date range on the day of limit_date, both ends inclusive
+            if 'date_from' in filters and filters['date_from']:
+                query = query.filter(source.day >= _parse_day(filters['date_from']))
+            if 'date_to' in filters and filters['date_to']:
+                query = query.filter(source.day < _parse_day(filters['date_to']) + timedelta(days=1))
             if 'client_id' in filters and filters['client_id']:
                 query = query.filter(Attendance.client_id == filters['client_id'])
             if 'attendance_date' in filters and filters['attendance_date']:
                 query = query.filter(Attendance.attendance_date == filters['attendance_date'])
             if 'limit_date' in filters and filters['limit_date']:
                 query = query.filter(Attendance.limit_date == filters['limit_date'])
+        return query
 
-        # Group by Green Angel
-        query = query.group_by(GreenAngel.id)
+    @staticmethod
+    def _sla_summary(result) -> dict:
+        """Counts and percentages (two decimals) of one SLA aggregate row, shared by every SLA endpoint."""
+        total = result.total
+        return {
+            'total': total,
+            'on_time': result.on_time,
+            'late': result.late,
+            'not_attended': result.not_attended,
+            'on_time_percentage': round((result.on_time / total) * 100, 2) if total > 0 else 0,
+            'late_percentage': round((result.late / total) * 100, 2) if total > 0 else 0,
+            'not_attended_percentage': round((result.not_attended / total) * 100, 2) if total > 0 else 0
+        }
 
-        # Sorting logic
-        allowed_order_by = ['id', 'name', 'total', 'on_time']
-        if order_by not in allowed_order_by:
-            order_by = 'id'
+    def get_sla_metrics(self, filters: dict = None) -> dict:
+        source = self._sla_source(filters)
+        query = self.db.query(*self._sla_columns(source)).select_from(source.table).filter(*source.criteria)
+        return self._sla_summary(self._apply_sla_filters(query, source, filters).one())
 
-        if order_direction == 'desc':
-            query = query.order_by(getattr(GreenAngel, order_by).desc())
-        else:
-            query = query.order_by(getattr(GreenAngel, order_by))
+    def get_sla_paginated_by_green_angels(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc', count_mode: str = 'exact', top_n: int = None) -> dict:
+        view_source = self._sla_view_source(SlaByGreenAngelView, filters, ['hub_id'])
+        source = view_source or self._sla_source(filters)
+        query = self.db.query(
+            GreenAngel.id,
+            GreenAngel.name,
+            *self._sla_columns(source)
+        ).join(source.table, source.green_angel_id == GreenAngel.id).filter(*source.criteria)
 
-        total = self.db.query(GreenAngel).count()
-        page = page if page > 0 else 1
-        sla_data = query.offset((page - 1) * per_page).limit(per_page).all()
+        if filters:
+            if 'green_angel_name' in filters and filters['green_angel_name']:
+                query = query.filter(name_filter(self.db, GreenAngel.name, filters['green_angel_name'], filters.get('search_mode', 'contains')))
+        query = self._apply_sla_filters(query, source, filters)
+
+        # Group by Green Angel, skipping rollup buckets emptied by deletes
+        query = query.group_by(GreenAngel.id).having(source.total > 0)
+
+        query = query.order_by(*self._sla_order(GreenAngel, source, order_by, order_direction))
+
+        if top_n and top_n > 0:
+            # Leaderboards: one LIMIT query, no count
+            sla_data = query.limit(top_n).all()
+            page, per_page, total = 1, top_n, len(sla_data)
+        else:
+            page = page if page > 0 else 1
+            sla_data, total = paginate(query, page, per_page, count_mode)
 
         items = []
         for result in sla_data:
-            green_angel_id = result.id
-            total_count = result.total
-            on_time = result.on_time
-            late = total_count - on_time
-
             sla_metrics = {
-                'green_angel_id': green_angel_id,
+                'green_angel_id': result.id,
                 'green_angel_name': result.name,
-                'total': total_count,
-                'on_time': on_time,
-                'late': late,
-                'on_time_percentage': round((on_time / total_count) * 100) if total_count > 0 else 0,
-                'late_percentage': round((late / total_count) * 100, 2) if total_count > 0 else 0
+                **self._sla_summary(result)
             }
             items.append(sla_metrics)
 
@@ -181,90 +393,60 @@ class AttendanceRepository(IAttendanceRepository):
             'total_pages': (total + per_page - 1) // per_page,
             'page': page,
             'per_page': per_page,
-            'items': items
+            'items': items,
+            **self._freshness(SlaByGreenAngelView if view_source is not None else None)
         }
 
     def find_sla_by_green_angel_id(self, green_angel_id: int) -> dict:
+        source = self._sla_source()
         query = self.db.query(
             GreenAngel.id,
             GreenAngel.name,
-            func.count(Attendance.id).label('total'),
-            func.sum(
-                func.cast(Attendance.attendance_date <= Attendance.limit_date, Integer)
-            ).label('on_time')
-        ).join(Attendance, Attendance.green_angel_id == GreenAngel.id).filter(GreenAngel.id == green_angel_id).filter(Attendance.is_active == True).group_by(GreenAngel.id).first()
+            *self._sla_columns(source)
+        ).join(source.table, source.green_angel_id == GreenAngel.id).filter(GreenAngel.id == green_angel_id).group_by(GreenAngel.id).having(source.total > 0).first()
 
         if not query:
             return None
 
-        total_count = query.total
-        on_time = query.on_time
-        late = total_count - on_time
-
         return {
             'green_angel_id': query.id,
             'green_angel_name': query.name,
-            'total': total_count,
-            'on_time': on_time,
-            'late': late,
-            'on_time_percentage': round((on_time / total_count) * 100) if total_count > 0 else 0,
-            'late_percentage': round((late / total_count) * 100, 2) if total_count > 0 else 0
+            **self._sla_summary(query)
         }
 
-    def get_sla_paginated_by_hubs(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc') -> dict:
+    def get_sla_paginated_by_hubs(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc', count_mode: str = 'exact', top_n: int = None) -> dict:
+        view_source = self._sla_view_source(SlaByHubView, filters, ['green_angel_id'])
+        source = view_source or self._sla_source(filters)
         query = self.db.query(
             Hub.id,
             Hub.name,
-            func.count(Attendance.id).label('total'),
-            func.sum(
-                func.cast(Attendance.attendance_date <= Attendance.limit_date, Integer)
-            ).label('on_time')
-        ).join(Attendance, Attendance.hub_id == Hub.id).filter(Attendance.is_active == True)
+            *self._sla_columns(source)
+        ).join(source.table, source.hub_id == Hub.id).filter(*source.criteria)
 
         if filters:
             if 'hub_name' in filters and filters['hub_name']:
-                query = query.filter(Hub.name.ilike(f"%{filters['hub_name']}%"))
-            if 'green_angel_id' in filters and filters['green_angel_id']:
-                query = query.filter(Attendance.green_angel_id == filters['green_angel_id'])
-            if 'client_id' in filters and filters['client_id']:
-                query = query.filter(Attendance.client_id == filters['client_id'])
-            if 'attendance_date' in filters and filters['attendance_date']:
-                query = query.filter(Attendance.attendance_date == filters['attendance_date'])
-            if 'limit_date' in filters and filters['limit_date']:
-                query = query.filter(Attendance.limit_date == filters['limit_date'])
+                query = query.filter(name_filter(self.db, Hub.name, filters['hub_name'], filters.get('search_mode', 'contains')))
+        query = self._apply_sla_filters(query, source, filters)
 
-        # Group by Hub
-        query = query.group_by(Hub.id)
+        # Group by Hub, skipping rollup buckets emptied by deletes
+        query = query.group_by(Hub.id).having(source.total > 0)
 
-        # Sorting logic
-        allowed_order_by = ['id', 'name', 'total', 'on_time']
-        if order_by not in allowed_order_by:
-            order_by = 'id'
+        query = query.order_by(*self._sla_order(Hub, source, order_by, order_direction))
 
-        if order_direction == 'desc':
-            query = query.order_by(getattr(Hub, order_by).desc())
+        if top_n and top_n > 0:
+            # Leaderboards: one LIMIT query, no count
+            sla_data = query.limit(top_n).all()
+            page, per_page, total = 1, top_n, len(sla_data)
         else:
-            query = query.order_by(getattr(Hub, order_by))
-
-        total = self.db.query(Hub).count()
-        page = page if page > 0 else 1
-        sla_data = query.offset((page - 1) * per_page).limit(per_page).all()
+            page = page if page > 0 else 1
+            sla_data, total = paginate(query, page, per_page, count_mode)
 
         items = []
         for result in sla_data:
-            hub_id = result.id
-            total_count = result.total
-            on_time = result.on_time
-            late = total_count - on_time
-
             sla_metrics = {
-                'hub_id': hub_id,
+                'hub_id': result.id,
                 'hub_name': result.name,
-                'total': total_count,
-                'on_time': on_time,
-                'late': late,
-                'on_time_percentage': round((on_time / total_count) * 100) if total_count > 0 else 0,
-                'late_percentage': round((late / total_count) * 100, 2) if total_count > 0 else 0
+                **self._sla_summary(result)
             }
             items.append(sla_metrics)
 
@@ -273,65 +455,64 @@ class AttendanceRepository(IAttendanceRepository):
             'total_pages': (total + per_page - 1) // per_page,
             'page': page,
             'per_page': per_page,
-            'items': items
+            'items': items,
+            **self._freshness(SlaByHubView if view_source is not None else None)
         }
 
     def find_sla_by_hub_id(self, hub_id: int) -> dict:
+        source = self._sla_source()
         query = self.db.query(
             Hub.id,
             Hub.name,
-            func.count(Attendance.id).label('total'),
-            func.sum(
-                func.cast(Attendance.attendance_date <= Attendance.limit_date, Integer)
-            ).label('on_time')
-        ).join(Attendance, Attendance.hub_id == Hub.id).filter(Hub.id == hub_id).filter(Attendance.is_active == True).group_by(Hub.id).first()
+            *self._sla_columns(source)
+        ).join(source.table, source.hub_id == Hub.id).filter(Hub.id == hub_id).group_by(Hub.id).having(source.total > 0).first()
 
         if not query:
             return None
 
-        total_count = query.total
-        on_time = query.on_time
-        late = total_count - on_time
-
         return {
             'hub_id': query.id,
             'hub_name': query.name,
-            'total': total_count,
-            'on_time': on_time,
-            'late': late,
-            'on_time_percentage': round((on_time / total_count) * 100) if total_count > 0 else 0,
-            'late_percentage': round((late / total_count) * 100, 2) if total_count > 0 else 0
+            **self._sla_summary(query)
         }
 
-    def get_productivity_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'total_attendances', order_direction: str = 'desc') -> dict:
-
-        calendar = Brazil()
-
-        # Base query
-        query = self.db.query(
-            Attendance.green_angel_id,
-            func.count(Attendance.id).label('total_attendances')
-        ).filter(Attendance.attendance_date.isnot(None)).filter(Attendance.is_active == True)
-
-        if filters.get('date_from'):
-            date_from = dt.strptime(filters['date_from'], '%Y-%m-%d %H:%M:%S')
-            query = query.filter(Attendance.attendance_date >= date_from)
+    def get_productivity_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'total_attendances', order_direction: str = 'desc', count_mode: str = 'exact') -> dict:
+
+        view = ProductivityDailyView if filters.get('freshness') == 'materialized' else None
+        if view is not None:
+            # Per-day counts, so the date filters apply to whole days
+            green_angel_id, hub_id, day = view.c.green_angel_id, view.c.hub_id, view.c.day
+            query = self.db.query(
+                green_angel_id,
+                func.sum(view.c.attendances).label('total_attendances'),
+                func.min(day).label('first_attendance')
+            )
         else:
-            date_from = None
+            # Base query
+            green_angel_id, hub_id, day = Attendance.green_angel_id, Attendance.hub_id, Attendance.attendance_date
+            query = self.db.query(
+                green_angel_id,
+                func.count(Attendance.id).label('total_attendances'),
+                func.min(day).label('first_attendance')
+            ).filter(Attendance.attendance_date.isnot(None)).filter(Attendance.is_active == True)
+
+        # Holidays follow the hub's state when the metric is scoped to one hub
+        state = None
+        if filters.get('hub_id'):
+            query = query.filter(hub_id == filters['hub_id'])
+            state = self.db.query(Hub.state).filter(Hub.id == filters['hub_id']).scalar()
 
         if filters.get('date_to'):
             date_to = dt.strptime(filters['date_to'], '%Y-%m-%d %H:%M:%S')
-            query = query.filter(Attendance.attendance_date <= date_to)
+            query = query.filter(day <= (date_to.date() if view is not None else date_to))
         else:
             date_to = dt.today()
 
-        if date_from:
-            working_days = sum(1 for d in (date_from + timedelta(n) for n in range((date_to - date_from).days + 1))
-                               if calendar.is_working_day(d))
-        else:
-            working_days = 1
+        if filters.get('date_from'):
+            date_from = dt.strptime(filters['date_from'], '%Y-%m-%d %H:%M:%S')
+            query = query.filter(day >= (date_from.date() if view is not None else date_from))
 
-        query = query.group_by(Attendance.green_angel_id)
+        query = query.group_by(green_angel_id)
 
         allowed_order_by = ['total_attendances']
         if order_by not in allowed_order_by:
@@ -342,16 +523,20 @@ class AttendanceRepository(IAttendanceRepository):
         elif order_by == 'total_attendances':
             query = query.order_by('total_attendances')
 
-        total = query.count()
-        sla_data = query.offset((page - 1) * per_page).limit(per_page).all()
+        page = page if page > 0 else 1
+        sla_data, total = paginate(query, page, per_page, count_mode)
+
+        # Each green angel is measured from their first attendance in the range,
+        # the whole page counted in one vectorized call
+        working_days = calendar_for(state).count_many([result.first_attendance for result in sla_data], date_to)
 
         items = []
-        for result in sla_data:
-            productivity = result.total_attendances / working_days if working_days > 0 else 0
+        for result, days in zip(sla_data, working_days.tolist()):
+            productivity = result.total_attendances / days if days > 0 else 0
             items.append({
                 'green_angel_id': result.green_angel_id,
                 'total_attendances': result.total_attendances,
-                'working_days': working_days,
+                'working_days': days,
                 'attendances_per_day': round(productivity, 2)
             })
 
@@ -360,21 +545,75 @@ class AttendanceRepository(IAttendanceRepository):
             'total_pages': (total + per_page - 1) // per_page,
             'page': page,
             'per_page': per_page,
+            'items': items,
+            **self._freshness(view)
+        }
+
+    def get_sla_timeseries(self, filters: dict = None, interval: str = 'day') -> dict:
+        if interval not in INTERVALS:
+            interval = 'day'
+
+        source = self._sla_source(filters)
+        bucket = date_bucket(self.db, source.day, interval).label('bucket')
+        query = self.db.query(bucket, *self._sla_columns(source)).select_from(source.table).filter(*source.criteria)
+        query = self._apply_sla_filters(query, source, filters)
+        query = query.group_by(bucket).having(source.total > 0).order_by(bucket)
+
+        items = [{'bucket': str(result.bucket), **self._sla_summary(result)} for result in query]
+        return {
+            'interval': interval,
+            'size': len(items),
             'items': items
         }
 
-    def _calculate_working_days(self, date_from: str, date_to: str) -> int:
-        from datetime import datetime, timedelta
+    def get_productivity_timeseries(self, filters: dict = None, interval: str = 'day') -> dict:
+        if interval not in INTERVALS:
+            interval = 'day'
+        filters = filters or {}
+
+        bucket = date_bucket(self.db, Attendance.attendance_date, interval).label('bucket')
+        query = self.db.query(
+            bucket,
+            func.count(Attendance.id).label('total_attendances'),
+            func.count(Attendance.green_angel_id.distinct()).label('green_angels')
+        ).filter(Attendance.attendance_date.isnot(None)).filter(Attendance.is_active == True)
+
+        state = None
+        if filters.get('green_angel_id'):
+            query = query.filter(Attendance.green_angel_id == filters['green_angel_id'])
+        if filters.get('hub_id'):
+            query = query.filter(Attendance.hub_id == filters['hub_id'])
+            state = self.db.query(Hub.state).filter(Hub.id == filters['hub_id']).scalar()
+        # Date range on the day of attendance_date, both ends inclusive
+        date_from = _parse_day(filters['date_from']) if filters.get('date_from') else None
+        date_to = _parse_day(filters['date_to']) if filters.get('date_to') else dt.today().date()
+        if date_from:
+            query = query.filter(Attendance.attendance_date >= date_from)
+        if filters.get('date_to'):
+            query = query.filter(Attendance.attendance_date < date_to + timedelta(days=1))
 
-        start_date = datetime.strptime(date_from, '%Y-%m-%d %H:%M:%S')
-        end_date = datetime.strptime(date_to, '%Y-%m-%d %H:%M:%S')
+        results = query.group_by(bucket).order_by(bucket).all()
 
-        num_working_days = 0
-        current_date = start_date
+        # Partial first and last buckets only count the working days inside the range
+        starts = np.array([str(result.bucket) for result in results], dtype='datetime64[D]')
+        ends = np.minimum(bucket_ends(starts, interval), np.datetime64(date_to, 'D'))
+        if date_from:
+            starts = np.maximum(starts, np.datetime64(date_from, 'D'))
+        working_days = calendar_for(state).count_many(starts, ends)
 
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Monday to Friday are working days
-                num_working_days += 1
-            current_date += timedelta(days=1)
+        items = []
+        for result, days in zip(results, working_days.tolist()):
+            productivity = result.total_attendances / (days * result.green_angels) if days > 0 else 0
+            items.append({
+                'bucket': str(result.bucket),
+                'total_attendances': result.total_attendances,
+                'green_angels': result.green_angels,
+                'working_days': days,
+                'attendances_per_day': round(productivity, 2)
+            })
 
-        return num_working_days
+        return {
+            'interval': interval,
+            'size': len(items),
+            'items': items
+        }
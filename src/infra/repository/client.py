@@ -3,15 +3,14 @@ from sqlalchemy.orm import Session
 
 from src.domain.entities.client import Client
 from src.domain.repository.client import IClientRepository
+from src.infra.repository.pagination import paginate
 
 
 class ClientRepository(IClientRepository):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_clients_paginated(self, page: int, per_page: int, order_by: str = 'id', order_direction: str = 'asc') -> dict:
-        total = self.db.query(Client).count()
-
+    def get_clients_paginated(self, page: int, per_page: int, order_by: str = 'id', order_direction: str = 'asc', count_mode: str = 'exact') -> dict:
         query = self.db.query(Client).filter(Client.is_active == True)
 
         allowed_order_by = ['id', 'is_active', 'created_at', 'updated_at']
@@ -24,7 +23,7 @@ class ClientRepository(IClientRepository):
             query = query.order_by(getattr(Client, order_by))
 
         page = page if page > 0 else 1
-        clients = query.offset((page - 1) * per_page).limit(per_page).all()
+        clients, total = paginate(query, page, per_page, count_mode)
         return {
             'size': len(clients),
             'total_pages': (total + per_page - 1) // per_page,
@@ -36,6 +35,11 @@ class ClientRepository(IClientRepository):
     def find_by_id(self, client_id: int) -> Type[Client]:
         return self.db.query(Client).filter(Client.id == client_id).first()
 
+    def find_existing_ids(self, client_ids: set[int]) -> set[int]:
+        if not client_ids:
+            return set()
+        return {row.id for row in self.db.query(Client.id).filter(Client.id.in_(client_ids))}
+
     def save(self, client: Client) -> Client:
         self.db.add(client)
         self.db.commit()
@@ -3,19 +3,23 @@ from sqlalchemy.orm import Session
 
 from src.domain.entities.green_angel import GreenAngel
 from src.domain.repository.green_angel import IGreenAngelRepository
+from src.infra.repository.pagination import paginate
+from src.infra.repository.search import name_filter, rank_by_name
 
 
 class GreenAngelRepository(IGreenAngelRepository):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_green_angels_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc') -> dict:
-        total = self.db.query(GreenAngel).count()
+    def get_green_angels_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc', count_mode: str = 'exact') -> dict:
         query = self.db.query(GreenAngel).filter(GreenAngel.is_active == True)
 
         if filters:
             if 'name' in filters and filters['name']:
-                query = query.filter(GreenAngel.name.ilike(f"%{filters['name']}%"))
+                search_mode = filters.get('search_mode', 'contains')
+                query = query.filter(name_filter(self.db, GreenAngel.name, filters['name'], search_mode))
+                if search_mode == 'similarity':
+                    query = rank_by_name(self.db, query, GreenAngel.name, filters['name'])
 
         allowed_order_by = ['id', 'name', 'is_active', 'created_at', 'updated_at']
         if order_by not in allowed_order_by:
@@ -27,7 +31,7 @@ class GreenAngelRepository(IGreenAngelRepository):
             query = query.order_by(getattr(GreenAngel, order_by))
 
         page = page if page > 0 else 1
-        green_angels = query.offset((page - 1) * per_page).limit(per_page).all()
+        green_angels, total = paginate(query, page, per_page, count_mode)
         return {
             'size': len(green_angels),
             'total_pages': (total + per_page - 1) // per_page,
@@ -39,6 +43,11 @@ class GreenAngelRepository(IGreenAngelRepository):
     def find_by_id(self, green_angel_id: int) -> Type[GreenAngel]:
         return self.db.query(GreenAngel).filter(GreenAngel.id == green_angel_id).first()
 
+    def find_existing_ids(self, green_angel_ids: set[int]) -> set[int]:
+        if not green_angel_ids:
+            return set()
+        return {row.id for row in self.db.query(GreenAngel.id).filter(GreenAngel.id.in_(green_angel_ids))}
+
     def save(self, green_angel: GreenAngel) -> GreenAngel:
         self.db.add(green_angel)
         self.db.commit()
@@ -3,19 +3,23 @@ from sqlalchemy.orm import Session
 
 from src.domain.entities.hub import Hub
 from src.domain.repository.hub import IHubRepository
+from src.infra.repository.pagination import paginate
+from src.infra.repository.search import name_filter, rank_by_name
 
 
 class HubRepository(IHubRepository):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_hubs_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc') -> dict:
-        total = self.db.query(Hub).count()
+    def get_hubs_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc', count_mode: str = 'exact') -> dict:
         query = self.db.query(Hub).filter(Hub.is_active == True)
 
         if filters:
             if 'name' in filters and filters['name']:
-                query = query.filter(Hub.name.ilike(f"%{filters['name']}%"))
+                search_mode = filters.get('search_mode', 'contains')
+                query = query.filter(name_filter(self.db, Hub.name, filters['name'], search_mode))
+                if search_mode == 'similarity':
+                    query = rank_by_name(self.db, query, Hub.name, filters['name'])
 
         allowed_order_by = ['id', 'name', 'is_active', 'created_at', 'updated_at']
         if order_by not in allowed_order_by:
@@ -27,7 +31,7 @@ class HubRepository(IHubRepository):
             query = query.order_by(getattr(Hub, order_by))
 
         page = page if page > 0 else 1
-        hubs = query.offset((page - 1) * per_page).limit(per_page).all()
+        hubs, total = paginate(query, page, per_page, count_mode)
         return {
             'size': len(hubs),
             'total_pages': (total + per_page - 1) // per_page,
@@ -39,6 +43,11 @@ class HubRepository(IHubRepository):
     def find_by_id(self, hub_id: int) -> Type[Hub]:
         return self.db.query(Hub).filter(Hub.id == hub_id).first()
 
+    def find_existing_ids(self, hub_ids: set[int]) -> set[int]:
+        if not hub_ids:
+            return set()
+        return {row.id for row in self.db.query(Hub.id).filter(Hub.id.in_(hub_ids))}
+
     def save(self, hub: Hub) -> Hub:
         self.db.add(hub)
         self.db.commit()
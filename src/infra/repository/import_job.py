@@ -0,0 +1,54 @@
+from datetime import datetime as dt
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.domain.entities.csv_import_batch import CsvImportBatch
+from src.domain.entities.import_job import ImportJob
+from src.domain.repository.import_job import IImportJobRepository
+
+
+class ImportJobRepository(IImportJobRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_by_id(self, job_id: str) -> ImportJob:
+        return self.db.query(ImportJob).filter(ImportJob.id == job_id).first()
+
+    def save(self, job: ImportJob):
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+
+    def claim_next(self) -> ImportJob:
+        """Oldest queued job, marked running; None when the queue is empty."""
+        job = self.db.query(ImportJob).filter(ImportJob.status == 'queued').order_by(ImportJob.created_at).with_for_update(skip_locked=True).first()
+        if job is None:
+            self.db.rollback()
+            return None
+        job.status = 'running'
+        # A requeued job keeps its first start, so the throughput covers the whole import
+        job.started_at = job.started_at or dt.utcnow()
+        self.save(job)
+        return job
+
+    def requeue_running(self) -> int:
+        """Puts the jobs left running by a stopped importer back in the queue."""
+        count = self.db.query(ImportJob).filter(ImportJob.status == 'running').update({'status': 'queued'})
+        self.db.commit()
+        return count
+
+    def get_progress(self, job_id: str) -> dict:
+        """Totals of the batches the importer has committed for a job so far."""
+        result = self.db.query(
+            func.coalesce(func.sum(CsvImportBatch.rows), 0).label('rows'),
+            func.coalesce(func.sum(CsvImportBatch.inserted), 0).label('inserted'),
+            func.coalesce(func.sum(CsvImportBatch.rejected), 0).label('rejected'),
+            func.max(CsvImportBatch.committed_at).label('last_committed_at')
+        ).filter(CsvImportBatch.job_id == job_id).one()
+
+        return {
+            'rows': result.rows,
+            'inserted': result.inserted,
+            'rejected': result.rejected,
+            'last_committed_at': result.last_committed_at
+        }
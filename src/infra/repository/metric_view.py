@@ -0,0 +1,36 @@
+from datetime import datetime as dt
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.domain.entities.metric_view import METRIC_VIEWS, MetricViewRefresh
+from src.domain.repository.metric_view import IMetricViewRepository
+
+# pg advisory lock key, so only one process refreshes at a time
+REFRESH_LOCK = 0x6d765f726566
+
+
+class MetricViewRepository(IMetricViewRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_all(self) -> bool:
+        """Refresh every metric view concurrently and record when it happened.
+
+        Returns False without refreshing when another process holds the
+        refresh lock, which is the normal case with several app workers.
+        """
+        if not self.db.execute(text('SELECT pg_try_advisory_xact_lock(:key)'), {'key': REFRESH_LOCK}).scalar():
+            self.db.rollback()
+            return False
+
+        for name in METRIC_VIEWS:
+            # CONCURRENTLY keeps the views readable, it needs their unique indexes
+            self.db.execute(text(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {name}'))
+            stmt = insert(MetricViewRefresh).values(name=name, refreshed_at=dt.utcnow())
+            self.db.execute(stmt.on_conflict_do_update(index_elements=[MetricViewRefresh.name], set_={'refreshed_at': stmt.excluded.refreshed_at}))
+        self.db.commit()
+        return True
+
+    def refreshed_at(self, name: str) -> dt:
+        return self.db.query(MetricViewRefresh.refreshed_at).filter(MetricViewRefresh.name == name).scalar()
@@ -0,0 +1,102 @@
+import base64
+import binascii
+import json
+from datetime import datetime as dt
+
+from sqlalchemy import and_, or_, tuple_, func
+from sqlalchemy.orm import Query
+
+from src.domain.exception.domain_exception import DomainException
+from src.domain.exception.error_code import ErrorCode
+
+COUNT_MODES = ['exact', 'estimated']
+
+
+def paginate(query: Query, page: int, per_page: int, count_mode: str = 'exact') -> tuple:
+    """Return (rows, total) for one page of an already filtered and ordered query.
+
+    'exact' counts the same filtered query with count(*) OVER () in the page
+    query itself. 'estimated' asks the planner instead, which is O(1) but
+    approximate, and falls back to 'exact' where EXPLAIN is not available.
+    """
+    if count_mode not in COUNT_MODES:
+        raise DomainException(ErrorCode.INVALID_COUNT_MODE)
+
+    offset = (page - 1) * per_page
+
+    if count_mode == 'estimated':
+        total = estimate_count(query)
+        if total is not None:
+            return query.offset(offset).limit(per_page).all(), total
+
+    single_entity = len(query.column_descriptions) == 1
+    rows = query.add_columns(func.count().over().label('total_count')).offset(offset).limit(per_page).all()
+
+    if not rows:
+        # Past the last page the window has no row to report on
+        total = query.order_by(None).count() if page > 1 else 0
+        return [], total
+
+    total = rows[0].total_count
+    if single_entity:
+        rows = [row[0] for row in rows]
+    return rows, total
+
+
+def estimate_count(query: Query):
+    # Bound by the statement, so a session reading from a replica asks that replica's planner
+    stmt = query.order_by(None).statement
+    conn = query.session.connection(bind_arguments={'clause': stmt})
+    if conn.dialect.name != 'postgresql':
+        return None
+
+    # The planner derives this from pg_class.reltuples and column statistics
+    compiled = stmt.compile(dialect=conn.dialect)
+    plan = conn.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {compiled}', compiled.params).scalar()
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def encode_cursor(order_by: str, order_direction: str, value, last_id: int) -> str:
+    if isinstance(value, dt):
+        value = {'dt': value.isoformat()}
+    payload = json.dumps({'o': order_by, 'd': order_direction, 'v': value, 'id': last_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, order_by: str, order_direction: str) -> tuple:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = payload['v']
+        if isinstance(value, dict):
+            value = dt.fromisoformat(value['dt'])
+        last_id = int(payload['id'])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise DomainException(ErrorCode.INVALID_CURSOR)
+
+    # A cursor is only valid for the ordering it was issued with
+    if payload.get('o') != order_by or payload.get('d') != order_direction:
+        raise DomainException(ErrorCode.INVALID_CURSOR)
+    return value, last_id
+
+
+def apply_keyset(query: Query, column, id_column, order_direction: str, cursor_value, last_id: int) -> Query:
+    """Seek past (cursor_value, last_id) using a row-value comparison.
+
+    The query must be ordered NULLS LAST on ASC and NULLS FIRST on DESC
+    (the Postgres default); nullable columns get an extra branch for them.
+    """
+    if column is id_column:
+        return query.filter(id_column < last_id if order_direction == 'desc' else id_column > last_id)
+
+    if order_direction == 'desc':
+        if cursor_value is None:
+            return query.filter(or_(and_(column.is_(None), id_column < last_id), column.isnot(None)))
+        return query.filter(tuple_(column, id_column) < tuple_(cursor_value, last_id))
+
+    if cursor_value is None:
+        return query.filter(column.is_(None), id_column > last_id)
+    condition = tuple_(column, id_column) > tuple_(cursor_value, last_id)
+    if column.nullable:
+        condition = or_(condition, column.is_(None))
+    return query.filter(condition)
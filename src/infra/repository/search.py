@@ -0,0 +1,45 @@
+from sqlalchemy import case, func, literal, or_, text
+from sqlalchemy.orm import Query, Session
+
+from src.domain.exception.domain_exception import DomainException
+from src.domain.exception.error_code import ErrorCode
+
+SEARCH_MODES = ['contains', 'similarity']
+
+# pg_trgm availability per engine, looked up once
+_trigram_support = {}
+
+
+def has_trigram(db: Session) -> bool:
+    bind = db.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return False
+    if bind not in _trigram_support:
+        _trigram_support[bind] = db.execute(text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")).scalar()
+    return _trigram_support[bind]
+
+
+def _escape_like(term: str) -> str:
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def name_filter(db: Session, column, term: str, mode: str = 'contains'):
+    """Substring match on column, widened to fuzzy word matches in 'similarity' mode.
+
+    Both ILIKE '%term%' and term <% column are served by the gin_trgm_ops
+    indexes when pg_trgm is installed; without it only the ILIKE remains.
+    """
+    if mode not in SEARCH_MODES:
+        raise DomainException(ErrorCode.INVALID_SEARCH_MODE)
+
+    contains = column.ilike(f'%{_escape_like(term)}%', escape='\\')
+    if mode == 'similarity' and has_trigram(db):
+        return or_(contains, literal(term).op('<%')(column))
+    return contains
+
+
+def rank_by_name(db: Session, query: Query, column, term: str) -> Query:
+    if has_trigram(db):
+        return query.order_by(func.word_similarity(term, column).desc(), func.similarity(term, column).desc())
+    # Without pg_trgm: prefix matches first, then the shortest names
+    return query.order_by(case((column.ilike(f'{_escape_like(term)}%', escape='\\'), 0), else_=1), func.length(column))
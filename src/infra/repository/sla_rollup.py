@@ -0,0 +1,61 @@
+from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.domain.entities.sla_rollup import SlaRollup
+from src.domain.repository.sla_rollup import ISlaRollupRepository
+
+
+class SlaRollupRepository(ISlaRollupRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _bucket(limit_date: datetime, attendance_date: datetime) -> str:
+        if attendance_date is None:
+            return 'pending'
+        if attendance_date <= limit_date:
+            return 'on_time'
+        return 'late'
+
+    def apply(self, green_angel_id: int, hub_id: int, limit_date: datetime, attendance_date: datetime, delta: int):
+        """Add delta to the bucket of one attendance without committing.
+
+        The caller's commit (AttendanceRepository.save) makes the rollup change
+        atomic with the attendance change.
+        """
+        self.apply_many([(green_angel_id, hub_id, limit_date, attendance_date, delta)])
+
+    def apply_many(self, changes: list[tuple[int, int, datetime, datetime, int]]):
+        """Add the deltas of many attendances in one multi-row upsert, without committing.
+
+        Deltas landing on the same (green_angel_id, hub_id, day) are summed
+        first, since one INSERT ... ON CONFLICT cannot touch a row twice.
+        """
+        rows = {}
+        for green_angel_id, hub_id, limit_date, attendance_date, delta in changes:
+            key = (green_angel_id, hub_id, limit_date.date())
+            row = rows.setdefault(key, {
+                'green_angel_id': green_angel_id, 'hub_id': hub_id, 'day': limit_date.date(),
+                'total': 0, 'on_time': 0, 'late': 0, 'pending': 0
+            })
+            row['total'] += delta
+            row[self._bucket(limit_date, attendance_date)] += delta
+
+        rows = [row for row in rows.values() if any(row[bucket] for bucket in ('total', 'on_time', 'late', 'pending'))]
+        if not rows:
+            return
+
+        stmt = insert(SlaRollup).values([{**row, 'updated_at': func.now()} for row in rows])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SlaRollup.green_angel_id, SlaRollup.hub_id, SlaRollup.day],
+            set_={
+                'total': SlaRollup.total + stmt.excluded.total,
+                'on_time': SlaRollup.on_time + stmt.excluded.on_time,
+                'late': SlaRollup.late + stmt.excluded.late,
+                'pending': SlaRollup.pending + stmt.excluded.pending,
+                'updated_at': func.now()
+            }
+        )
+        self.db.execute(stmt)
@@ -0,0 +1,31 @@
+import numpy as np
+from sqlalchemy import Date, DateTime, cast, func, literal_column
+from sqlalchemy.orm import Session
+
+INTERVALS = ['day', 'week', 'month']
+
+
+def date_bucket(db: Session, column, interval: str):
+    """First day of the day/week/month holding column, as a date.
+
+    Postgres truncates with date_trunc (weeks start on Monday); other
+    engines get the same buckets from SQLite date modifiers.
+    """
+    if db.get_bind().dialect.name == 'postgresql':
+        # The cast pins the timestamp overload, so the session time zone cannot shift buckets.
+        # interval is inlined (it is one of INTERVALS) so GROUP BY matches the select list.
+        return cast(func.date_trunc(literal_column(f"'{interval}'"), cast(column, DateTime)), Date)
+    if interval == 'week':
+        return func.date(column, 'weekday 0', '-6 days')
+    if interval == 'month':
+        return func.date(column, 'start of month')
+    return func.date(column)
+
+
+def bucket_ends(starts: np.ndarray, interval: str) -> np.ndarray:
+    """Last day of each bucket starting at starts (datetime64[D])."""
+    if interval == 'week':
+        return starts + 6
+    if interval == 'month':
+        return (starts.astype('datetime64[M]') + 1).astype('datetime64[D]') - 1
+    return starts
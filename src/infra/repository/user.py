@@ -4,20 +4,23 @@ from sqlalchemy.orm import Session
 
 from src.domain.entities.user import User
 from src.domain.repository.user import IUserRepository
+from src.infra.repository.pagination import paginate
+from src.infra.repository.search import name_filter, rank_by_name
 
 
 class UserRepository(IUserRepository):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_users_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc') -> dict:
-        total = self.db.query(User).count()
-
+    def get_users_paginated(self, page: int, per_page: int, filters: dict = None, order_by: str = 'id', order_direction: str = 'asc', count_mode: str = 'exact') -> dict:
         query = self.db.query(User).filter(User.is_active == True)
 
         if filters:
             if 'name' in filters and filters['name']:
-                query = query.filter(User.name.ilike(f"%{filters['name']}%"))
+                search_mode = filters.get('search_mode', 'contains')
+                query = query.filter(name_filter(self.db, User.name, filters['name'], search_mode))
+                if search_mode == 'similarity':
+                    query = rank_by_name(self.db, query, User.name, filters['name'])
             if 'email' in filters and filters['email']:
                 query = query.filter(User.email == filters['email'])
 
@@ -31,7 +34,7 @@ class UserRepository(IUserRepository):
             query = query.order_by(getattr(User, order_by))
 
         page = page if page > 0 else 1
-        users = query.offset((page - 1) * per_page).limit(per_page).all()
+        users, total = paginate(query, page, per_page, count_mode)
         return {
             'size': len(users),
             'total_pages': (total + per_page - 1) // per_page,
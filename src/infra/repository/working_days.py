@@ -0,0 +1,107 @@
+import threading
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from workalendar.registry import registry
+
+COUNTRY = 'BR'
+
+
+class WorkingDayCalendar:
+    """Working days of one workalendar calendar, counted through per-year prefix sums.
+
+    Each year is expanded once into a cumulative count of working days, so
+    counting a range only reads two entries per year it spans. Many ranges
+    at once go through numpy.busday_count with the same holidays instead.
+    """
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self._years = {}
+        self._busdays = (None, None, None)
+        self._lock = threading.Lock()
+
+    def _prefix(self, year: int) -> np.ndarray:
+        prefix = self._years.get(year)
+        if prefix is None:
+            with self._lock:
+                prefix = self._years.get(year)
+                if prefix is None:
+                    first = date(year, 1, 1)
+                    days = (date(year + 1, 1, 1) - first).days
+                    working = [self.calendar.is_working_day(first + timedelta(n)) for n in range(days)]
+                    # prefix[n] is the number of working days before day n of the year
+                    prefix = np.concatenate(([0], np.cumsum(working)))
+                    self._years[year] = prefix
+        return prefix
+
+    def count(self, start: date, end: date) -> int:
+        """Working days between start and end, both inclusive."""
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+        if end < start:
+            return 0
+
+        total = 0
+        for year in range(start.year, end.year + 1):
+            prefix = self._prefix(year)
+            first = start.timetuple().tm_yday - 1 if year == start.year else 0
+            last = end.timetuple().tm_yday if year == end.year else len(prefix) - 1
+            total += int(prefix[last] - prefix[first])
+        return total
+
+    def _busdaycalendar(self, first_year: int, last_year: int) -> np.busdaycalendar:
+        first, last, busdays = self._busdays
+        if busdays is None or first_year < first or last_year > last:
+            with self._lock:
+                first, last, busdays = self._busdays
+                if busdays is None or first_year < first or last_year > last:
+                    # Grow the covered span rather than rebuilding it for every caller
+                    first = first_year if first is None else min(first, first_year)
+                    last = last_year if last is None else max(last, last_year)
+                    weekend = self.calendar.get_weekend_days()
+                    holidays = [day for year in range(first, last + 1) for day, _ in self.calendar.holidays(year)]
+                    busdays = np.busdaycalendar(
+                        weekmask=[day not in weekend for day in range(7)],
+                        holidays=np.array(holidays, dtype='datetime64[D]')
+                    )
+                    self._busdays = (first, last, busdays)
+        return busdays
+
+    def count_many(self, starts, ends) -> np.ndarray:
+        """Working days of many (start, end) pairs in one vectorized call, both inclusive.
+
+        starts and ends are sequences of dates, datetimes or datetime64; a
+        scalar on either side is broadcast against the other.
+        """
+        starts = np.asarray(starts, dtype='datetime64[s]').astype('datetime64[D]')
+        ends = np.asarray(ends, dtype='datetime64[s]').astype('datetime64[D]')
+        if not starts.size or not ends.size:
+            return np.zeros(np.broadcast(starts, ends).shape, dtype=np.int64)
+
+        years = np.concatenate((starts.ravel(), ends.ravel())).astype('datetime64[Y]').astype(int) + 1970
+        busdays = self._busdaycalendar(int(years.min()), int(years.max()))
+        # busday_count excludes the end day and goes negative on reversed ranges
+        return np.maximum(np.busday_count(starts, ends + 1, busdaycal=busdays), 0)
+
+
+_calendars = {}
+_calendars_lock = threading.Lock()
+
+
+def calendar_for(state: str = None) -> WorkingDayCalendar:
+    """Shared calendar for a Brazilian state (UF such as 'SP'), national when unknown."""
+    code = f'{COUNTRY}-{state.strip().upper()}' if state else COUNTRY
+    if registry.get(code) is None:
+        code = COUNTRY
+
+    calendar = _calendars.get(code)
+    if calendar is None:
+        with _calendars_lock:
+            calendar = _calendars.get(code)
+            if calendar is None:
+                calendar = WorkingDayCalendar(registry.get(code)())
+                _calendars[code] = calendar
+    return calendar
@@ -0,0 +1,46 @@
+import logging
+import threading
+
+from src.infra.database.database import SessionLocal
+from src.infra.repository.metric_view import MetricViewRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MetricViewRefresher:
+    """Refreshes the metric materialized views every interval seconds.
+
+    Started in every gunicorn worker by the post_fork hook, never on
+    import, so tests and flask run have none; the repository's advisory
+    lock makes sure only one worker refreshes per round.
+    """
+
+    def __init__(self, interval: int):
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.interval <= 0 or self.thread:
+            return
+        self.thread = threading.Thread(target=self._loop, name='metric-view-refresher', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def _loop(self):
+        while not self.stopped.wait(self.interval):
+            self.refresh()
+
+    def refresh(self) -> bool:
+        # Runs outside any request, so it cannot share a request's session
+        db = SessionLocal()
+        try:
+            return MetricViewRepository(db).refresh_all()
+        except Exception:
+            db.rollback()
+            logger.exception('metric view refresh failed')
+            return False
+        finally:
+            db.close()
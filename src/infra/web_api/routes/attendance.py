@@ -1,9 +1,12 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, send_file
 from dependency_injector.wiring import inject, Provide
 
-from src.interface.web.schemas.attendance import AttendanceCreateSchema, AttendanceUpdateSchema
+from src.interface.web.schemas.attendance import (
+    AttendanceCreateSchema, AttendanceUpdateSchema, AttendanceBulkCreateSchema, AttendanceBulkUpdateSchema, AttendanceBulkDeleteSchema)
 from src.interface.web.controller.attendance import AttendanceController
+from src.interface.web.controller.attendance_import import AttendanceImportController
 from src.interface.web.middleware.auth import auth_required
+from src.interface.web.middleware.read_replica import read_replica
 from src.infra.init.injector import Container
 
 attendance_bp = Blueprint('attendance', __name__, url_prefix='/api/v1/attendances')
@@ -11,6 +14,7 @@ attendance_bp = Blueprint('attendance', __name__, url_prefix='/api/v1/attendance
 @attendance_bp.route('', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_attendances(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
     """
     Get a list of attendances
@@ -32,6 +36,18 @@ def get_attendances(attendance_controller: AttendanceController = Provide[Contai
         required: false
         default: 20
         description: The number of attendances to retrieve per page.
+      - name: count
+        in: query
+        type: string
+        required: false
+        default: exact
+        description: How total_pages is counted (exact or estimated). Estimated uses planner row estimates and is approximate.
+      - name: search
+        in: query
+        type: string
+        required: false
+        default: contains
+        description: Name matching mode for green_angel_name and hub_name (contains or similarity). Similarity also matches misspelled names.
       - name: client_id
         in: query
         type: integer
@@ -77,6 +93,17 @@ def get_attendances(attendance_controller: AttendanceController = Provide[Contai
         type: string
         required: false
         description: Order direction (asc or desc).
+      - name: pagination
+        in: query
+        type: string
+        required: false
+        default: offset
+        description: Pagination mode (offset or cursor). Cursor mode keeps deep pages fast and ignores page.
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: The next_cursor returned by the previous page. Implies cursor pagination.
     responses:
       200:
         description: A list of attendances
@@ -88,13 +115,16 @@ def get_attendances(attendance_controller: AttendanceController = Provide[Contai
               description: The number of attendances in the current page.
             total_pages:
               type: integer
-              description: The total number of pages.
+              description: The total number of pages (null in cursor mode).
             page:
               type: integer
-              description: The current page number.
+              description: The current page number (null in cursor mode).
             per_page:
               type: integer
               description: The number of attendances per page.
+            next_cursor:
+              type: string
+              description: Opaque cursor for the next page in cursor mode, null on the last page.
             items:
               type: array
               items:
@@ -173,6 +203,10 @@ def get_attendances(attendance_controller: AttendanceController = Provide[Contai
 
     order_by = request.args.get('order_by')
     order_direction = request.args.get('order_direction')
+    count_mode = request.args.get('count', 'exact')
+    search_mode = request.args.get('search', 'contains')
+    pagination = request.args.get('pagination', 'offset')
+    cursor = request.args.get('cursor')
 
     filters = {
         'client_id': client_id,
@@ -181,9 +215,10 @@ def get_attendances(attendance_controller: AttendanceController = Provide[Contai
         'hub_id': hub_id,
         'hub_name': hub_name,
         'attendance_date': attendance_date,
-        'limit_date': limit_date
+        'limit_date': limit_date,
+        'search_mode': search_mode
     }
-    return jsonify(attendance_controller.get_attendances(page, per_page, filters, order_by, order_direction))
+    return jsonify(attendance_controller.get_attendances(page, per_page, filters, order_by, order_direction, pagination, cursor, count_mode))
 
 @attendance_bp.route('/<int:attendance_id>', methods=['GET'])
 @inject
@@ -346,3 +381,406 @@ def delete_attendance(attendance_id: int, attendance_controller: AttendanceContr
       - Bearer: []
     """
     return jsonify(attendance_controller.delete_attendance(attendance_id))
+
+@attendance_bp.route('/bulk', methods=['POST'])
+@inject
+@auth_required
+def create_attendances(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
+    """
+    Create attendances in bulk
+    ---
+    tags:
+      - Attendances
+    summary: Create up to 1000 attendances in one request
+    description: Green angels, hubs and clients are validated with one query each and the valid items are inserted in a single transaction. Items with a missing reference are reported and skipped.
+    parameters:
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          required:
+            - items
+          properties:
+            items:
+              type: array
+              items:
+                $ref: '#/definitions/AttendanceCreateSchema'
+    responses:
+      200:
+        description: Per-item results
+        schema:
+          type: object
+          properties:
+            succeeded:
+              type: integer
+              description: Items applied.
+            failed:
+              type: integer
+              description: Items rejected.
+            items:
+              type: array
+              description: One result per request item, in request order.
+              items:
+                type: object
+                properties:
+                  index:
+                    type: integer
+                    description: Position of the item in the request.
+                  id:
+                    type: integer
+                    description: The attendance ID.
+                  status:
+                    type: string
+                    description: created or error
+                  error:
+                    type: string
+                    description: Error code of a rejected item (GREEN_ANGEL_NOT_FOUND, HUB_NOT_FOUND or CLIENT_NOT_FOUND).
+      401:
+        description: Unauthorized
+      422:
+        description: Malformed body or more than 1000 items
+      500:
+        description: Internal server error
+    security:
+      - Bearer: []
+    """
+    attendances = AttendanceBulkCreateSchema(**request.json)
+    return jsonify(attendance_controller.create_attendances(attendances))
+
+@attendance_bp.route('/bulk', methods=['PUT'])
+@inject
+@auth_required
+def update_attendances(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
+    """
+    Update attendances in bulk
+    ---
+    tags:
+      - Attendances
+    summary: Update up to 1000 attendances in one request
+    description: Each item carries the attendance id and the fields to change. All valid items are written with a single UPDATE in one transaction.
+    parameters:
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          required:
+            - items
+          properties:
+            items:
+              type: array
+              items:
+                type: object
+                required:
+                  - id
+                properties:
+                  id:
+                    type: integer
+                  green_angel_id:
+                    type: integer
+                  hub_id:
+                    type: integer
+                  limit_date:
+                    type: string
+                    description: dd-mm-YYYY HH:MM:SS
+                  attendance_date:
+                    type: string
+                    description: dd-mm-YYYY HH:MM:SS
+    responses:
+      200:
+        description: Per-item results
+        schema:
+          type: object
+          properties:
+            succeeded:
+              type: integer
+              description: Items applied.
+            failed:
+              type: integer
+              description: Items rejected.
+            items:
+              type: array
+              description: One result per request item, in request order.
+              items:
+                type: object
+                properties:
+                  index:
+                    type: integer
+                    description: Position of the item in the request.
+                  id:
+                    type: integer
+                    description: The attendance ID.
+                  status:
+                    type: string
+                    description: updated or error
+                  error:
+                    type: string
+                    description: Error code of a rejected item (ATTENDANCE_NOT_FOUND, GREEN_ANGEL_NOT_FOUND or HUB_NOT_FOUND).
+      401:
+        description: Unauthorized
+      422:
+        description: Malformed body or more than 1000 items
+      500:
+        description: Internal server error
+    security:
+      - Bearer: []
+    """
+    attendances = AttendanceBulkUpdateSchema(**request.json)
+    return jsonify(attendance_controller.update_attendances(attendances))
+
+@attendance_bp.route('/bulk', methods=['DELETE'])
+@inject
+@auth_required
+def delete_attendances(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
+    """
+    Delete attendances in bulk
+    ---
+    tags:
+      - Attendances
+    summary: Delete up to 1000 attendances in one request
+    description: Deactivates the given attendances with a single UPDATE in one transaction.
+    parameters:
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+    responses:
+      200:
+        description: Per-item results
+        schema:
+          type: object
+          properties:
+            succeeded:
+              type: integer
+              description: Items applied.
+            failed:
+              type: integer
+              description: Items rejected.
+            items:
+              type: array
+              description: One result per request item, in request order.
+              items:
+                type: object
+                properties:
+                  index:
+                    type: integer
+                    description: Position of the item in the request.
+                  id:
+                    type: integer
+                    description: The attendance ID.
+                  status:
+                    type: string
+                    description: deleted or error
+                  error:
+                    type: string
+                    description: Error code of a rejected item (ATTENDANCE_NOT_FOUND or ATTENDANCE_ALREADY_DELETED).
+      401:
+        description: Unauthorized
+      422:
+        description: Malformed body or more than 1000 items
+      500:
+        description: Internal server error
+    security:
+      - Bearer: []
+    """
+    attendances = AttendanceBulkDeleteSchema(**request.json)
+    return jsonify(attendance_controller.delete_attendances(attendances))
+
+@attendance_bp.route('/import', methods=['POST'])
+@inject
+@auth_required
+def import_attendances(attendance_import_controller: AttendanceImportController = Provide[Container.attendance_import_controller]):
+    """
+    Import attendances from a CSV upload
+    ---
+    tags:
+      - Attendances
+    summary: Stream a CSV (optionally gzip) into the bulk loader
+    description: The raw request body is the CSV in the seeder format (semicolon separated, header id_atendimento;id_cliente;angel;polo;data_limite;data_de_atendimento). Gzip bodies are detected automatically. The body is streamed to disk in chunks, never held in memory, and imported by the importer process (src.infra.importer.csv_import_worker), one job at a time; poll the returned job for progress.
+    consumes:
+      - text/csv
+      - application/gzip
+    parameters:
+      - name: file_name
+        in: query
+        type: string
+        required: false
+        description: Name to show in the job status.
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: string
+          format: binary
+    responses:
+      202:
+        description: The queued import job
+        schema:
+          type: object
+          properties:
+            id:
+              type: string
+              description: The import job ID.
+            file_name:
+              type: string
+              description: The file name given on upload.
+            status:
+              type: string
+              description: queued, running, completed, partial (some batches failed) or failed.
+            bytes_received:
+              type: integer
+              description: Size of the upload as received (compressed, for gzip).
+            rows_processed:
+              type: integer
+              description: CSV rows in the batches committed so far.
+            rows_inserted:
+              type: integer
+              description: New attendances inserted so far.
+            rows_rejected:
+              type: integer
+              description: Rows rejected for blank or invalid ids, missing angel or polo, or invalid or missing dates.
+            rows_per_second:
+              type: number
+              description: Rows processed per second since the job started.
+            has_rejects:
+              type: boolean
+              description: Whether the rejected rows can be downloaded from /import/{job_id}/rejects.
+            error:
+              type: string
+              description: Why the job failed or was partial.
+            created_at:
+              type: string
+              description: When the upload finished.
+            started_at:
+              type: string
+              description: When the import started.
+            finished_at:
+              type: string
+              description: When the import finished.
+      400:
+        description: Empty body or broken gzip stream
+      401:
+        description: Unauthorized
+      500:
+        description: Internal server error
+    security:
+      - Bearer: []
+    """
+    file_name = request.args.get('file_name')
+    return jsonify(attendance_import_controller.start_import(request.stream, file_name)), 202
+
+@attendance_bp.route('/import/<job_id>', methods=['GET'])
+@inject
+@auth_required
+def get_import(job_id: str, attendance_import_controller: AttendanceImportController = Provide[Container.attendance_import_controller]):
+    """
+    Get an import job
+    ---
+    tags:
+      - Attendances
+    summary: Retrieve the progress of a CSV import job
+    description: Rows processed, inserted and rejected so far, and the throughput of the job.
+    parameters:
+      - name: job_id
+        in: path
+        type: string
+        required: true
+        description: The job ID returned by the import endpoint.
+    responses:
+      200:
+        description: The import job
+        schema:
+          type: object
+          properties:
+            id:
+              type: string
+              description: The import job ID.
+            file_name:
+              type: string
+              description: The file name given on upload.
+            status:
+              type: string
+              description: queued, running, completed, partial (some batches failed) or failed.
+            bytes_received:
+              type: integer
+              description: Size of the upload as received (compressed, for gzip).
+            rows_processed:
+              type: integer
+              description: CSV rows in the batches committed so far.
+            rows_inserted:
+              type: integer
+              description: New attendances inserted so far.
+            rows_rejected:
+              type: integer
+              description: Rows rejected for blank or invalid ids, missing angel or polo, or invalid or missing dates.
+            rows_per_second:
+              type: number
+              description: Rows processed per second since the job started.
+            has_rejects:
+              type: boolean
+              description: Whether the rejected rows can be downloaded from /import/{job_id}/rejects.
+            error:
+              type: string
+              description: Why the job failed or was partial.
+            created_at:
+              type: string
+              description: When the upload finished.
+            started_at:
+              type: string
+              description: When the import started.
+            finished_at:
+              type: string
+              description: When the import finished.
+      401:
+        description: Unauthorized
+      404:
+        description: Import job not found
+      500:
+        description: Internal server error
+    security:
+      - Bearer: []
+    """
+    return jsonify(attendance_import_controller.get_import(job_id))
+
+@attendance_bp.route('/import/<job_id>/rejects', methods=['GET'])
+@inject
+@auth_required
+def get_import_rejects(job_id: str, attendance_import_controller: AttendanceImportController = Provide[Container.attendance_import_controller]):
+    """
+    Download the rejected rows of an import job
+    ---
+    tags:
+      - Attendances
+    summary: Download the rows an import job could not import
+    description: CSV with the rejected rows, the reason and the data row number (row, from 0). Kept after the job finishes; while it runs, holds the rows rejected so far.
+    produces:
+      - text/csv
+    parameters:
+      - name: job_id
+        in: path
+        type: string
+        required: true
+        description: The job ID returned by the import endpoint.
+    responses:
+      200:
+        description: The rejected rows
+      401:
+        description: Unauthorized
+      404:
+        description: Import job not found, or it has no rejected rows file
+      500:
+        description: Internal server error
+    security:
+      - Bearer: []
+    """
+    path = attendance_import_controller.get_import_rejects(job_id)
+    return send_file(path, mimetype='text/csv', as_attachment=True, download_name=f'{job_id}_rejects.csv')
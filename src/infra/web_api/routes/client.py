@@ -4,6 +4,7 @@ from dependency_injector.wiring import inject, Provide
 from src.interface.web.schemas.client import ClientCreateSchema, ClientUpdateSchema
 from src.interface.web.controller.client import ClientController
 from src.interface.web.middleware.auth import auth_required
+from src.interface.web.middleware.read_replica import read_replica
 from src.infra.init.injector import Container
 
 client_bp = Blueprint('client', __name__, url_prefix='/api/v1/clients')
@@ -11,6 +12,7 @@ client_bp = Blueprint('client', __name__, url_prefix='/api/v1/clients')
 @client_bp.route('', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_clients(client_controller: ClientController = Provide[Container.client_controller]):
     """
     Get a list of clients
@@ -32,6 +34,12 @@ def get_clients(client_controller: ClientController = Provide[Container.client_c
         required: false
         default: 20
         description: The number of clients to retrieve per page.
+      - name: count
+        in: query
+        type: string
+        required: false
+        default: exact
+        description: How total_pages is counted (exact or estimated). Estimated uses planner row estimates and is approximate.
     responses:
       200:
         description: A list of clients
@@ -67,8 +75,9 @@ def get_clients(client_controller: ClientController = Provide[Container.client_c
     per_page = request.args.get('per_page', 20, type=int)
     order_by = request.args.get('order_by')
     order_direction = request.args.get('order_direction')
+    count_mode = request.args.get('count', 'exact')
 
-    return jsonify(client_controller.get_clients(page, per_page, order_by, order_direction))
+    return jsonify(client_controller.get_clients(page, per_page, order_by, order_direction, count_mode))
 
 @client_bp.route('/<int:client_id>', methods=['GET'])
 @inject
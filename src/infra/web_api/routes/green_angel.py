@@ -4,6 +4,7 @@ from dependency_injector.wiring import inject, Provide
 from src.interface.web.schemas.green_angel import GreenAngelCreateSchema, GreenAngelUpdateSchema
 from src.interface.web.controller.green_angel import GreenAngelController
 from src.interface.web.middleware.auth import auth_required
+from src.interface.web.middleware.read_replica import read_replica
 from src.infra.init.injector import Container
 
 green_angel_bp = Blueprint('green_angel', __name__, url_prefix='/api/v1/green-angels')
@@ -11,6 +12,7 @@ green_angel_bp = Blueprint('green_angel', __name__, url_prefix='/api/v1/green-an
 @green_angel_bp.route('', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_green_angels(green_angel_controller: GreenAngelController = Provide[Container.green_angel_controller]):
     """
     Get a list of green angels
@@ -32,6 +34,18 @@ def get_green_angels(green_angel_controller: GreenAngelController = Provide[Cont
         required: false
         default: 20
         description: The number of green angels to retrieve per page.
+      - name: count
+        in: query
+        type: string
+        required: false
+        default: exact
+        description: How total_pages is counted (exact or estimated). Estimated uses planner row estimates and is approximate.
+      - name: search
+        in: query
+        type: string
+        required: false
+        default: contains
+        description: Name matching mode (contains or similarity). Similarity also matches misspelled names and ranks by closeness.
     responses:
       200:
         description: A list of green angels
@@ -70,11 +84,14 @@ def get_green_angels(green_angel_controller: GreenAngelController = Provide[Cont
     name = request.args.get('name')
     order_by = request.args.get('order_by')
     order_direction = request.args.get('order_direction')
+    count_mode = request.args.get('count', 'exact')
+    search_mode = request.args.get('search', 'contains')
 
     filters = {
-        'name': name
+        'name': name,
+        'search_mode': search_mode
     }
-    return jsonify(green_angel_controller.get_green_angels(page, per_page, filters, order_by, order_direction))
+    return jsonify(green_angel_controller.get_green_angels(page, per_page, filters, order_by, order_direction, count_mode))
 
 @green_angel_bp.route('/<int:green_angel_id>', methods=['GET'])
 @inject
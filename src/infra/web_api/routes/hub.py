@@ -4,6 +4,7 @@ from dependency_injector.wiring import inject, Provide
 from src.interface.web.schemas.hub import HubCreateSchema, HubUpdateSchema
 from src.interface.web.controller.hub import HubController
 from src.interface.web.middleware.auth import auth_required
+from src.interface.web.middleware.read_replica import read_replica
 from src.infra.init.injector import Container
 
 hub_bp = Blueprint('hub', __name__, url_prefix='/api/v1/hubs')
@@ -11,6 +12,7 @@ hub_bp = Blueprint('hub', __name__, url_prefix='/api/v1/hubs')
 @hub_bp.route('', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_hubs(hub_controller: HubController = Provide[Container.hub_controller]):
     """
     Get a list of hubs
@@ -32,6 +34,18 @@ def get_hubs(hub_controller: HubController = Provide[Container.hub_controller]):
         required: false
         default: 20
         description: The number of hubs to retrieve per page.
+      - name: count
+        in: query
+        type: string
+        required: false
+        default: exact
+        description: How total_pages is counted (exact or estimated). Estimated uses planner row estimates and is approximate.
+      - name: search
+        in: query
+        type: string
+        required: false
+        default: contains
+        description: Name matching mode (contains or similarity). Similarity also matches misspelled names and ranks by closeness.
     responses:
       200:
         description: A list of hubs
@@ -70,11 +84,14 @@ def get_hubs(hub_controller: HubController = Provide[Container.hub_controller]):
     name = request.args.get('name')
     order_by = request.args.get('order_by')
     order_direction = request.args.get('order_direction')
+    count_mode = request.args.get('count', 'exact')
+    search_mode = request.args.get('search', 'contains')
 
     filters = {
-        'name': name
+        'name': name,
+        'search_mode': search_mode
     }
-    return jsonify(hub_controller.get_hubs(page, per_page, filters, order_by, order_direction))
+    return jsonify(hub_controller.get_hubs(page, per_page, filters, order_by, order_direction, count_mode))
 
 @hub_bp.route('/<int:hub_id>', methods=['GET'])
 @inject
@@ -137,6 +154,9 @@ def create_hub(hub_controller: HubController = Provide[Container.hub_controller]
             name:
               type: string
               description: The hub name.
+            state:
+              type: string
+              description: The hub's state (UF, e.g. SP), used for regional holidays.
     responses:
       201:
         description: The created hub
@@ -187,6 +207,9 @@ def update_hub(hub_id: int, hub_controller: HubController = Provide[Container.hu
             name:
               type: string
               description: The hub name.
+            state:
+              type: string
+              description: The hub's state (UF, e.g. SP), used for regional holidays.
     responses:
       200:
         description: The updated hub
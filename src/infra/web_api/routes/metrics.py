@@ -3,6 +3,7 @@ from dependency_injector.wiring import inject, Provide
 
 from src.interface.web.controller.attendance import AttendanceController
 from src.interface.web.middleware.auth import auth_required
+from src.interface.web.middleware.read_replica import read_replica
 from src.infra.init.injector import Container
 
 metric_bp = Blueprint('metric', __name__, url_prefix='/api/v1/metrics')
@@ -10,6 +11,7 @@ metric_bp = Blueprint('metric', __name__, url_prefix='/api/v1/metrics')
 @metric_bp.route('/productivity', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_productivity_metrics(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
     """
     Get productivity metrics
@@ -29,6 +31,12 @@ def get_productivity_metrics(attendance_controller: AttendanceController = Provi
         type: integer
         required: false
         description: The number of records per page.
+      - name: count
+        in: query
+        type: string
+        required: false
+        default: exact
+        description: How total_pages is counted (exact or estimated). Estimated uses planner row estimates and is approximate.
       - name: date_from
         in: query
         type: string
@@ -41,6 +49,18 @@ def get_productivity_metrics(attendance_controller: AttendanceController = Provi
         format: date
         required: false
         description: Filter records up to this date (YYYY-MM-DD).
+      - name: hub_id
+        in: query
+        type: integer
+        required: false
+        description: Only count attendances of this hub; working days then follow the hub's regional holidays.
+      - name: freshness
+        in: query
+        type: string
+        required: false
+        default: live
+        enum: [live, materialized]
+        description: live aggregates the tables; materialized reads the periodically refreshed views (see refreshed_at).
     responses:
       200:
         description: Productivity metrics
@@ -65,6 +85,12 @@ def get_productivity_metrics(attendance_controller: AttendanceController = Provi
                   metric:
                     type: string
                     description: Additional productivity-related data.
+            freshness:
+              type: string
+              description: Source actually used; materialized falls back to live for filters the views cannot answer.
+            refreshed_at:
+              type: string
+              description: Last refresh of the materialized view, null for live results.
       401:
         description: Unauthorized
       500:
@@ -78,18 +104,117 @@ def get_productivity_metrics(attendance_controller: AttendanceController = Provi
     date_to = request.args.get('date_to')
     order_by = request.args.get('order_by')
     order_direction = request.args.get('order_direction')
+    hub_id = request.args.get('hub_id', type=int)
+    freshness = request.args.get('freshness', 'live')
+    count_mode = request.args.get('count', 'exact')
 
     filters = {
         'date_from': date_from,
-        'date_to': date_to
+        'date_to': date_to,
+        'hub_id': hub_id,
+        'freshness': freshness
     }
 
-    return jsonify(attendance_controller.get_productivity_metrics(page, per_page, filters, order_by, order_direction))
+    return jsonify(attendance_controller.get_productivity_metrics(page, per_page, filters, order_by, order_direction, count_mode))
+
+
+@metric_bp.route('/productivity/timeseries', methods=['GET'])
+@inject
+@auth_required
+@read_replica
+def get_productivity_timeseries(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
+    """
+    Get productivity time series
+    ---
+    tags:
+      - Attendances
+    summary: Retrieve attendances per day, bucketed by day, week or month
+    description: One item per bucket of attendance date, for trend charts.
+    parameters:
+      - name: interval
+        in: query
+        type: string
+        required: false
+        default: day
+        enum: [day, week, month]
+        description: Bucket size. Weeks start on Monday.
+      - name: date_from
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Only attendances on or after this day (YYYY-MM-DD).
+      - name: date_to
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Only attendances on or before this day (YYYY-MM-DD).
+      - name: hub_id
+        in: query
+        type: integer
+        required: false
+        description: Filter by hub ID; working days then follow the hub's regional holidays.
+      - name: green_angel_id
+        in: query
+        type: integer
+        required: false
+        description: Filter by green angel ID.
+    responses:
+      200:
+        description: Productivity per bucket
+        schema:
+          type: object
+          properties:
+            interval:
+              type: string
+              description: The bucket size used.
+            size:
+              type: integer
+              description: Number of buckets.
+            items:
+              type: array
+              items:
+                type: object
+                properties:
+                  bucket:
+                    type: string
+                    format: date
+                    description: First day of the bucket.
+                  total_attendances:
+                    type: integer
+                    description: Attendances in the bucket.
+                  green_angels:
+                    type: integer
+                    description: Green angels with at least one attendance in the bucket.
+                  working_days:
+                    type: integer
+                    description: Working days of the bucket inside the requested range.
+                  attendances_per_day:
+                    type: number
+                    description: Attendances per working day and green angel.
+      401:
+        description: Unauthorized
+      500:
+        description: Internal server error
+    security:
+      - Bearer: []
+    """
+    interval = request.args.get('interval', 'day')
+    filters = {
+        'date_from': request.args.get('date_from'),
+        'date_to': request.args.get('date_to'),
+        'hub_id': request.args.get('hub_id', type=int),
+        'green_angel_id': request.args.get('green_angel_id', type=int)
+    }
+
+    return jsonify(attendance_controller.get_productivity_timeseries(filters, interval))
 
 
 @metric_bp.route('/sla', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_sla_metrics(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
     """
     Get SLA compliance metrics
@@ -98,15 +223,150 @@ def get_sla_metrics(attendance_controller: AttendanceController = Provide[Contai
       - Attendances
     summary: Retrieve SLA compliance metrics for the attendance system
     description: Retrieve metrics related to SLA compliance, such as the SLA compliance rate and any other related data.
+    parameters:
+      - name: date_from
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Only attendances whose limit date is on or after this day (YYYY-MM-DD).
+      - name: date_to
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Only attendances whose limit date is on or before this day (YYYY-MM-DD).
+      - name: hub_id
+        in: query
+        type: integer
+        required: false
+        description: Filter by hub ID.
+      - name: green_angel_id
+        in: query
+        type: integer
+        required: false
+        description: Filter by green angel ID.
     responses:
       200:
         description: SLA compliance metrics
         schema:
           type: object
           properties:
-            sla_compliance_rate:
-              type: string
+            total:
+              type: integer
+              description: Number of active attendances.
+            on_time:
+              type: integer
+              description: Attendances completed on or before the limit date.
+            late:
+              type: integer
+              description: Attendances completed after the limit date.
+            not_attended:
+              type: integer
+              description: Attendances without an attendance date yet.
+            on_time_percentage:
+              type: number
               description: Percentage of attendances meeting SLA criteria.
+            late_percentage:
+              type: number
+              description: Percentage of attendances completed late.
+            not_attended_percentage:
+              type: number
+              description: Percentage of attendances not attended yet.
+      401:
+        description: Unauthorized
+      500:
+        description: Internal server error
+    security:
+      - Bearer: []
+    """
+    filters = {
+        'date_from': request.args.get('date_from'),
+        'date_to': request.args.get('date_to'),
+        'hub_id': request.args.get('hub_id', type=int),
+        'green_angel_id': request.args.get('green_angel_id', type=int)
+    }
+
+    return jsonify(attendance_controller.get_sla_metrics(filters))
+
+@metric_bp.route('/sla/timeseries', methods=['GET'])
+@inject
+@auth_required
+@read_replica
+def get_sla_timeseries(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
+    """
+    Get SLA compliance time series
+    ---
+    tags:
+      - Attendances
+    summary: Retrieve SLA compliance bucketed by day, week or month
+    description: One item per bucket of limit date, for trend charts. Served from the sla_rollup table.
+    parameters:
+      - name: interval
+        in: query
+        type: string
+        required: false
+        default: day
+        enum: [day, week, month]
+        description: Bucket size. Weeks start on Monday.
+      - name: date_from
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Only attendances whose limit date is on or after this day (YYYY-MM-DD).
+      - name: date_to
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Only attendances whose limit date is on or before this day (YYYY-MM-DD).
+      - name: hub_id
+        in: query
+        type: integer
+        required: false
+        description: Filter by hub ID.
+      - name: green_angel_id
+        in: query
+        type: integer
+        required: false
+        description: Filter by green angel ID.
+    responses:
+      200:
+        description: SLA compliance per bucket
+        schema:
+          type: object
+          properties:
+            interval:
+              type: string
+              description: The bucket size used.
+            size:
+              type: integer
+              description: Number of buckets.
+            items:
+              type: array
+              items:
+                type: object
+                properties:
+                  bucket:
+                    type: string
+                    format: date
+                    description: First day of the bucket.
+                  total:
+                    type: integer
+                    description: Number of active attendances.
+                  on_time:
+                    type: integer
+                    description: Attendances completed on or before the limit date.
+                  late:
+                    type: integer
+                    description: Attendances completed after the limit date.
+                  not_attended:
+                    type: integer
+                    description: Attendances without an attendance date yet.
+                  on_time_percentage:
+                    type: number
+                    description: Percentage of attendances meeting SLA criteria.
       401:
         description: Unauthorized
       500:
@@ -114,11 +374,20 @@ def get_sla_metrics(attendance_controller: AttendanceController = Provide[Contai
     security:
       - Bearer: []
     """
-    return jsonify(attendance_controller.get_sla_metrics())
+    interval = request.args.get('interval', 'day')
+    filters = {
+        'date_from': request.args.get('date_from'),
+        'date_to': request.args.get('date_to'),
+        'hub_id': request.args.get('hub_id', type=int),
+        'green_angel_id': request.args.get('green_angel_id', type=int)
+    }
+
+    return jsonify(attendance_controller.get_sla_timeseries(filters, interval))
 
 @metric_bp.route('/sla/green-angel', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_sla_by_green_angels(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
     """
     Get SLA compliance metrics by Green Angel
@@ -127,6 +396,33 @@ def get_sla_by_green_angels(attendance_controller: AttendanceController = Provid
       - Attendances
     summary: Retrieve SLA compliance metrics for the attendance system by Green Angel
     description: Retrieve metrics related to SLA compliance by Green Angel, such as the SLA compliance rate and any other related data.
+    parameters:
+      - name: freshness
+        in: query
+        type: string
+        required: false
+        default: live
+        enum: [live, materialized]
+        description: live aggregates the tables; materialized reads the periodically refreshed views (see refreshed_at).
+      - name: order_by
+        in: query
+        type: string
+        required: false
+        default: id
+        enum: [id, name, total, on_time, late, on_time_percentage]
+        description: Sort key; the aggregates are ordered server-side, ties broken by ID.
+      - name: order_direction
+        in: query
+        type: string
+        required: false
+        default: asc
+        enum: [asc, desc]
+        description: Sort direction.
+      - name: top_n
+        in: query
+        type: integer
+        required: false
+        description: Leaderboard mode, returns only the first N rows of the ordering in a single page.
     responses:
       200:
         description: SLA compliance metrics by Green Angel
@@ -139,6 +435,12 @@ def get_sla_by_green_angels(attendance_controller: AttendanceController = Provid
             sla_compliance_rate:
               type: string
               description: Percentage of attendances meeting SLA criteria.
+            freshness:
+              type: string
+              description: Source actually used; materialized falls back to live for filters the views cannot answer.
+            refreshed_at:
+              type: string
+              description: Last refresh of the materialized view, null for live results.
       401:
         description: Unauthorized
       500:
@@ -150,19 +452,32 @@ def get_sla_by_green_angels(attendance_controller: AttendanceController = Provid
     per_page = request.args.get('per_page', 20, type=int)
     green_angel_id = request.args.get('green_angel_id', type=int)
     green_angel_name = request.args.get('green_angel_name')
+    hub_id = request.args.get('hub_id', type=int)
+    date_from = request.args.get('date_from')
+    date_to = request.args.get('date_to')
     order_by = request.args.get('order_by')
     order_direction = request.args.get('order_direction')
+    freshness = request.args.get('freshness', 'live')
+    top_n = request.args.get('top_n', type=int)
+    count_mode = request.args.get('count', 'exact')
+    search_mode = request.args.get('search', 'contains')
 
     filters = {
         'green_angel_id': green_angel_id,
-        'green_angel_name': green_angel_name
+        'green_angel_name': green_angel_name,
+        'hub_id': hub_id,
+        'date_from': date_from,
+        'date_to': date_to,
+        'search_mode': search_mode,
+        'freshness': freshness
     }
 
-    return jsonify(attendance_controller.get_sla_metrics_by_green_angels(page, per_page, filters, order_by, order_direction))
+    return jsonify(attendance_controller.get_sla_metrics_by_green_angels(page, per_page, filters, order_by, order_direction, count_mode, top_n))
 
 @metric_bp.route('/sla/green-angel/<int:green_angel_id>', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_sla_by_green_angel(green_angel_id: int, attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
     """
     Get SLA compliance metrics by Green Angel
@@ -202,6 +517,7 @@ def get_sla_by_green_angel(green_angel_id: int, attendance_controller: Attendanc
 @metric_bp.route('/sla/hub', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_sla_by_hubs(attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
     """
     Get SLA compliance metrics by Hub
@@ -210,6 +526,33 @@ def get_sla_by_hubs(attendance_controller: AttendanceController = Provide[Contai
       - Attendances
     summary: Retrieve SLA compliance metrics for the attendance system by Hub
     description: Retrieve metrics related to SLA compliance by Hub, such as the SLA compliance rate and any other related data.
+    parameters:
+      - name: freshness
+        in: query
+        type: string
+        required: false
+        default: live
+        enum: [live, materialized]
+        description: live aggregates the tables; materialized reads the periodically refreshed views (see refreshed_at).
+      - name: order_by
+        in: query
+        type: string
+        required: false
+        default: id
+        enum: [id, name, total, on_time, late, on_time_percentage]
+        description: Sort key; the aggregates are ordered server-side, ties broken by ID.
+      - name: order_direction
+        in: query
+        type: string
+        required: false
+        default: asc
+        enum: [asc, desc]
+        description: Sort direction.
+      - name: top_n
+        in: query
+        type: integer
+        required: false
+        description: Leaderboard mode, returns only the first N rows of the ordering in a single page.
     responses:
       200:
         description: SLA compliance metrics by Hub
@@ -222,6 +565,12 @@ def get_sla_by_hubs(attendance_controller: AttendanceController = Provide[Contai
             sla_compliance_rate:
               type: string
               description: Percentage of attendances meeting SLA criteria.
+            freshness:
+              type: string
+              description: Source actually used; materialized falls back to live for filters the views cannot answer.
+            refreshed_at:
+              type: string
+              description: Last refresh of the materialized view, null for live results.
       401:
         description: Unauthorized
       500:
@@ -233,19 +582,32 @@ def get_sla_by_hubs(attendance_controller: AttendanceController = Provide[Contai
     per_page = request.args.get('per_page', 20, type=int)
     hub_id = request.args.get('hub_id', type=int)
     hub_name = request.args.get('hub_name')
+    green_angel_id = request.args.get('green_angel_id', type=int)
+    date_from = request.args.get('date_from')
+    date_to = request.args.get('date_to')
     order_by = request.args.get('order_by')
     order_direction = request.args.get('order_direction')
+    freshness = request.args.get('freshness', 'live')
+    top_n = request.args.get('top_n', type=int)
+    count_mode = request.args.get('count', 'exact')
+    search_mode = request.args.get('search', 'contains')
 
     filters = {
         'hub_id': hub_id,
-        'hub_name': hub_name
+        'hub_name': hub_name,
+        'green_angel_id': green_angel_id,
+        'date_from': date_from,
+        'date_to': date_to,
+        'search_mode': search_mode,
+        'freshness': freshness
     }
 
-    return jsonify(attendance_controller.get_sla_metrics_by_hubs(page, per_page, filters, order_by, order_direction))
+    return jsonify(attendance_controller.get_sla_metrics_by_hubs(page, per_page, filters, order_by, order_direction, count_mode, top_n))
 
 @metric_bp.route('/sla/hub/<int:hub_id>', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_sla_by_hub(hub_id: int, attendance_controller: AttendanceController = Provide[Container.attendance_controller]):
     """
     Get SLA compliance metrics by Hub
@@ -4,6 +4,7 @@ from dependency_injector.wiring import inject, Provide
 from src.interface.web.schemas.user import (UserCreateSchema, UserUpdateSchema)
 from src.interface.web.controller.user import UserController
 from src.interface.web.middleware.auth import auth_required
+from src.interface.web.middleware.read_replica import read_replica
 from src.infra.init.injector import Container
 
 user_bp = Blueprint('user', __name__, url_prefix='/api/v1/users')
@@ -11,6 +12,7 @@ user_bp = Blueprint('user', __name__, url_prefix='/api/v1/users')
 @user_bp.route('', methods=['GET'])
 @inject
 @auth_required
+@read_replica
 def get_users(user_controller: UserController = Provide[Container.user_controller]):
     """
     Get a list of users
@@ -46,12 +48,15 @@ def get_users(user_controller: UserController = Provide[Container.user_controlle
     email = request.args.get('email')
     order_by = request.args.get('order_by')
     order_direction = request.args.get('order_direction')
+    count_mode = request.args.get('count', 'exact')
+    search_mode = request.args.get('search', 'contains')
 
     filters = {
         'name': name,
-        'email': email
+        'email': email,
+        'search_mode': search_mode
     }
-    return jsonify(user_controller.get_users(page, per_page, filters, order_by, order_direction))
+    return jsonify(user_controller.get_users(page, per_page, filters, order_by, order_direction, count_mode))
 
 @user_bp.route('/<int:user_id>', methods=['GET'])
 @inject
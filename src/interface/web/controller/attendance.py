@@ -1,4 +1,5 @@
-from src.interface.web.schemas.attendance import AttendanceCreateSchema, AttendanceSchema
+from src.interface.web.schemas.attendance import (
+    AttendanceCreateSchema, AttendanceSchema, AttendanceBulkCreateSchema, AttendanceBulkUpdateSchema, AttendanceBulkDeleteSchema)
 from src.application.service.attendance import AttendanceService
 
 
@@ -6,8 +7,8 @@ class AttendanceController:
     def __init__(self, attendance_service: AttendanceService):
         self.attendance_service = attendance_service
 
-    def get_attendances(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        return self.attendance_service.get_attendances_paginated(page, per_page, filters, order_by, order_direction)
+    def get_attendances(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, pagination: str = 'offset', cursor: str = None, count_mode: str = 'exact') -> dict:
+        return self.attendance_service.get_attendances_paginated(page, per_page, filters, order_by, order_direction, pagination, cursor, count_mode)
 
     def get_attendance(self, attendance_id: int) -> dict:
         return self.attendance_service.find_attendance(attendance_id)
@@ -21,20 +22,35 @@ class AttendanceController:
     def delete_attendance(self, attendance_id: int) -> dict:
         return self.attendance_service.delete_attendance(attendance_id)
 
-    def get_sla_metrics(self) -> dict:
-        return self.attendance_service.get_sla_metrics()
+    def create_attendances(self, attendances_create: AttendanceBulkCreateSchema) -> dict:
+        return self.attendance_service.create_attendances(attendances_create.items)
 
-    def get_sla_metrics_by_green_angels(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        return self.attendance_service.get_sla_paginated_by_green_angels(page, per_page, filters, order_by, order_direction)
+    def update_attendances(self, attendances_update: AttendanceBulkUpdateSchema) -> dict:
+        return self.attendance_service.update_attendances(attendances_update.items)
+
+    def delete_attendances(self, attendances_delete: AttendanceBulkDeleteSchema) -> dict:
+        return self.attendance_service.delete_attendances(attendances_delete.ids)
+
+    def get_sla_metrics(self, filters: dict = None) -> dict:
+        return self.attendance_service.get_sla_metrics(filters)
+
+    def get_sla_metrics_by_green_angels(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact', top_n: int = None) -> dict:
+        return self.attendance_service.get_sla_paginated_by_green_angels(page, per_page, filters, order_by, order_direction, count_mode, top_n)
 
     def get_sla_by_green_angel(self, green_angel_id: int) -> dict:
         return self.attendance_service.find_sla_by_green_angel(green_angel_id)
 
-    def get_sla_metrics_by_hubs(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        return self.attendance_service.get_sla_paginated_by_hubs(page, per_page, filters, order_by, order_direction)
+    def get_sla_metrics_by_hubs(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact', top_n: int = None) -> dict:
+        return self.attendance_service.get_sla_paginated_by_hubs(page, per_page, filters, order_by, order_direction, count_mode, top_n)
 
     def get_sla_by_hub(self, hub_id: int) -> dict:
         return self.attendance_service.find_sla_by_hub(hub_id)
 
-    def get_productivity_metrics(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        return self.attendance_service.get_productivity_paginated(page, per_page, filters, order_by, order_direction)
+    def get_productivity_metrics(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact') -> dict:
+        return self.attendance_service.get_productivity_paginated(page, per_page, filters, order_by, order_direction, count_mode)
+
+    def get_sla_timeseries(self, filters: dict, interval: str = 'day') -> dict:
+        return self.attendance_service.get_sla_timeseries(filters, interval)
+
+    def get_productivity_timeseries(self, filters: dict, interval: str = 'day') -> dict:
+        return self.attendance_service.get_productivity_timeseries(filters, interval)
@@ -0,0 +1,17 @@
+from typing import BinaryIO
+
+from src.application.service.attendance_import import AttendanceImportService
+
+
+class AttendanceImportController:
+    def __init__(self, attendance_import_service: AttendanceImportService):
+        self.attendance_import_service = attendance_import_service
+
+    def start_import(self, stream: BinaryIO, file_name: str = None) -> dict:
+        return self.attendance_import_service.start_import(stream, file_name)
+
+    def get_import(self, job_id: str) -> dict:
+        return self.attendance_import_service.find_import(job_id)
+
+    def get_import_rejects(self, job_id: str) -> str:
+        return self.attendance_import_service.find_import_rejects(job_id)
@@ -6,8 +6,8 @@ class ClientController:
     def __init__(self, client_service: ClientService):
         self.client_service = client_service
 
-    def get_clients(self, page: int, per_page: int, order_by: str, order_direction: str) -> dict:
-        return self.client_service.get_clients_paginated(page, per_page, order_by, order_direction)
+    def get_clients(self, page: int, per_page: int, order_by: str, order_direction: str, count_mode: str = 'exact') -> dict:
+        return self.client_service.get_clients_paginated(page, per_page, order_by, order_direction, count_mode)
 
     def get_client(self, client_id: int) -> dict:
         return self.client_service.find_client(client_id)
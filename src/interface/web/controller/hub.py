@@ -6,8 +6,8 @@ class HubController:
     def __init__(self, hub_service: HubService):
         self.hub_service = hub_service
 
-    def get_hubs(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str) -> dict:
-        return self.hub_service.get_hubs_paginated(page, per_page, filters, order_by, order_direction)
+    def get_hubs(self, page: int, per_page: int, filters: dict, order_by: str, order_direction: str, count_mode: str = 'exact') -> dict:
+        return self.hub_service.get_hubs_paginated(page, per_page, filters, order_by, order_direction, count_mode)
 
     def get_hub(self, hub_id: int) -> dict:
         return self.hub_service.find_hub(hub_id)
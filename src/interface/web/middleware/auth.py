@@ -3,9 +3,22 @@ from flask import request, jsonify
 
 from src.infra.config.config import get_settings
 from src.interface.web.middleware.jwt_handler import JWTHandler
+from src.interface.web.middleware.token_cache import TokenCache
 
 settings = get_settings()
 
+# Dashboards send many parallel requests with the same token; each process
+# verifies it once and serves the rest from here until the token expires
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE)
+
+def verify_token(token: str) -> dict:
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = JWTHandler.verify_access_token(token)
+        if payload is not None:
+            token_cache.put(token, payload)
+    return payload
+
 def auth_required(func):
     @wraps(func)
     def decorator(*args, **kwargs):
@@ -13,7 +26,7 @@ def auth_required(func):
         if token is None:
             return jsonify({"detail": "UNAUTHORIZED"}), 401
         token = token.removeprefix("Bearer ").strip()
-        payload = JWTHandler.verify_access_token(token)
+        payload = verify_token(token)
         if payload is None:
             return jsonify({"detail": "UNAUTHORIZED"}), 401
 
@@ -28,7 +41,7 @@ def state_auth_required(func):
         if token is None:
             return jsonify({"detail": "UNAUTHORIZED"}), 401
         token = token.removeprefix("Bearer ").strip()
-        payload = JWTHandler.verify_access_token(token)
+        payload = verify_token(token)
         if payload is None:
             return jsonify({"detail": "UNAUTHORIZED"}), 401
 
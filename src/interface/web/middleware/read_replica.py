@@ -0,0 +1,18 @@
+from functools import wraps
+
+from src.infra.database.database import ScopedSession
+
+
+def read_replica(func):
+    """Let the request's reads go to a replica; its writes still reach the primary.
+
+    Meant for listings and metrics, which tolerate a few seconds of
+    replication lag. Routes that must see a client's own recent writes,
+    like GET by id after a POST, stay unmarked and read from the primary.
+    """
+    @wraps(func)
+    def decorator(*args, **kwargs):
+        ScopedSession().info['replica'] = True
+        return func(*args, **kwargs)
+
+    return decorator
@@ -0,0 +1,66 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenCache:
+    """Bounded LRU cache of verified access tokens and their payloads.
+
+    Keys are SHA-256 digests, so raw tokens are never kept in memory.
+    An entry is dropped at its token's exp; after that the token goes
+    through full verification again, which rejects it as expired.
+    maxsize 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, token: str, payload: dict):
+        # Tokens without exp never expire on their own, so they are not cached
+        if not self.maxsize or 'exp' not in payload:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (payload, payload['exp'])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, token: str) -> bool:
+        """Drop token from this process's cache, so its next use is verified in full.
+
+        This is not a revocation: a token whose signature and exp are still
+        valid passes that verification and is cached again.
+        """
+        with self._lock:
+            return self._entries.pop(self._key(token), None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
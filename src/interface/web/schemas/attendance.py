@@ -1,4 +1,4 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from typing import Optional
 
@@ -35,9 +35,10 @@ class AttendanceJoinedSchema(AttendanceSchema):
 
 class AttendancesPaginatedSchema(BaseModel):
     size: int
-    total_pages: int
-    page: int
+    total_pages: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
+    next_cursor: Optional[str] = None
     items: list[AttendanceJoinedSchema]
 
     class Config:
@@ -87,3 +88,36 @@ class AttendanceUpdateSchema(BaseModel):
     class Config:
         arbitrary_types_allowed = True
         from_attributes = True
+
+
+# Largest batch accepted by the bulk endpoints
+MAX_BULK_ITEMS = 1000
+
+
+class AttendanceBulkCreateSchema(BaseModel):
+    items: list[AttendanceCreateSchema] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class AttendanceBulkUpdateItemSchema(AttendanceUpdateSchema):
+    id: int
+
+
+class AttendanceBulkUpdateSchema(BaseModel):
+    items: list[AttendanceBulkUpdateItemSchema] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class AttendanceBulkDeleteSchema(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class AttendanceBulkItemResultSchema(BaseModel):
+    index: int
+    id: Optional[int] = None
+    status: str
+    error: Optional[str] = None
+
+
+class AttendanceBulkResultSchema(BaseModel):
+    succeeded: int
+    failed: int
+    items: list[AttendanceBulkItemResultSchema]
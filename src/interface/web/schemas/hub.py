@@ -5,6 +5,7 @@ from typing import Optional
 class HubSchema(BaseModel):
     id: int
     name: str
+    state: Optional[str] = None
     is_active: bool
 
     class Config:
@@ -25,6 +26,7 @@ class HubsPaginatedSchema(BaseModel):
 
 class HubCreateSchema(BaseModel):
     name: str
+    state: Optional[str] = None
     is_active: Optional[bool] = None
 
     class Config:
@@ -34,6 +36,7 @@ class HubCreateSchema(BaseModel):
 
 class HubUpdateSchema(BaseModel):
     name: Optional[str] = None
+    state: Optional[str] = None
     is_active: Optional[bool] = None
 
     class Config:
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class ImportJobSchema(BaseModel):
+    id: str
+    file_name: Optional[str] = None
+    status: str
+    bytes_received: int
+    rows_processed: int
+    rows_inserted: int
+    rows_rejected: int
+    rows_per_second: float
+    has_rejects: bool = False
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        arbitrary_types_allowed = True
+        from_attributes = True
@@ -5,6 +5,7 @@ from flasgger import Swagger
 
 from src.infra.config.swagger_config import swagger_config
 from src.infra.init.injector import Container
+from src.infra.database.database import remove_session
 from src.infra.web_api.routes.user import user_bp
 from src.infra.web_api.routes.auth import auth_bp
 from src.infra.web_api.routes.attendance import attendance_bp
@@ -30,6 +31,8 @@ class CustomJSONProvider(DefaultJSONProvider):
 
 app.json = CustomJSONProvider(app)
 
+app.teardown_appcontext(remove_session)
+
 @app.errorhandler(DomainException)
 def handle_domain_exception(error):
     response = jsonify({
@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.pool import StaticPool
+
+from src.infra.database.replicas import ReplicaSet, RoutingSession
+from src.infra.repository.pagination import estimate_count
+
+metadata = MetaData()
+source = Table('source', metadata, Column('name', String))
+
+
+class TestReadReplica:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.engines = {}
+        for name in ['primary', 'replica_1', 'replica_2']:
+            engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+            metadata.create_all(engine)
+            with engine.begin() as conn:
+                conn.execute(insert(source).values(name=name))
+            self.engines[name] = engine
+        self.replicas = ReplicaSet([self.engines['replica_1'], self.engines['replica_2']], check_seconds=0)
+
+    def read(self, replica: bool = True) -> str:
+        session = RoutingSession(bind=self.engines['primary'], replicas=self.replicas)
+        session.info['replica'] = replica
+        try:
+            return session.execute(select(source.c.name)).scalar()
+        finally:
+            session.close()
+
+    def test_marked_sessions_read_from_replicas_in_turn(self):
+        """Test if marked sessions alternate between the replicas and unmarked ones read from the primary."""
+        assert [self.read() for _ in range(4)] == ['replica_1', 'replica_2', 'replica_1', 'replica_2']
+        assert self.read(replica=False) == 'primary'
+
+    def test_write_pins_the_session_to_the_primary(self):
+        """Test if a session reads from the primary after its first write."""
+        session = RoutingSession(bind=self.engines['primary'], replicas=self.replicas)
+        session.info['replica'] = True
+
+        assert session.execute(select(source.c.name)).scalar() == 'replica_1'
+        session.execute(insert(source).values(name='written'))
+        assert session.execute(select(source.c.name).where(source.c.name == 'written')).scalar() == 'written'
+        session.close()
+
+    def test_unhealthy_replicas_are_skipped(self, monkeypatch):
+        """Test if unhealthy replicas are skipped and reads fall back to the primary when none is healthy."""
+        down = {self.engines['replica_1']}
+        monkeypatch.setattr(self.replicas, '_probe', lambda replica: replica.engine not in down)
+
+        assert [self.read() for _ in range(3)] == ['replica_2'] * 3
+
+        down.add(self.engines['replica_2'])
+        assert self.read() == 'primary'
+
+    def test_estimated_count_asks_the_session_replica(self):
+        """Test if the count estimate runs on the replica the session reads from."""
+        session = RoutingSession(bind=self.engines['primary'], replicas=self.replicas)
+        session.info['replica'] = True
+
+        estimate_count(session.query(source))
+
+        assert session.info['replica_engine'] is self.engines['replica_1']
+        assert session.execute(select(source.c.name)).scalar() == 'replica_1'
+        session.close()
@@ -0,0 +1,54 @@
+import threading
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import text
+
+from src.infra.database.database import ScopedSession, remove_session
+from src.infra.init.injector import Container
+
+PARALLEL_REQUESTS = 50
+
+
+class TestScopedSession:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        container = Container()
+        self.barrier = threading.Barrier(PARALLEL_REQUESTS, timeout=10)
+        self.app = Flask(__name__)
+        self.app.teardown_appcontext(remove_session)
+
+        @self.app.route('/probe/<int:n>')
+        def probe(n: int):
+            db = container.attendance_repository().db
+            session = db()
+            first = db.execute(text('SELECT :n'), {'n': n}).scalar()
+            # Every request holds its session here until all 50 have one
+            self.barrier.wait()
+            second = db.execute(text('SELECT :n'), {'n': n}).scalar()
+            return jsonify({'session': id(session), 'values': [first, second]})
+
+    def test_parallel_requests_get_their_own_session(self):
+        """Test if 50 parallel requests run concurrently on separate sessions that are removed afterwards."""
+        results, errors = {}, []
+
+        def request(n: int):
+            try:
+                with self.app.test_client() as client:
+                    results[n] = client.get(f'/probe/{n}').get_json()
+                # The teardown hook closed and dropped this thread's session
+                assert not ScopedSession.registry.has()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=request, args=(n,)) for n in range(PARALLEL_REQUESTS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # A shared or serialised session would break the barrier or mix the values
+        assert errors == []
+        assert all(results[n]['values'] == [n, n] for n in range(PARALLEL_REQUESTS))
+        assert len({result['session'] for result in results.values()}) == PARALLEL_REQUESTS
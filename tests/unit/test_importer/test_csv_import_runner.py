@@ -0,0 +1,47 @@
+import gzip
+import hashlib
+import io
+import os
+import pytest
+
+from src.domain.exception.domain_exception import DomainException
+from src.domain.exception.error_code import ErrorCode
+from src.infra.importer.csv_import_runner import CsvImportRunner
+
+
+class TestCsvImportRunner:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.runner = CsvImportRunner()
+        self.csv = b'id_atendimento;id_cliente;angel;polo;data_limite;data_de_atendimento\n' + b'1;1;angel;hub;2024-12-10 18:00:00;\n' * 1000
+
+    def test_spool_plain_csv(self):
+        """Test if a plain upload is copied to disk with its hash and size."""
+        path, file_hash, received = self.runner.spool(io.BytesIO(self.csv))
+
+        with open(path, 'rb') as csv_file:
+            assert csv_file.read() == self.csv
+        os.remove(path)
+        assert file_hash == hashlib.sha256(self.csv).hexdigest()
+        assert received == len(self.csv)
+
+    def test_spool_gzip_csv(self):
+        """Test if a gzip upload is inflated while it is copied."""
+        body = gzip.compress(self.csv)
+        path, file_hash, received = self.runner.spool(io.BytesIO(body))
+
+        with open(path, 'rb') as csv_file:
+            assert csv_file.read() == self.csv
+        os.remove(path)
+        assert file_hash == hashlib.sha256(self.csv).hexdigest()
+        assert received == len(body)
+
+    def test_spool_truncated_gzip(self):
+        """Test if a truncated gzip upload raises INVALID_IMPORT_FILE."""
+        body = gzip.compress(self.csv)[:-20]
+
+        with pytest.raises(DomainException) as exc:
+            self.runner.spool(io.BytesIO(body))
+
+        assert exc.value.error_code == ErrorCode.INVALID_IMPORT_FILE
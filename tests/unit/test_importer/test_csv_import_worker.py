@@ -0,0 +1,80 @@
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.domain.entities.import_job import ImportJob
+from src.infra.importer import csv_import_worker
+from src.infra.importer.csv_import_worker import CsvImportWorker
+
+
+class TestCsvImportWorker:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        engine = create_engine('sqlite://', poolclass=StaticPool)
+        ImportJob.__table__.create(engine)
+        self.Session = sessionmaker(bind=engine)
+        monkeypatch.setattr(csv_import_worker, 'SessionLocal', self.Session)
+
+        self.imports = []
+        self.failure = None
+
+        def importer(path, **options):
+            self.imports.append((path, options))
+            if self.failure:
+                raise self.failure
+            return SimpleNamespace(run=lambda: SimpleNamespace(failed=0))
+
+        monkeypatch.setattr(csv_import_worker, 'CsvImporter', importer)
+
+        self.upload = tmp_path / 'upload.csv'
+        self.rejects = tmp_path / 'upload_rejects.csv'
+        self.upload.write_text('csv')
+        self.rejects.write_text('rejects')
+        self.worker = CsvImportWorker(poll_seconds=0)
+
+    def add_job(self, **fields) -> str:
+        with self.Session() as db:
+            db.add(ImportJob(id='job', file_hash='a' * 64, file_path=str(self.upload), **fields))
+            db.commit()
+        return 'job'
+
+    def job(self) -> ImportJob:
+        with self.Session() as db:
+            return db.get(ImportJob, 'job')
+
+    def test_interrupted_job_is_requeued_and_resumed(self):
+        """Test if a job left running is requeued at start and resumed under its own checkpoints."""
+        started_at = datetime(2024, 12, 10, 18, 0, 0)
+        self.add_job(status='running', started_at=started_at)
+        self.worker.stop()
+
+        self.worker.run()
+        assert self.job().status == 'queued'
+
+        assert self.worker.run_next() is True
+        path, options = self.imports[0]
+        assert (path, options['job_id'], options['resume'], options['rejects_path']) == (str(self.upload), 'job', True, str(self.rejects))
+        job = self.job()
+        assert (job.status, job.started_at) == ('completed', started_at)
+        assert job.file_path is None and not os.path.exists(self.upload)
+        assert job.rejects_path == str(self.rejects) and os.path.exists(self.rejects)
+        assert self.worker.run_next() is False
+
+    def test_failed_import_marks_job_failed(self):
+        """Test if an import error fails the job and keeps its upload and rejected rows."""
+        self.add_job(status='queued')
+        self.failure = FileNotFoundError('upload.csv')
+
+        self.worker.run_next()
+
+        job = self.job()
+        assert (job.status, job.error) == ('failed', 'upload.csv')
+        assert job.finished_at is not None
+        assert (job.file_path, job.rejects_path) == (str(self.upload), str(self.rejects))
+        assert os.path.exists(self.upload) and os.path.exists(self.rejects)
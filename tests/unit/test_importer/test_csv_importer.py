@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.infra.database.seeder import seed_from_csv
+from src.infra.database.seeder.seed_from_csv import CsvImporter, normalize_batch
+
+ROWS = 95
+# Every tenth row has no data_limite and is rejected
+REJECTED = ROWS // 10
+
+
+class FakeCursor:
+    """Runs the importer's checkpoint statements against an in-memory table."""
+
+    def __init__(self, checkpoints: dict):
+        self.checkpoints = checkpoints
+        self.result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, sql, params=None):
+        if sql is seed_from_csv.INSERT_CHECKPOINT_SQL:
+            file_hash, job_id, start_offset, *values = params
+            self.checkpoints[(file_hash, job_id, start_offset)] = values
+        elif sql is seed_from_csv.SELECT_CHECKPOINTS_SQL:
+            self.result = sorted((key[2], values[0], values[1] + values[2]) for key, values in self.checkpoints.items() if key[:2] == params)
+        elif sql is seed_from_csv.DELETE_CHECKPOINTS_SQL:
+            for key in [key for key in self.checkpoints if key[:2] == params]:
+                del self.checkpoints[key]
+        elif sql is seed_from_csv.DELETE_CHECKPOINTS_FROM_SQL:
+            for key in [key for key in self.checkpoints if key[:2] == params[:2] and key[2] >= params[2]]:
+                del self.checkpoints[key]
+
+    def fetchall(self):
+        return self.result
+
+
+class FakePool:
+    def __init__(self, checkpoints: dict):
+        conn = SimpleNamespace(cursor=lambda: FakeCursor(checkpoints), commit=lambda: None, rollback=lambda: None)
+        self.getconn = lambda: conn
+        self.putconn = lambda conn: None
+        self.closeall = lambda: None
+
+
+class TestCsvImporter:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        self.checkpoints = {}
+        monkeypatch.setattr(seed_from_csv, 'pool', SimpleNamespace(ThreadedConnectionPool=lambda *args: FakePool(self.checkpoints)))
+        monkeypatch.setattr(seed_from_csv.DimensionCache, 'resolve', lambda cache, conn, batch_df: 0)
+        monkeypatch.setattr(seed_from_csv, 'load_batch', lambda cur, buffer: buffer.getvalue().count('\n'))
+
+        self.csv_path = tmp_path / 'attendances.csv'
+        self.rejects_path = tmp_path / 'rejects.csv'
+        lines = ['id_atendimento;id_cliente;angel;polo;data_limite;data_de_atendimento']
+        lines += [f"{n};1;angel;hub;{'' if n % 10 == 9 else '2024-12-10 18:00:00'};" for n in range(ROWS)]
+        self.csv_path.write_text('\n'.join(lines) + '\n')
+
+    def run(self, batch: int, resume: bool):
+        return CsvImporter(str(self.csv_path), workers=2, shapers=1, rejects_path=str(self.rejects_path), min_batch=batch,
+                           max_batch=batch, resume=resume, retries=0, file_hash='a' * 64, job_id='job').run()
+
+    def test_resume_with_other_batch_size_counts_every_row_once(self):
+        """Test if a resume with new batch boundaries leaves checkpoints and rejects covering each row once."""
+        self.run(batch=10, resume=False)
+        # A batch in the middle never committed: resume starts after the first three
+        del self.checkpoints[sorted(self.checkpoints)[3]]
+
+        self.run(batch=7, resume=True)
+
+        totals = [sum(values[i] for values in self.checkpoints.values()) for i in (2, 3, 4)]
+        assert totals == [ROWS, ROWS - REJECTED, REJECTED]
+        rejects = pd.read_csv(self.rejects_path, sep=';')
+        assert sorted(rejects['row']) == [n for n in range(ROWS) if n % 10 == 9]
+
+    def test_writer_error_fails_the_batch_and_keeps_draining(self, monkeypatch):
+        """Test if an error outside the write counts the batch as failed instead of stopping its writer."""
+        def write(rejects, rejects_df):
+            raise OSError('disk full')
+
+        monkeypatch.setattr(seed_from_csv.RejectsFile, 'write', write)
+
+        stats = self.run(batch=10, resume=False)
+
+        assert stats.failed == 10
+        assert self.checkpoints == {}
+
+
+class TestNormalizeBatch:
+
+    def test_rows_the_insert_would_skip_are_rejected(self):
+        """Test if rows with missing or invalid ids, angel or polo are rejected with their reason."""
+        batch_df = pd.DataFrame({
+            'id_atendimento': ['1', '', 'x', '4', '5', '6', '7', '8.5'],
+            'id_cliente': ['1', '1', '1', '', 'y', '1', '1', '1'],
+            'angel': ['angel', 'angel', 'angel', 'angel', 'angel', None, 'angel', 'angel'],
+            'polo': ['hub', 'hub', 'hub', 'hub', 'hub', 'hub', ' ', 'hub'],
+            'data_limite': ['2024-12-10 18:00:00'] * 8,
+            'data_de_atendimento': [None] * 8
+        })
+
+        batch_df, rejects_df = normalize_batch(batch_df)
+
+        assert batch_df['id_atendimento'].tolist() == [1]
+        assert rejects_df['reason'].tolist() == [
+            'missing id_atendimento', 'invalid id_atendimento', 'missing id_cliente', 'invalid id_cliente',
+            'missing angel', 'missing polo', 'invalid id_atendimento'
+        ]
@@ -0,0 +1,52 @@
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from src.interface.web.middleware import auth
+from src.interface.web.middleware.jwt_handler import JWTHandler
+from src.interface.web.middleware.token_cache import TokenCache
+
+
+class TestTokenCache:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.cache = TokenCache(maxsize=2)
+        monkeypatch.setattr(auth, 'token_cache', self.cache)
+        self.token = JWTHandler.create_access_token({'sub': 'admin@admin.com', 'id': 1})
+
+    def test_repeated_token_is_verified_once(self):
+        """Test if a repeated token is decoded once and then served from the cache."""
+        with patch.object(jwt, 'decode', wraps=jwt.decode) as decode:
+            payloads = [auth.verify_token(self.token) for _ in range(5)]
+
+        assert decode.call_count == 1
+        assert all(payload['sub'] == 'admin@admin.com' for payload in payloads)
+        assert self.cache.stats() == {'size': 1, 'hits': 4, 'misses': 1}
+
+    def test_entries_are_evicted_at_exp_and_by_size(self):
+        """Test if entries expire at the token's exp and the least recently used one is evicted when full."""
+        self.cache.put('expired', {'sub': 'a', 'exp': int(time.time()) - 1})
+        assert self.cache.get('expired') is None
+        assert self.cache.stats()['size'] == 0
+
+        exp = int(time.time()) + 60
+        for token in ['first', 'second']:
+            self.cache.put(token, {'sub': token, 'exp': exp})
+        self.cache.get('first')
+        self.cache.put('third', {'sub': 'third', 'exp': exp})
+
+        assert self.cache.get('second') is None
+        assert self.cache.get('first')['sub'] == 'first'
+
+    def test_evicted_token_is_verified_again(self):
+        """Test if an evicted token is removed and verified in full on its next use."""
+        auth.verify_token(self.token)
+
+        assert self.cache.evict(self.token) is True
+        assert self.cache.evict(self.token) is False
+        with patch.object(jwt, 'decode', wraps=jwt.decode) as decode:
+            auth.verify_token(self.token)
+        assert decode.call_count == 1
@@ -0,0 +1,168 @@
+import pytest
+from datetime import datetime
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.attendance import Attendance
+from src.domain.entities.client import Client
+from src.domain.entities.green_angel import GreenAngel
+from src.domain.entities.hub import Hub
+from src.domain.entities.sla_rollup import SlaRollup
+from src.domain.entities.metric_view import MetricViewRefresh, SlaByHubView, ProductivityDailyView, views
+from src.infra.database.database import Base
+from src.infra.repository.attendance import AttendanceRepository
+
+
+class TestAttendanceRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(bind=engine, tables=[
+            Client.__table__, GreenAngel.__table__, Hub.__table__, Attendance.__table__, SlaRollup.__table__
+        ])
+        self.session = sessionmaker(bind=engine)()
+        self.statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: self.statements.append(args[2]))
+
+        limit_date = datetime(2024, 12, 10, 18, 0, 0)
+        self.session.add_all([Client(id=1), GreenAngel(id=1, name="angel"), Hub(id=1, name="hub")])
+        self.session.add_all([
+            Attendance(id=1, client_id=1, green_angel_id=1, hub_id=1, limit_date=limit_date, attendance_date=datetime(2024, 12, 9)),
+            Attendance(id=2, client_id=1, green_angel_id=1, hub_id=1, limit_date=limit_date, attendance_date=datetime(2024, 12, 11)),
+            Attendance(id=3, client_id=1, green_angel_id=1, hub_id=1, limit_date=limit_date, attendance_date=None),
+            Attendance(id=4, client_id=1, green_angel_id=1, hub_id=1, limit_date=limit_date, attendance_date=None, is_active=False)
+        ])
+        self.session.add(SlaRollup(green_angel_id=1, hub_id=1, day=limit_date.date(), total=3, on_time=1, late=1, pending=1))
+        self.session.commit()
+        self.statements.clear()
+
+        self.attendance_repository = AttendanceRepository(self.session)
+
+    def test_get_sla_metrics_live_single_query(self):
+        """Test if the live SLA summary separates not attended rows in one query."""
+        sla = self.attendance_repository.get_sla_metrics({'client_id': 1})
+
+        assert len(self.statements) == 1
+        assert 'FILTER (WHERE' in self.statements[0]
+        assert (sla['total'], sla['on_time'], sla['late'], sla['not_attended']) == (3, 1, 1, 1)
+
+    def test_get_sla_metrics_from_rollup(self):
+        """Test if the unfiltered SLA summary reads the rollup table."""
+        sla = self.attendance_repository.get_sla_metrics({'date_from': '2024-12-10', 'date_to': '2024-12-10'})
+
+        assert len(self.statements) == 1
+        assert 'sla_rollup' in self.statements[0]
+        assert (sla['total'], sla['on_time'], sla['late'], sla['not_attended']) == (3, 1, 1, 1)
+
+    def test_get_sla_metrics_date_range_excludes_other_days(self):
+        """Test if the date range is applied to the limit date day."""
+        sla = self.attendance_repository.get_sla_metrics({'date_from': '2024-12-11'})
+
+        assert sla['total'] == 0
+        assert sla['on_time_percentage'] == 0
+
+    def test_sla_percentages_share_one_rounding(self):
+        """Test if the SLA summary and the per-hub SLA round their percentages the same way."""
+        summary = self.attendance_repository.get_sla_metrics({'client_id': 1})
+        hub = self.attendance_repository.find_sla_by_hub_id(1)
+
+        assert summary['on_time_percentage'] == hub['on_time_percentage'] == 33.33
+        assert summary['late_percentage'] == hub['late_percentage'] == 33.33
+
+    def test_bulk_insert_returns_ids_in_row_order(self):
+        """Test if a bulk insert returns the new ids in the order of its rows."""
+        rows = [
+            {'client_id': 1, 'green_angel_id': 1, 'hub_id': 1, 'limit_date': datetime(2024, 12, day), 'attendance_date': None, 'is_active': True}
+            for day in (1, 2, 3)
+        ]
+
+        ids = self.attendance_repository.bulk_insert(rows)
+
+        assert [self.session.get(Attendance, attendance_id).limit_date.day for attendance_id in ids] == [1, 2, 3]
+
+    def test_get_productivity_counts_each_green_angel_from_first_attendance(self):
+        """Test if each green angel's working days start at their own first attendance in the range."""
+        self.session.add_all([
+            GreenAngel(id=2, name="late starter"),
+            Attendance(id=5, client_id=1, green_angel_id=2, hub_id=1, limit_date=datetime(2024, 12, 12), attendance_date=datetime(2024, 12, 12, 9))
+        ])
+        self.session.commit()
+
+        productivity = self.attendance_repository.get_productivity_paginated(1, 20, {'hub_id': 1, 'date_to': '2024-12-13 23:59:59'})
+
+        assert productivity['items'] == [
+            {'green_angel_id': 1, 'total_attendances': 2, 'working_days': 5, 'attendances_per_day': 0.4},
+            {'green_angel_id': 2, 'total_attendances': 1, 'working_days': 2, 'attendances_per_day': 0.5}
+        ]
+
+    def test_get_sla_timeseries_from_rollup(self):
+        """Test if the SLA time series buckets the rollup by week in one query."""
+        timeseries = self.attendance_repository.get_sla_timeseries({'hub_id': 1}, 'week')
+
+        assert len(self.statements) == 1
+        assert 'sla_rollup' in self.statements[0]
+        assert [(item['bucket'], item['total'], item['late']) for item in timeseries['items']] == [('2024-12-09', 3, 1)]
+
+    def test_get_productivity_timeseries_clips_buckets_to_range(self):
+        """Test if each bucket counts only the working days inside the requested range."""
+        weekly = self.attendance_repository.get_productivity_timeseries({'date_to': '2024-12-11'}, 'week')
+        daily = self.attendance_repository.get_productivity_timeseries({'date_to': '2024-12-11'}, 'day')
+
+        assert weekly['items'] == [
+            {'bucket': '2024-12-09', 'total_attendances': 2, 'green_angels': 1, 'working_days': 3, 'attendances_per_day': 0.67}
+        ]
+        assert [(item['bucket'], item['working_days']) for item in daily['items']] == [('2024-12-09', 1), ('2024-12-11', 1)]
+
+    def test_get_sla_by_hubs_materialized_reads_view(self):
+        """Test if materialized freshness reads the hub view and reports its refresh time."""
+        Base.metadata.create_all(bind=self.session.get_bind(), tables=[MetricViewRefresh.__table__])
+        views.create_all(bind=self.session.get_bind(), tables=[SlaByHubView])
+        self.session.execute(SlaByHubView.insert().values(hub_id=1, total=10, on_time=7, late=2, not_attended=1))
+        self.session.add(MetricViewRefresh(name='mv_sla_by_hub', refreshed_at=datetime(2024, 12, 12, 6)))
+        self.session.commit()
+
+        materialized = self.attendance_repository.get_sla_paginated_by_hubs(1, 20, {'freshness': 'materialized'})
+        dated = self.attendance_repository.get_sla_paginated_by_hubs(1, 20, {'freshness': 'materialized', 'date_from': '2024-12-10'})
+
+        assert (materialized['freshness'], materialized['refreshed_at']) == ('materialized', datetime(2024, 12, 12, 6))
+        assert materialized['items'][0]['total'] == 10
+        assert (dated['freshness'], dated['refreshed_at'], dated['items'][0]['total']) == ('live', None, 3)
+
+    def test_get_productivity_materialized_reads_daily_view(self):
+        """Test if materialized productivity sums the daily view over whole days."""
+        Base.metadata.create_all(bind=self.session.get_bind(), tables=[MetricViewRefresh.__table__])
+        views.create_all(bind=self.session.get_bind(), tables=[ProductivityDailyView])
+        self.session.execute(ProductivityDailyView.insert().values([
+            {'green_angel_id': 1, 'hub_id': 1, 'day': datetime(2024, 12, 9).date(), 'attendances': 3},
+            {'green_angel_id': 1, 'hub_id': 1, 'day': datetime(2024, 12, 13).date(), 'attendances': 2}
+        ]))
+        self.session.commit()
+
+        productivity = self.attendance_repository.get_productivity_paginated(1, 20, {
+            'freshness': 'materialized', 'date_from': '2024-12-09 12:00:00', 'date_to': '2024-12-13 08:00:00'
+        })
+
+        assert productivity['freshness'] == 'materialized'
+        assert productivity['items'] == [
+            {'green_angel_id': 1, 'total_attendances': 5, 'working_days': 5, 'attendances_per_day': 1.0}
+        ]
+
+    def test_get_sla_by_hubs_orders_by_aggregates(self):
+        """Test if hubs are ranked by computed SLA columns and top_n returns a single page."""
+        self.session.add_all([Hub(id=2, name="other hub"), Hub(id=3, name="third hub")])
+        self.session.add_all([
+            SlaRollup(green_angel_id=1, hub_id=2, day=datetime(2024, 12, 10).date(), total=4, on_time=4, late=0, pending=0),
+            SlaRollup(green_angel_id=1, hub_id=3, day=datetime(2024, 12, 10).date(), total=3, on_time=2, late=1, pending=0)
+        ])
+        self.session.commit()
+        self.statements.clear()
+
+        worst = self.attendance_repository.get_sla_paginated_by_hubs(1, 20, {}, 'on_time_percentage', 'asc', top_n=2)
+        by_total = self.attendance_repository.get_sla_paginated_by_hubs(1, 20, {}, 'total', 'desc')
+
+        assert [item['hub_id'] for item in worst['items']] == [1, 3]
+        assert (worst['page'], worst['per_page'], worst['total_pages']) == (1, 2, 1)
+        assert 'count(*) OVER' not in self.statements[0]
+        assert [item['hub_id'] for item in by_total['items']] == [2, 1, 3]
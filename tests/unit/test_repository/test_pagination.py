@@ -0,0 +1,80 @@
+import pytest
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, sessionmaker
+
+from src.domain.entities.attendance import Attendance
+from src.domain.entities.user import User
+from src.domain.exception.domain_exception import DomainException
+from src.domain.exception.error_code import ErrorCode
+from src.infra.database.database import Base
+from src.infra.repository.pagination import paginate, encode_cursor, decode_cursor, apply_keyset
+
+
+class TestPagination:
+
+    def test_cursor_round_trip_with_datetime(self):
+        """Test if a datetime cursor value is restored with its type."""
+        value = datetime(2024, 12, 13, 22, 40, 7)
+        cursor = encode_cursor('limit_date', 'asc', value, 42)
+
+        assert decode_cursor(cursor, 'limit_date', 'asc') == (value, 42)
+
+    def test_cursor_round_trip_with_null(self):
+        """Test if a NULL cursor value is preserved."""
+        cursor = encode_cursor('attendance_date', 'desc', None, 7)
+
+        assert decode_cursor(cursor, 'attendance_date', 'desc') == (None, 7)
+
+    def test_decode_cursor_ordering_mismatch(self):
+        """Test if a cursor issued for another ordering is rejected."""
+        cursor = encode_cursor('limit_date', 'asc', None, 1)
+
+        with pytest.raises(DomainException) as excinfo:
+            decode_cursor(cursor, 'limit_date', 'desc')
+
+        assert excinfo.value.error_code == ErrorCode.INVALID_CURSOR
+
+    def test_decode_cursor_garbage(self):
+        """Test if a malformed cursor is rejected."""
+        with pytest.raises(DomainException) as excinfo:
+            decode_cursor('not-a-cursor', 'id', 'asc')
+
+        assert excinfo.value.error_code == ErrorCode.INVALID_CURSOR
+
+    def test_apply_keyset_uses_row_comparison(self):
+        """Test if the seek predicate is a (column, id) row-value comparison."""
+        query = apply_keyset(Query(Attendance), Attendance.limit_date, Attendance.id, 'asc', datetime(2024, 1, 1), 10)
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+        assert '(attendances.limit_date, attendances.id) > (' in sql
+        assert 'OFFSET' not in sql
+
+    def test_paginate_counts_filtered_query(self):
+        """Test if the total reflects the filters instead of the whole table."""
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(bind=engine, tables=[User.__table__])
+        session = sessionmaker(bind=engine)()
+        session.add_all([
+            User(name=f"user_{i}", email=f"user_{i}@email.com", hashed_password="hash", is_active=i % 2 == 0)
+            for i in range(25)
+        ])
+        session.commit()
+
+        query = session.query(User).filter(User.is_active == True).order_by(User.id)
+        users, total = paginate(query, 2, 5)
+
+        assert total == 13
+        assert [user.id for user in users] == [11, 13, 15, 17, 19]
+        assert paginate(query, 10, 5) == ([], 13)
+
+    def test_paginate_unknown_count_mode(self):
+        """Test if an unknown count mode raises INVALID_COUNT_MODE."""
+        session = sessionmaker(bind=create_engine('sqlite://'))()
+
+        with pytest.raises(DomainException) as excinfo:
+            paginate(session.query(User), 1, 5, 'approximate')
+
+        assert excinfo.value.error_code == ErrorCode.INVALID_COUNT_MODE
@@ -0,0 +1,51 @@
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.hub import Hub
+from src.domain.exception.domain_exception import DomainException
+from src.domain.exception.error_code import ErrorCode
+from src.infra.database.database import Base
+from src.infra.repository.search import has_trigram, name_filter, rank_by_name
+
+
+class TestSearch:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(bind=engine, tables=[Hub.__table__])
+        self.session = sessionmaker(bind=engine)()
+        self.session.add_all([
+            Hub(id=1, name="Polo Campinas"),
+            Hub(id=2, name="Campinas"),
+            Hub(id=3, name="Polo 100% Sul"),
+            Hub(id=4, name="Polo_Norte")
+        ])
+        self.session.commit()
+
+    def test_has_trigram_without_postgres(self):
+        """Test if databases other than Postgres report no trigram support."""
+        assert not has_trigram(self.session)
+
+    def test_name_filter_escapes_wildcards(self):
+        """Test if LIKE wildcards typed by the user are matched literally."""
+        query = self.session.query(Hub.id)
+
+        assert [row.id for row in query.filter(name_filter(self.session, Hub.name, "100%"))] == [3]
+        assert [row.id for row in query.filter(name_filter(self.session, Hub.name, "o_N"))] == [4]
+
+    def test_name_filter_unknown_mode(self):
+        """Test if an unknown search mode raises INVALID_SEARCH_MODE."""
+        with pytest.raises(DomainException) as excinfo:
+            name_filter(self.session, Hub.name, "Campinas", "fuzzy")
+
+        assert excinfo.value.error_code == ErrorCode.INVALID_SEARCH_MODE
+
+    def test_similarity_mode_falls_back_to_prefix_ranking(self):
+        """Test if similarity mode without pg_trgm ranks prefix matches first."""
+        query = self.session.query(Hub.id).filter(name_filter(self.session, Hub.name, "campinas", 'similarity'))
+        query = rank_by_name(self.session, query, Hub.name, "campinas")
+
+        assert [row.id for row in query] == [2, 1]
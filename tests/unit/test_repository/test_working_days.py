@@ -0,0 +1,38 @@
+from datetime import date, datetime, timedelta
+
+from src.infra.repository.working_days import calendar_for
+
+
+class TestWorkingDays:
+
+    def test_count_matches_day_by_day_loop(self):
+        """Test if prefix sum counts agree with checking every day of a multi-year range."""
+        calendar = calendar_for()
+        start, end = date(2022, 11, 17), date(2024, 2, 3)
+        expected = sum(1 for n in range((end - start).days + 1) if calendar.calendar.is_working_day(start + timedelta(n)))
+
+        assert calendar.count(start, end) == expected
+        assert calendar.count(datetime(2024, 12, 9, 18), datetime(2024, 12, 13)) == 5
+        assert calendar.count(end, start) == 0
+
+    def test_state_calendar_adds_regional_holidays(self):
+        """Test if a hub's state calendar skips holidays that are not national."""
+        # 2024-07-09 is a Tuesday and a holiday only in São Paulo
+        week = (date(2024, 7, 8), date(2024, 7, 12))
+
+        assert calendar_for().count(*week) == 5
+        assert calendar_for('sp').count(*week) == 4
+
+    def test_count_many_matches_count(self):
+        """Test if the vectorized count agrees with the prefix sum count for every pair."""
+        calendar = calendar_for('RJ')
+        starts = [date(2020, 1, 1) + timedelta(days=n * 37) for n in range(60)]
+        ends = [start + timedelta(days=n * 29) for n, start in enumerate(starts)]
+
+        assert calendar.count_many(starts, ends).tolist() == [calendar.count(start, end) for start, end in zip(starts, ends)]
+        assert calendar.count_many([datetime(2024, 1, 10, 8)], date(2024, 1, 1)).tolist() == [0]
+
+    def test_calendars_are_shared(self):
+        """Test if calendars are cached per state and unknown states fall back to the national one."""
+        assert calendar_for('SP') is calendar_for(' sp ')
+        assert calendar_for('XX') is calendar_for(None)
@@ -0,0 +1,72 @@
+import io
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.application.service.attendance_import import AttendanceImportService
+from src.domain.entities.import_job import ImportJob
+from src.domain.exception.domain_exception import DomainException
+from src.domain.exception.error_code import ErrorCode
+
+
+class TestAttendanceImportService:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.import_job_repository_mock = MagicMock()
+        self.import_runner_mock = MagicMock()
+        self.attendance_import_service = AttendanceImportService(
+            import_job_repository=self.import_job_repository_mock,
+            import_runner=self.import_runner_mock
+        )
+        self.import_runner_mock.spool.return_value = ('/tmp/upload.csv', 'a' * 64, 1024)
+
+    def test_start_import_queues_spooled_file(self):
+        """Test if an upload is saved as a queued job pointing at the spooled file."""
+        job = self.attendance_import_service.start_import(io.BytesIO(b'csv'), 'drop.csv')
+
+        saved = self.import_job_repository_mock.save.call_args.args[0]
+        assert (saved.file_name, saved.file_hash, saved.bytes_received, saved.status) == ('drop.csv', 'a' * 64, 1024, 'queued')
+        assert saved.file_path == '/tmp/upload.csv'
+        assert job['id'] == saved.id
+        assert job['rows_processed'] == 0
+
+    def test_find_import_reports_progress(self):
+        """Test if a started job reports the committed batches and throughput."""
+        self.import_job_repository_mock.find_by_id.return_value = ImportJob(
+            id='job', file_hash='a' * 64, bytes_received=1024, status='completed',
+            started_at=datetime(2024, 12, 10, 18, 0, 0), finished_at=datetime(2024, 12, 10, 18, 0, 10)
+        )
+        self.import_job_repository_mock.get_progress.return_value = {'rows': 1000, 'inserted': 990, 'rejected': 10}
+
+        job = self.attendance_import_service.find_import('job')
+
+        self.import_job_repository_mock.get_progress.assert_called_once_with('job')
+        assert (job['rows_processed'], job['rows_inserted'], job['rows_rejected']) == (1000, 990, 10)
+        assert job['rows_per_second'] == 100
+
+    def test_find_import_not_found(self):
+        """Test if an unknown job raises IMPORT_JOB_NOT_FOUND."""
+        self.import_job_repository_mock.find_by_id.return_value = None
+
+        with pytest.raises(DomainException) as exc:
+            self.attendance_import_service.find_import('missing')
+
+        assert exc.value.error_code == ErrorCode.IMPORT_JOB_NOT_FOUND
+
+    def test_find_import_rejects_returns_path(self, tmp_path):
+        """Test if a job with a rejects file returns its path."""
+        rejects = tmp_path / 'upload_rejects.csv'
+        rejects.write_text('row,reason')
+        self.import_job_repository_mock.find_by_id.return_value = ImportJob(id='job', status='partial', rejects_path=str(rejects))
+
+        assert self.attendance_import_service.find_import_rejects('job') == str(rejects)
+
+    def test_find_import_rejects_not_found(self):
+        """Test if a job without a rejects file raises IMPORT_REJECTS_NOT_FOUND."""
+        self.import_job_repository_mock.find_by_id.return_value = ImportJob(id='job', status='completed')
+
+        with pytest.raises(DomainException) as exc:
+            self.attendance_import_service.find_import_rejects('job')
+
+        assert exc.value.error_code == ErrorCode.IMPORT_REJECTS_NOT_FOUND
@@ -0,0 +1,129 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, call
+
+from src.application.service.attendance import AttendanceService
+from src.domain.entities.attendance import Attendance
+from src.interface.web.schemas.attendance import AttendanceCreateSchema, AttendanceUpdateSchema, AttendanceBulkUpdateItemSchema
+
+
+class TestAttendanceService:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.attendance_repository_mock = MagicMock()
+        self.green_angel_repository_mock = MagicMock()
+        self.hub_repository_mock = MagicMock()
+        self.client_repository_mock = MagicMock()
+        self.sla_rollup_repository_mock = MagicMock()
+        self.attendance_service = AttendanceService(
+            attendance_repository=self.attendance_repository_mock,
+            green_angel_repository=self.green_angel_repository_mock,
+            hub_repository=self.hub_repository_mock,
+            client_repository=self.client_repository_mock,
+            sla_rollup_repository=self.sla_rollup_repository_mock
+        )
+
+        self.limit_date = datetime(2024, 12, 10, 18, 0, 0)
+        self.default_attendance = Attendance(
+            id=1,
+            client_id=1,
+            green_angel_id=2,
+            hub_id=3,
+            limit_date=self.limit_date,
+            attendance_date=None,
+            is_active=True
+        )
+        self.attendance_repository_mock.find_by_id.return_value = self.default_attendance
+
+    def test_create_attendance_increments_sla_rollup(self):
+        """Test if a new attendance is added to its SLA rollup bucket."""
+        attendance_create = AttendanceCreateSchema(
+            client_id=1,
+            green_angel_id=2,
+            hub_id=3,
+            limit_date=self.limit_date,
+            is_active=True
+        )
+        self.attendance_repository_mock.save.side_effect = lambda attendance: setattr(attendance, 'id', 1)
+
+        self.attendance_service.create_attendance(attendance_create)
+
+        self.sla_rollup_repository_mock.apply.assert_called_once_with(2, 3, self.limit_date, None, 1)
+
+    def test_update_attendance_moves_sla_rollup_bucket(self):
+        """Test if an update locks the row, removes the old bucket and adds the new one."""
+        attendance_date = datetime(2024, 12, 9, 10, 0, 0)
+        attendance_update = AttendanceUpdateSchema(hub_id=4, attendance_date=attendance_date)
+
+        self.attendance_service.update_attendance(1, attendance_update)
+
+        self.attendance_repository_mock.find_by_id.assert_called_once_with(1, for_update=True)
+
+        assert self.sla_rollup_repository_mock.apply.call_args_list == [
+            call(2, 3, self.limit_date, None, -1),
+            call(2, 4, self.limit_date, attendance_date, 1)
+        ]
+
+    def test_delete_attendance_decrements_sla_rollup(self):
+        """Test if a soft delete locks the row and removes the attendance from the SLA rollup."""
+        self.attendance_service.delete_attendance(1)
+
+        self.attendance_repository_mock.find_by_id.assert_called_once_with(1, for_update=True)
+        self.sla_rollup_repository_mock.apply.assert_called_once_with(2, 3, self.limit_date, None, -1)
+        assert self.default_attendance.is_active is False
+
+    def test_create_attendances_skips_missing_references(self):
+        """Test if bulk create validates each dimension once and inserts only valid items."""
+        self.green_angel_repository_mock.find_existing_ids.return_value = {2}
+        self.hub_repository_mock.find_existing_ids.return_value = {3}
+        self.client_repository_mock.find_existing_ids.return_value = {1}
+        self.attendance_repository_mock.bulk_insert.return_value = [10, 11]
+        items = [
+            AttendanceCreateSchema(client_id=1, green_angel_id=2, hub_id=3, limit_date=self.limit_date),
+            AttendanceCreateSchema(client_id=1, green_angel_id=2, hub_id=9, limit_date=self.limit_date),
+            AttendanceCreateSchema(client_id=1, green_angel_id=2, hub_id=3, limit_date=self.limit_date, is_active=False)
+        ]
+
+        result = self.attendance_service.create_attendances(items)
+
+        self.hub_repository_mock.find_existing_ids.assert_called_once_with({3, 9})
+        assert len(self.attendance_repository_mock.bulk_insert.call_args.args[0]) == 2
+        self.sla_rollup_repository_mock.apply_many.assert_called_once_with([(2, 3, self.limit_date, None, 1)])
+        assert (result['succeeded'], result['failed']) == (2, 1)
+        assert [(item['id'], item['status'], item['error']) for item in result['items']] == [
+            (10, 'created', None), (None, 'error', 'HUB_NOT_FOUND'), (11, 'created', None)
+        ]
+
+    def test_update_attendances_writes_final_state_once(self):
+        """Test if repeated bulk updates of one attendance are merged into a single row."""
+        self.attendance_repository_mock.find_by_ids.return_value = [self.default_attendance]
+        self.hub_repository_mock.find_existing_ids.return_value = {4, 5}
+        items = [AttendanceBulkUpdateItemSchema(id=1, hub_id=4), AttendanceBulkUpdateItemSchema(id=1, hub_id=5), AttendanceBulkUpdateItemSchema(id=7, hub_id=5)]
+
+        result = self.attendance_service.update_attendances(items)
+
+        self.attendance_repository_mock.find_by_ids.assert_called_once_with({1, 7}, for_update=True)
+        self.attendance_repository_mock.bulk_update.assert_called_once_with([
+            {'id': 1, 'green_angel_id': 2, 'hub_id': 5, 'limit_date': self.limit_date, 'attendance_date': None}
+        ])
+        assert self.sla_rollup_repository_mock.apply_many.call_args.args[0] == [
+            (2, 3, self.limit_date, None, -1), (2, 4, self.limit_date, None, 1),
+            (2, 4, self.limit_date, None, -1), (2, 5, self.limit_date, None, 1)
+        ]
+        assert self.default_attendance.hub_id == 3
+        assert [item['error'] for item in result['items']] == [None, None, 'ATTENDANCE_NOT_FOUND']
+
+    def test_delete_attendances_reports_already_deleted(self):
+        """Test if bulk delete deactivates active attendances and reports the others."""
+        deleted_attendance = Attendance(id=2, client_id=1, green_angel_id=2, hub_id=3, limit_date=self.limit_date, is_active=False)
+        self.attendance_repository_mock.find_by_ids.return_value = [self.default_attendance, deleted_attendance]
+
+        result = self.attendance_service.delete_attendances([1, 2, 3, 1])
+
+        self.attendance_repository_mock.find_by_ids.assert_called_once_with({1, 2, 3}, for_update=True)
+        self.attendance_repository_mock.bulk_deactivate.assert_called_once_with({1})
+        self.sla_rollup_repository_mock.apply_many.assert_called_once_with([(2, 3, self.limit_date, None, -1)])
+        assert [item['error'] for item in result['items']] == [
+            None, 'ATTENDANCE_ALREADY_DELETED', 'ATTENDANCE_NOT_FOUND', 'ATTENDANCE_ALREADY_DELETED'
+        ]